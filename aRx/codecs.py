@@ -0,0 +1,183 @@
+"""Codecs
+
+Serialization and framing of the messages exchanged by :class:`~.observers.RemoteObserver` and
+:class:`~.observables.RemoteObservable`.
+
+Messages are sent in batches, each batch being a list of ``[kind, payload]`` pairs serialized by a
+codec into a frame, which is prefixed by its length.
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import json
+import pickle
+import struct
+import typing as T
+from abc import ABCMeta, abstractmethod
+from asyncio import IncompleteReadError
+
+# Project
+from .errors import RemoteError
+
+if T.TYPE_CHECKING:
+    # Internal
+    from asyncio import StreamReader, StreamWriter
+
+# Message kinds
+SEND = 0
+THROW = 1
+CLOSE = 2
+CREDIT = 3
+
+_LENGTH = struct.Struct("!I")
+
+
+class Codec(metaclass=ABCMeta):
+    """Serialization of batches of messages.
+
+    Exceptions are serialized as their type name and message, and deserialized as
+    :class:`~.errors.RemoteError`, unless the codec can serialize them directly.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def encode(self, obj: T.Any) -> bytes:
+        """Serialize a batch of messages."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, data: bytes) -> T.Any:
+        """Deserialize a batch of messages."""
+        raise NotImplementedError
+
+    def encode_exception(self, exc: Exception) -> T.Any:
+        """Convert an exception into a serializable payload."""
+        return [f"{type(exc).__module__}.{type(exc).__qualname__}", str(exc)]
+
+    def decode_exception(self, payload: T.Any) -> Exception:
+        """Convert a payload created by :meth:`encode_exception` back into an exception."""
+        return RemoteError(*payload)
+
+
+class PickleCodec(Codec):
+    """Codec through pickle, which keeps exceptions and any picklable value as they are.
+
+    .. Warning::
+
+        Unpickling data can execute arbitrary code, only use it between trusted peers.
+    """
+
+    __slots__ = ("_protocol",)
+
+    def __init__(self, protocol: int = pickle.HIGHEST_PROTOCOL) -> None:
+        """PickleCodec constructor.
+
+        Arguments:
+            protocol: Pickle protocol used for serialization.
+
+        """
+        self._protocol = protocol
+
+    def encode(self, obj: T.Any) -> bytes:
+        return pickle.dumps(obj, protocol=self._protocol)
+
+    def decode(self, data: bytes) -> T.Any:
+        return pickle.loads(data)
+
+    def encode_exception(self, exc: Exception) -> T.Any:
+        try:
+            pickle.dumps(exc, protocol=self._protocol)
+        except Exception:
+            return super().encode_exception(exc)
+
+        return exc
+
+    def decode_exception(self, payload: T.Any) -> Exception:
+        return payload if isinstance(payload, Exception) else super().decode_exception(payload)
+
+
+class JSONCodec(Codec):
+    """Codec through JSON, for values composed of JSON types."""
+
+    __slots__ = ()
+
+    def encode(self, obj: T.Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def decode(self, data: bytes) -> T.Any:
+        return json.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """Codec through MessagePack, for values composed of MessagePack types.
+
+    .. Note::
+
+        Requires msgpack to be installed.
+    """
+
+    __slots__ = ("_msgpack",)
+
+    def __init__(self) -> None:
+        """MsgpackCodec constructor."""
+        try:
+            # External
+            import msgpack
+        except ImportError as exc:  # pragma: no cover
+            raise ImportError(
+                f"{type(self).__qualname__} requires msgpack to be installed"
+            ) from exc
+
+        self._msgpack = msgpack
+
+    def encode(self, obj: T.Any) -> bytes:
+        return T.cast(bytes, self._msgpack.packb(obj, use_bin_type=True))
+
+    def decode(self, data: bytes) -> T.Any:
+        return self._msgpack.unpackb(data, raw=False)
+
+
+def write_frame(writer: "StreamWriter", codec: Codec, messages: T.List[T.List[T.Any]]) -> None:
+    """Serialize a batch of messages and write it, as a frame, into the writer buffer.
+
+    Arguments:
+        writer: Stream the frame is written to.
+        codec: Codec used to serialize messages.
+        messages: Batch of messages.
+
+    """
+    data = codec.encode(messages)
+    writer.writelines((_LENGTH.pack(len(data)), data))
+
+
+async def read_frame(reader: "StreamReader", codec: Codec) -> T.Optional[T.List[T.List[T.Any]]]:
+    """Read a frame and deserialize its batch of messages.
+
+    Arguments:
+        reader: Stream the frame is read from.
+        codec: Codec used to deserialize messages.
+
+    Raises:
+        IncompleteReadError: When the stream ends in the middle of a frame.
+
+    Returns:
+        Batch of messages, or None when the stream ended.
+
+    """
+    try:
+        header = await reader.readexactly(_LENGTH.size)
+    except IncompleteReadError as exc:
+        if exc.partial:
+            raise
+
+        return None
+
+    (size,) = _LENGTH.unpack(header)
+    return T.cast(T.List[T.List[T.Any]], codec.decode(await reader.readexactly(size)))
+
+
+__all__ = ("Codec", "JSONCodec", "PickleCodec", "MsgpackCodec", "read_frame", "write_frame")
@@ -0,0 +1,109 @@
+"""Credits
+
+Credit based demand, through which observers limit how much data is sent to them.
+
+An observer implements the demand protocol by exposing a :class:`Credits` instance as its
+``credits`` attribute. Each value sent to it must first acquire one credit, and the observer grants
+new credits as it is ready for more data. Observers without ``credits`` receive data as soon as it
+is available, as usual.
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import Future, get_running_loop
+
+
+class Credits:
+    """Counter of how many values an observer is ready to receive."""
+
+    __slots__ = ("_closed", "_waiter", "_available")
+
+    def __init__(self, initial: int = 0) -> None:
+        """Credits constructor.
+
+        Arguments:
+            initial: Credits initially available.
+
+        """
+        assert initial >= 0
+
+        self._closed = False
+        self._waiter: T.Optional["Future[None]"] = None
+        self._available = initial
+
+    @property
+    def closed(self) -> bool:
+        """Whether credits are closed, after which acquiring never waits."""
+        return self._closed
+
+    @property
+    def available(self) -> int:
+        """Amount of credits available."""
+        return self._available
+
+    def _wakeup(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+        self._waiter = None
+
+    def grant(self, amount: int = 1) -> None:
+        """Make more credits available, waking up anyone waiting for them.
+
+        Arguments:
+            amount: Amount of credits granted.
+
+        """
+        assert amount > 0
+
+        self._available += amount
+        self._wakeup()
+
+    def try_acquire(self) -> bool:
+        """Acquire a credit without waiting.
+
+        Returns:
+            Whether a credit was acquired, always true after close.
+
+        """
+        if self._closed:
+            return True
+
+        if self._available > 0:
+            self._available -= 1
+            return True
+
+        return False
+
+    async def acquire(self) -> None:
+        """Acquire a credit, waiting for it to be granted if none is available."""
+        while not self.try_acquire():
+            if self._waiter is None:
+                self._waiter = get_running_loop().create_future()
+
+            await self._waiter
+
+    def close(self) -> None:
+        """Stop limiting demand, so data reaches the observer and finds out it is closed."""
+        self._closed = True
+        self._wakeup()
+
+
+def get_credits(observer: T.Any) -> T.Optional[Credits]:
+    """Retrieve credits of an observer that implements the demand protocol.
+
+    Arguments:
+        observer: Any observer.
+
+    Returns:
+        Observer credits, or None when it doesn't limit its demand.
+
+    """
+    return getattr(observer, "credits", None)
+
+
+__all__ = ("Credits", "get_credits")
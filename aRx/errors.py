@@ -52,15 +52,61 @@ class ObserverClosedError(ObserverError):
     pass
 
 
+class LateValueError(ARxError):
+    """aRx error used by :class:`~aRx.operators.reorder.Reorder`.
+
+    Signalize a value that arrived after its event time was already surpassed by the watermark.
+
+    """
+
+    def __init__(self, value: T.Any, timestamp: float, watermark: float) -> None:
+        """LateValueError constructor.
+
+        Arguments:
+            value: The late value.
+            timestamp: Value event time.
+            watermark: Watermark when value arrived.
+
+        """
+        super().__init__(f"Value with timestamp {timestamp} arrived after watermark {watermark}")
+
+        self.value = value
+        self.timestamp = timestamp
+        self.watermark = watermark
+
+
 class SingleStreamError(ARxError):
     """aRx error exclusive to :class:`~aRx.streams.single_stream.SingleStream`."""
 
     pass
 
 
+class RemoteError(ARxError):
+    """aRx error used by :class:`~aRx.observables.remote_observable.RemoteObservable`.
+
+    Represent an exception thrown into the remote observer that its codec couldn't serialize.
+
+    """
+
+    def __init__(self, type_name: str, message: str) -> None:
+        """RemoteError constructor.
+
+        Arguments:
+            type_name: Qualified name of the remote exception type.
+            message: Remote exception message.
+
+        """
+        super().__init__(f"{type_name}: {message}")
+
+        self.message = message
+        self.type_name = type_name
+
+
 __all__ = (
     "ARxError",
+    "RemoteError",
     "ObserverError",
+    "LateValueError",
     "SingleStreamError",
     "ObserverClosedError",
     "ConsumerClosedError",
@@ -11,6 +11,7 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # Project
 from .observable import Observable
 from .from_iterable import FromIterable
+from .remote_observable import RemoteObservable
 from .from_async_iterable import FromAsyncIterable
 
-__all__ = ("FromAsyncIterable", "FromIterable", "Observable")
+__all__ = ("FromAsyncIterable", "RemoteObservable", "FromIterable", "Observable")
@@ -0,0 +1,348 @@
+"""Combinators
+
+Observables that combine the data of multiple sources.
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from heapq import heappop, heappush
+from asyncio import get_running_loop
+from collections import deque
+
+# Project
+from .from_sources import Inlet, FromSources
+
+if T.TYPE_CHECKING:
+    # Project
+    from ...namespace import Namespace
+    from ...protocols import ObserverProtocol, ObservableProtocol
+
+
+# Generic Types
+K = T.TypeVar("K")
+_NOT_PROVIDED: T.Final = object()
+
+
+class Merge(FromSources[K]):
+    """Emit the data of all sources as it arrives.
+
+    Sources with buffered data are served in round-robin, one value each, so a fast source can't
+    starve the others. At most ``max_concurrent`` sources are observed at the same time, the
+    remaining ones are observed, in order, as the previous complete.
+    """
+
+    __slots__ = ("_max_concurrent",)
+
+    def __init__(
+        self,
+        *sources: "ObservableProtocol[K]",
+        max_concurrent: T.Optional[int] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(*sources, **kwargs)
+
+        assert max_concurrent is None or max_concurrent > 0
+
+        self._max_concurrent = max_concurrent
+
+    async def _worker(self, observer: "ObserverProtocol[K]") -> None:
+        pending = deque(self._sources)
+        active: T.Deque[Inlet[K]] = deque()
+        max_concurrent = self._max_concurrent or len(pending)
+
+        while True:
+            while pending and len(active) < max_concurrent:
+                active.append(await self._connect(pending.popleft()))
+
+            if not active:
+                break
+
+            progressed = False
+            for _ in range(len(active)):
+                inlet = active.popleft()
+
+                await self._forward_errors(observer, inlet)
+
+                if inlet.ready:
+                    if observer.closed:
+                        return
+
+                    progressed = True
+                    await observer.asend(*inlet.pop())
+
+                if inlet.done:
+                    progressed = True
+                    await self._disconnect(inlet)
+                else:
+                    active.append(inlet)
+
+            if not progressed:
+                await self._wait()
+
+
+class Concat(FromSources[K]):
+    """Emit the data of each source, in order, one source after the other.
+
+    While a source is being emitted, the next ``prefetch`` sources are already observed, buffering
+    their data, so there is no gap when switching between them.
+    """
+
+    __slots__ = ("_prefetch",)
+
+    def __init__(
+        self, *sources: "ObservableProtocol[K]", prefetch: int = 1, **kwargs: T.Any
+    ) -> None:
+        super().__init__(*sources, **kwargs)
+
+        assert prefetch >= 0
+
+        self._prefetch = prefetch
+
+    async def _worker(self, observer: "ObserverProtocol[K]") -> None:
+        pending = deque(self._sources)
+        window: T.Deque[Inlet[K]] = deque()
+
+        while pending or window:
+            while pending and len(window) <= self._prefetch:
+                window.append(await self._connect(pending.popleft()))
+
+            current = window[0]
+
+            await self._forward_errors(observer, current)
+
+            if current.ready:
+                if observer.closed:
+                    return
+
+                await observer.asend(*current.pop())
+            elif current.done:
+                window.popleft()
+                await self._disconnect(current)
+            else:
+                await self._wait()
+
+
+class MergeSorted(FromSources[K]):
+    """Emit the data of sources, which are individually sorted, in global sorted order.
+
+    Keeps a heap with the head value of each source, so a value is only emitted once every source
+    that didn't complete has a value buffered.
+    """
+
+    __slots__ = ("_key",)
+
+    def __init__(
+        self,
+        *sources: "ObservableProtocol[K]",
+        key: T.Optional[T.Callable[[K], T.Any]] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(*sources, **kwargs)
+
+        self._key = key
+
+    async def _worker(self, observer: "ObserverProtocol[K]") -> None:
+        key = self._key
+        heap: T.List[T.Tuple[T.Any, int, K, "Namespace"]] = []
+        inlets: T.List[Inlet[K]] = [await self._connect(source) for source in self._sources]
+        # Inlets whose head value isn't in the heap
+        waiting = set(range(len(inlets)))
+
+        while True:
+            for index in tuple(waiting):
+                inlet = inlets[index]
+
+                await self._forward_errors(observer, inlet)
+
+                if inlet.ready:
+                    value, namespace = inlet.pop()
+                    waiting.remove(index)
+                    # Heap entries never compare values, as there is at most one entry per inlet
+                    heappush(heap, (value if key is None else key(value), index, value, namespace))
+                elif inlet.done:
+                    waiting.remove(index)
+
+            if waiting:
+                await self._wait()
+                continue
+
+            if not heap or observer.closed:
+                return
+
+            _, index, value, namespace = heappop(heap)
+            waiting.add(index)
+
+            await observer.asend(value, namespace)
+
+
+class Zip(FromSources[T.Tuple[T.Any, ...]]):
+    """Emit tuples with the n-th value of each source.
+
+    Completes as soon as any source completes without buffered data.
+    """
+
+    __slots__ = ()
+
+    async def _worker(self, observer: "ObserverProtocol[T.Tuple[T.Any, ...]]") -> None:
+        inlets = [await self._connect(source) for source in self._sources]
+
+        while inlets:
+            for inlet in inlets:
+                await self._forward_errors(observer, inlet)
+
+            if all(inlet.ready for inlet in inlets):
+                if observer.closed:
+                    return
+
+                heads = tuple(inlet.pop() for inlet in inlets)
+                await observer.asend(tuple(value for value, _ in heads), heads[-1][1])
+            elif any(inlet.done for inlet in inlets):
+                return
+            else:
+                await self._wait()
+
+
+class Join(FromSources[T.Tuple[T.Any, T.Any]]):
+    """Emit a ``(left, right)`` pair for every two values, one of each source, with the same key that
+    arrived within ``window`` seconds of each other.
+
+    Each side keeps a hash table of its values by key, for O(1) matching, and a time ordered queue
+    used to evict values that fall out of the window. Values are timed by arrival, or by
+    ``timestamp`` when given, which must be non decreasing for each source. With ``timestamp``
+    the sources may be out of order relative to each other, so a side only evicts values that are
+    out of the window of the latest timestamp seen on the other side.
+    """
+
+    __slots__ = ("_keys", "_window", "_timestamp")
+
+    def __init__(
+        self,
+        left: "ObservableProtocol[T.Any]",
+        right: "ObservableProtocol[T.Any]",
+        left_key: T.Callable[[T.Any], T.Hashable],
+        right_key: T.Callable[[T.Any], T.Hashable],
+        *,
+        window: float,
+        timestamp: T.Optional[T.Callable[[T.Any], float]] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(left, right, **kwargs)
+
+        assert window >= 0
+
+        self._keys = (left_key, right_key)
+        self._window = window
+        self._timestamp = timestamp
+
+    async def _worker(self, observer: "ObserverProtocol[T.Tuple[T.Any, T.Any]]") -> None:
+        loop = get_running_loop()
+        inlets = [await self._connect(source) for source in self._sources]
+        tables: T.Tuple[T.Dict[T.Hashable, T.Deque[T.Tuple[float, T.Any]]], ...] = ({}, {})
+        queues: T.Tuple[T.Deque[T.Tuple[float, T.Hashable]], ...] = (deque(), deque())
+        # Latest time of each side, future values of a side are never older than it
+        latest = [float("-inf"), float("-inf")]
+
+        while not all(inlet.done for inlet in inlets):
+            progressed = False
+            for side, inlet in enumerate(inlets):
+                await self._forward_errors(observer, inlet)
+
+                if not inlet.ready:
+                    continue
+
+                if observer.closed:
+                    return
+
+                progressed = True
+                value, namespace = inlet.pop()
+
+                if self._timestamp is None:
+                    now = latest[0] = latest[1] = loop.time()
+                else:
+                    now = self._timestamp(value)
+                    latest[side] = max(latest[side], now)
+
+                # Evict values that fell out of the window of any future value of the other side
+                for other_side, (table, queue) in enumerate(zip(tables, queues)):
+                    limit = latest[1 - other_side] - self._window
+                    while queue and queue[0][0] < limit:
+                        _, key = queue.popleft()
+                        entries = table[key]
+                        entries.popleft()
+                        if not entries:
+                            del table[key]
+
+                key = self._keys[side](value)
+
+                for other_time, other in tables[1 - side].get(key, ()):
+                    if other_time > now + self._window:
+                        # Entries are time ordered, so no further entry is within the window
+                        break
+
+                    if other_time >= now - self._window:
+                        await observer.asend(
+                            (value, other) if side == 0 else (other, value), namespace
+                        )
+
+                if now >= latest[1 - side] - self._window:
+                    # Only keep values that can still match future values of the other side
+                    tables[side].setdefault(key, deque()).append((now, value))
+                    queues[side].append((now, key))
+
+            if not progressed:
+                await self._wait()
+
+
+class CombineLatest(FromSources[T.Tuple[T.Any, ...]]):
+    """Emit tuples with the latest value of each source, whenever any source emits.
+
+    Only starts emitting once all sources emitted at least once. Sources with buffered data are
+    served in round-robin, one value each.
+    """
+
+    __slots__ = ()
+
+    async def _worker(self, observer: "ObserverProtocol[T.Tuple[T.Any, ...]]") -> None:
+        inlets = [await self._connect(source) for source in self._sources]
+        latest: T.List[T.Any] = [_NOT_PROVIDED] * len(inlets)
+        missing = len(inlets)
+
+        while inlets:
+            progressed = False
+            for index, inlet in enumerate(inlets):
+                await self._forward_errors(observer, inlet)
+
+                if not inlet.ready:
+                    continue
+
+                if observer.closed:
+                    return
+
+                progressed = True
+                value, namespace = inlet.pop()
+
+                if latest[index] is _NOT_PROVIDED:
+                    missing -= 1
+
+                latest[index] = value
+                if missing == 0:
+                    await observer.asend(tuple(latest), namespace)
+
+            if all(inlet.done for inlet in inlets):
+                return
+
+            if any(
+                inlet.done and latest[index] is _NOT_PROVIDED for index, inlet in enumerate(inlets)
+            ):
+                # A source completed without any value, so nothing will ever be emitted
+                return
+
+            if not progressed:
+                await self._wait()
+
+
+__all__ = ("Zip", "Join", "Merge", "Concat", "MergeSorted", "CombineLatest")
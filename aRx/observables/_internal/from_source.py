@@ -14,6 +14,7 @@ from asyncio import Task, get_running_loop
 from async_tools.abstract import AsyncABCMeta
 
 # Project
+from ...credits import get_credits
 from ...namespace import Namespace
 from ..observable import Observable
 
@@ -28,7 +29,7 @@ L = T.TypeVar("L")
 
 
 class FromSource(T.Generic[K, L], Observable[K], metaclass=AsyncABCMeta):
-    __slots__ = ("_task", "_source", "_observer", "_namespace")
+    __slots__ = ("_task", "_source", "_observer", "_namespace", "__weakref__")
 
     def __init__(self, source: L, **kwargs: T.Any) -> None:
         """FromAsyncIterable constructor.
@@ -76,6 +77,12 @@ class FromSource(T.Generic[K, L], Observable[K], metaclass=AsyncABCMeta):
         self._task = None
         self._observer = None
 
+    async def _acquire_credit(self) -> None:
+        """Wait for the observer demand, if it implements the demand protocol."""
+        credits = get_credits(self._observer)
+        if credits is not None and not credits.try_acquire():
+            await credits.acquire()
+
     @abstractmethod
     async def _worker(self) -> None:
         raise NotImplementedError
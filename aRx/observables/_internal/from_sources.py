@@ -0,0 +1,254 @@
+"""FromSources
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from abc import abstractmethod
+from asyncio import Task, Future, get_running_loop
+from collections import deque
+
+# External
+from async_tools.abstract import AsyncABCMeta
+
+# Project
+from ...namespace import Namespace
+from ...observers import Observer
+from ..observable import Observable
+from ...operations import observe
+
+if T.TYPE_CHECKING:
+    # Project
+    from ...protocols import ObserverProtocol, ObservableProtocol
+
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+DEFAULT_BUFFER_SIZE: T.Final = 64
+
+
+class Inlet(Observer[K]):
+    """Observer that buffers a source data, up to a limit, until a FromSources worker consumes it.
+
+    When the buffer is full, asend waits for the worker to consume it, propagating backpressure
+    to the source.
+    """
+
+    __slots__ = ("_space", "_errors", "_values", "_wakeup", "_released", "_buffer_size")
+
+    def __init__(self, buffer_size: int, wakeup: T.Callable[[], None], **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        assert buffer_size > 0
+
+        # Internal
+        self._space: T.Optional["Future[None]"] = None
+        self._errors: T.Deque[T.Tuple[Exception, Namespace]] = deque()
+        self._values: T.Deque[T.Tuple[K, Namespace]] = deque()
+        self._wakeup = wakeup
+        self._released = False
+        self._buffer_size = buffer_size
+
+    @property
+    def ready(self) -> bool:
+        """Whether there is buffered data."""
+        return bool(self._values)
+
+    @property
+    def done(self) -> bool:
+        """Whether source completed and all its data was consumed."""
+        return self.closed and not (self._values or self._errors)
+
+    def pop(self) -> T.Tuple[K, Namespace]:
+        value = self._values.popleft()
+
+        if self._space is not None:
+            self._space.set_result(None)
+            self._space = None
+
+        return value
+
+    def pop_errors(self) -> T.Iterator[T.Tuple[Exception, Namespace]]:
+        while self._errors:
+            yield self._errors.popleft()
+
+    def release(self) -> None:
+        """Stop buffering and unblock any waiting asend, used when inlet is being disposed."""
+        self._released = True
+        self._values.clear()
+        self._errors.clear()
+
+        if self._space is not None:
+            self._space.set_result(None)
+            self._space = None
+
+    async def _asend(self, value: K, namespace: Namespace) -> None:
+        while not self._released and len(self._values) >= self._buffer_size:
+            if self._space is None:
+                self._space = get_running_loop().create_future()
+
+            await self._space
+
+        if self._released:
+            return
+
+        self._values.append((value, namespace))
+        self._wakeup()
+
+    async def _athrow(self, exc: Exception, namespace: Namespace) -> bool:
+        if not self._released:
+            self._errors.append((exc, namespace))
+            self._wakeup()
+
+        # Errors are forwarded, source completion is only signaled by close
+        return False
+
+    async def _aclose(self) -> None:
+        self._wakeup()
+
+
+class FromSources(Observable[K], metaclass=AsyncABCMeta):
+    """Base for observables that combine the data of multiple sources.
+
+    Each source is observed by an :class:`Inlet`, and a single worker task consumes the inlets
+    buffers emitting to the observer. When the worker ends the observer is closed, unless it should
+    be kept alive.
+    """
+
+    __slots__ = (
+        "_task",
+        "_inlets",
+        "_signal",
+        "_sources",
+        "_observer",
+        "_signaled",
+        "_namespace",
+        "_buffer_size",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        *sources: "ObservableProtocol[T.Any]",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        **kwargs: T.Any,
+    ) -> None:
+        """FromSources constructor.
+
+        Arguments:
+            sources: Observables whose data will be combined.
+            buffer_size: Maximum amount of values buffered per source.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        # Internal
+        self._task: T.Optional["Task[None]"] = None
+        self._inlets: T.Dict[Inlet[T.Any], "ObservableProtocol[T.Any]"] = {}
+        self._signal: T.Optional["Future[None]"] = None
+        self._sources = sources
+        self._observer: T.Optional["ObserverProtocol[K]"] = None
+        self._signaled = False
+        self._namespace = Namespace(self, "_worker")
+        self._buffer_size = buffer_size
+
+    def _wakeup(self) -> None:
+        self._signaled = True
+
+        if self._signal is not None and not self._signal.done():
+            self._signal.set_result(None)
+
+    async def _wait(self) -> None:
+        """Wait until any inlet receives data or closes, since last call."""
+        if not self._signaled:
+            self._signal = get_running_loop().create_future()
+            try:
+                await self._signal
+            finally:
+                self._signal = None
+
+        self._signaled = False
+
+    async def _connect(self, source: "ObservableProtocol[L]") -> Inlet[L]:
+        inlet: Inlet[L] = Inlet(self._buffer_size, self._wakeup)
+        self._inlets[inlet] = source
+        await observe(source, inlet)
+        return inlet
+
+    async def _disconnect(self, inlet: Inlet[T.Any]) -> None:
+        source = self._inlets.pop(inlet, None)
+        if source is None:
+            return
+
+        inlet.release()
+        await observe(source, inlet).dispose()
+
+    async def _forward_errors(self, observer: "ObserverProtocol[K]", inlet: Inlet[T.Any]) -> None:
+        for exc, namespace in inlet.pop_errors():
+            await observer.athrow(exc, namespace)
+
+    async def _run(self, observer: "ObserverProtocol[K]") -> None:
+        try:
+            await self._worker(observer)
+        except Exception as exc:
+            if not observer.closed:
+                await observer.athrow(exc, self._namespace)
+        else:
+            # Signal sources completion by closing observer
+            if not (observer.closed or observer.keep_alive):
+                await observer.aclose()
+        finally:
+            for inlet in tuple(self._inlets):
+                await self._disconnect(inlet)
+
+    @abstractmethod
+    async def _worker(self, observer: "ObserverProtocol[K]") -> None:
+        """Consume the sources data, emitting the result to observer.
+
+        Must return once all sources completed, or when observer closes.
+
+        Arguments:
+            observer: Observer that will receive the result.
+
+        """
+        raise NotImplementedError
+
+    async def __observe__(self, observer: "ObserverProtocol[K]") -> None:
+        if self._task is not None:
+            raise RuntimeError(f"{type(self).__qualname__} is already in use")
+
+        self._task = get_running_loop().create_task(self._run(observer))
+        self._observer = observer
+
+    async def __dispose__(self, observer: "ObserverProtocol[K]") -> None:
+        if self._observer is not observer:
+            return
+
+        if self._task:
+            if self._task.done():
+                try:
+                    await self._task
+                except Exception as exc:
+                    get_running_loop().call_exception_handler(
+                        {
+                            "message": f"{self}: Data observation data failed",
+                            "exception": exc,
+                        }
+                    )
+            else:
+                self._task.cancel()
+
+        for inlet in tuple(self._inlets):
+            await self._disconnect(inlet)
+
+        self._task = None
+        self._observer = None
+
+
+__all__ = ("Inlet", "FromSources", "DEFAULT_BUFFER_SIZE")
@@ -19,6 +19,8 @@ K = T.TypeVar("K")
 class FromAsyncIterable(FromSource[K, T.AsyncIterator[K]]):
     """Observable that uses an async iterable as data source."""
 
+    __slots__ = ()
+
     def __init__(self, async_iterable: T.AsyncIterable[K], **kwargs: T.Any) -> None:
         """FromAsyncIterable constructor.
 
@@ -35,12 +37,18 @@ class FromAsyncIterable(FromSource[K, T.AsyncIterator[K]]):
         loop = get_running_loop()
         try:
             async for data in self._source:
+                await self._acquire_credit()
+
                 if self._observer.closed:
                     break
 
                 await self._observer.asend(data, self._namespace)
         except Exception as exc:
             await self._observer.athrow(exc, self._namespace)
+        else:
+            # Signal source exhaustion by closing observer
+            if not (self._observer.closed or self._observer.keep_alive):
+                await self._observer.aclose()
         finally:
             if isinstance(self._source, T.AsyncGenerator):
                 # Ensure async_generator gets closed
@@ -9,36 +9,163 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import typing as T
 
 # Project
+from ..errors import ObserverClosedError
+from ..credits import get_credits
 from ._internal.from_source import FromSource
 
+if T.TYPE_CHECKING:
+    # Project
+    from ..protocols import ObserverProtocol
+
+
 # Generic Types
 K = T.TypeVar("K")
 
 
+class _SourceError(Exception):
+    """Wrap errors raised by the source iterator, to tell them apart from fused operators errors."""
+
+
+def _guard(source: T.Iterator[K]) -> T.Iterator[K]:
+    try:
+        yield from source
+    except Exception as exc:
+        raise _SourceError(exc) from exc
+
+
 class FromIterable(FromSource[K, T.Iterator[K]]):
-    """Observable that uses an iterable as data source."""
+    """Observable that uses an iterable as data source.
+
+    When ``fuse`` is enabled, the leading synchronous operators observing it (``Map``, ``Filter``,
+    ``Take`` and ``Skip`` without error handlers, index, cache or coroutine functions) are fused
+    into a chain of iterators. Data is then pulled through that chain, in batches of
+    ``batch_size``, and pushed straight into the first observer that couldn't be fused, skipping the
+    async machinery of each fused operator. Without any fusible operator data is pushed as usual.
+
+    .. Note::
 
-    def __init__(self, iterable: T.Iterable[K], **kwargs: T.Any) -> None:
+        Functions given to fused operators must not return awaitables.
+    """
+
+    __slots__ = ("_fusion", "_batch_size")
+
+    def __init__(
+        self,
+        iterable: T.Iterable[K],
+        *,
+        fuse: bool = False,
+        batch_size: int = 256,
+        **kwargs: T.Any,
+    ) -> None:
         """FromIterable constructor.
 
         Arguments:
             iterable: Iterable to be converted.
+            fuse: Whether to pull data through the leading synchronous operators.
+            batch_size: Amount of values pulled at once, when operators are fused.
             kwargs: Keyword parameters for super.
 
         """
         super().__init__(iter(iterable), **kwargs)
 
+        assert batch_size > 0
+
+        self._fusion = fuse
+        self._batch_size = batch_size
+
+    def _fused(self) -> T.Tuple[T.Iterator[T.Any], "ObserverProtocol[T.Any]"]:
+        """Fuse leading synchronous operators into the source iterator.
+
+        Returns:
+            Iterator with the fused operators applied, and the first observer that wasn't fused.
+
+        """
+        assert self._observer is not None
+
+        iterator: T.Iterator[T.Any] = _guard(self._source)
+        observer: "ObserverProtocol[T.Any]" = self._observer
+        while True:
+            fuse = getattr(observer, "_fuse", None)
+            stage = None if fuse is None else fuse()
+            downstream = getattr(observer, "_observer", None)
+            if stage is None or downstream is None:
+                return iterator, observer
+
+            iterator = stage(iterator)
+            observer = downstream
+
+    async def _pull(
+        self, iterator: T.Iterator[T.Any], observer: "ObserverProtocol[T.Any]"
+    ) -> None:
+        batch: T.List[T.Any] = []
+        exhausted = False
+        namespace = self._namespace
+        source_error: T.Optional[Exception] = None
+
+        while not exhausted:
+            error: T.Optional[Exception] = None
+
+            try:
+                for _ in range(self._batch_size):
+                    batch.append(next(iterator))
+            except StopIteration:
+                exhausted = True
+            except _SourceError as exc:
+                # Source can't be iterated anymore, the error is handled as if nothing was fused
+                exhausted = True
+                source_error = exc.args[0]
+            except Exception as exc:
+                # Pulling resumes after the error, as it would with the unfused operators
+                error = exc
+
+            credits = get_credits(observer)
+            for data in batch:
+                if credits is not None and not credits.try_acquire():
+                    await credits.acquire()
+
+                if observer.closed:
+                    return
+
+                await observer.asend(data, namespace)
+
+            # Remove reference early to avoid keeping large objects in memory
+            batch.clear()
+
+            if observer.closed:
+                return
+
+            if error is not None:
+                await observer.athrow(error, namespace)
+
+        if source_error is not None:
+            raise source_error
+
     async def _worker(self) -> None:
         assert self._observer is not None
 
+        iterator, observer = self._fused() if self._fusion else (self._source, self._observer)
+
         try:
-            for data in self._source:
-                if self._observer.closed:
-                    break
+            if observer is not self._observer:
+                await self._pull(iterator, observer)
+            else:
+                for data in self._source:
+                    await self._acquire_credit()
+
+                    if self._observer.closed:
+                        break
 
-                await self._observer.asend(data, self._namespace)
+                    await self._observer.asend(data, self._namespace)
+        except ObserverClosedError:
+            # Observer was closed while data was being pushed (e.g. by Take), nothing else to do
+            pass
         except Exception as exc:
-            await self._observer.athrow(exc, self._namespace)
+            if not self._observer.closed:
+                await self._observer.athrow(exc, self._namespace)
+        else:
+            # Signal source exhaustion by closing observer, which cascades through fused operators
+            if not (self._observer.closed or self._observer.keep_alive):
+                await self._observer.aclose()
 
 
 __all__ = ("FromIterable",)
@@ -13,7 +13,7 @@ from abc import abstractmethod
 from async_tools.abstract import AsyncABCMeta
 
 # Project
-from ..protocols import TransformerProtocol
+from ..protocols import TransformerProtocol, implements
 from ..operations import pipe, sink
 
 if T.TYPE_CHECKING:
@@ -37,11 +37,13 @@ class Observable(T.Generic[K], metaclass=AsyncABCMeta):
     and must be implemented in the magic method :meth:`~.Observable.__observe__`.
     """
 
+    __slots__ = ()
+
     def __gt__(self, observer: "ObserverProtocol[K]") -> sink[K]:
         return sink(self, observer)
 
     def __or__(self, transformer: TransformerProtocol[K, L]) -> pipe[K, L]:
-        if not isinstance(transformer, TransformerProtocol):
+        if not implements(transformer, TransformerProtocol):
             raise TypeError("Argument must be an object that implements the TransformerProtocol")
 
         return pipe(self, transformer)
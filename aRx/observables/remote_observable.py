@@ -0,0 +1,129 @@
+"""RemoteObservable
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from contextlib import suppress
+
+# Project
+from ..codecs import SEND, CLOSE, THROW, CREDIT, Codec, PickleCodec, read_frame, write_frame
+from ._internal.from_source import FromSource
+
+if T.TYPE_CHECKING:
+    # Internal
+    from asyncio import StreamReader, StreamWriter
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class RemoteObservable(FromSource[K, "StreamReader"]):
+    """Observable of the data sent by a :class:`~aRx.observers.RemoteObserver`.
+
+    Data is received over a stream, like a Unix domain socket connection, and sent to the observer
+    as it is read. The remote observer is granted credits for ``window`` values, which are granted
+    again, in bulk, as the observer consumes them. So a fast remote observer can't overrun a slow
+    observer.
+
+    .. Note::
+
+        The observer is closed when the remote observer closes, or the stream ends.
+    """
+
+    __slots__ = ("_codec", "_writer", "_window")
+
+    def __init__(
+        self,
+        reader: "StreamReader",
+        writer: "StreamWriter",
+        *,
+        codec: T.Optional[Codec] = None,
+        window: int = 1024,
+        **kwargs: T.Any,
+    ) -> None:
+        """RemoteObservable constructor.
+
+        Arguments:
+            reader: Stream through which data is received.
+            writer: Stream through which credits are sent.
+            codec: Codec used to deserialize data, pickle by default.
+            window: Maximum amount of values sent by the remote observer ahead of consumption.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(reader, **kwargs)
+
+        assert window > 0
+
+        # Internal
+        self._codec = PickleCodec() if codec is None else codec
+        self._writer = writer
+        self._window = window
+
+    async def _grant(self, amount: int) -> None:
+        if self._writer.is_closing():
+            # Connection is gone, frames already received are still read, but can't be granted
+            return
+
+        with suppress(ConnectionError):
+            write_frame(self._writer, self._codec, [[CREDIT, amount]])
+            await self._writer.drain()
+
+    async def _receive(self) -> None:
+        assert self._observer is not None
+
+        # Grant credits again only after half the window is consumed, to batch them
+        threshold = max(self._window // 2, 1)
+        consumed = 0
+
+        await self._grant(self._window)
+
+        while True:
+            messages = await read_frame(self._source, self._codec)
+            if messages is None:
+                return
+
+            for kind, payload in messages:
+                if kind == SEND:
+                    await self._acquire_credit()
+
+                    if self._observer.closed:
+                        return
+
+                    await self._observer.asend(payload, self._namespace)
+                    consumed += 1
+                elif kind == THROW:
+                    await self._observer.athrow(
+                        self._codec.decode_exception(payload), self._namespace
+                    )
+                elif kind == CLOSE:
+                    return
+
+            # Remove reference early to avoid keeping large objects in memory
+            del messages
+
+            if consumed >= threshold:
+                await self._grant(consumed)
+                consumed = 0
+
+    async def _worker(self) -> None:
+        assert self._observer is not None
+
+        try:
+            await self._receive()
+        except Exception as exc:
+            await self._observer.athrow(exc, self._namespace)
+        else:
+            # Signal remote closure by closing observer
+            if not (self._observer.closed or self._observer.keep_alive):
+                await self._observer.aclose()
+        finally:
+            self._writer.close()
+
+
+__all__ = ("RemoteObservable",)
@@ -11,7 +11,24 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # Project
 from .consumer import Consumer
 from .observer import Observer
+from .collectors import Last, Count, First, ToDict, ToList, ToArray, Collector
+from .remote_observer import RemoteObserver
 from .iterator_observer import IteratorObserver
 from .anonymous_observer import AnonymousObserver
+from .blocking_iterator_observer import BlockingIteratorObserver
 
-__all__ = ("Observer", "Consumer", "AnonymousObserver", "IteratorObserver")
+__all__ = (
+    "Last",
+    "Count",
+    "First",
+    "ToDict",
+    "ToList",
+    "ToArray",
+    "Observer",
+    "Consumer",
+    "Collector",
+    "RemoteObserver",
+    "AnonymousObserver",
+    "IteratorObserver",
+    "BlockingIteratorObserver",
+)
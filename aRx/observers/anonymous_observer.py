@@ -28,22 +28,19 @@ def default_asend(_: T.Any, __: T.Any) -> None:
     return
 
 
-def setup_default_athrow() -> T.Callable[[Exception, "Namespace"], bool]:
-    def default_athrow(exc: Exception, namespace: "Namespace") -> bool:
-        ref = namespace.ref
-        get_running_loop().call_exception_handler(
-            {
-                "message": (
-                    f"Unhandled error propagated through {AnonymousObserver.__qualname__}"
-                    f" from {ref if ref else namespace.type} at {namespace.action}"
-                ),
-                "exception": exc,
-            }
-        )
+def default_athrow(exc: Exception, namespace: "Namespace") -> bool:
+    ref = namespace.ref
+    get_running_loop().call_exception_handler(
+        {
+            "message": (
+                f"Unhandled error propagated through {AnonymousObserver.__qualname__}"
+                f" from {ref if ref else namespace.type} at {namespace.action}"
+            ),
+            "exception": exc,
+        }
+    )
 
-        return False
-
-    return default_athrow
+    return False
 
 
 def default_aclose() -> None:
@@ -58,6 +55,8 @@ class AnonymousObserver(Observer[K]):
     listening to a source.
     """
 
+    __slots__ = ("_asend_impl", "_aclose_impl", "_athrow_impl")
+
     @T.overload
     def __init__(
         self,
@@ -95,7 +94,7 @@ class AnonymousObserver(Observer[K]):
         super().__init__(**kwargs)
 
         self._asend_impl = default_asend if asend is None else asend
-        self._athrow_impl = setup_default_athrow() if athrow is None else athrow
+        self._athrow_impl = default_athrow if athrow is None else athrow
         self._aclose_impl = default_aclose if aclose is None else aclose
 
     async def _asend(self, value: K, namespace: "Namespace") -> None:
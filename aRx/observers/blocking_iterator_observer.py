@@ -0,0 +1,248 @@
+"""BlockingIteratorObserver
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import Future, AbstractEventLoop, get_running_loop
+from threading import Lock, Condition
+from collections import deque
+
+# Project
+from .observer import Observer
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+def _wakeup(future: "Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class BlockingIteratorObserver(Observer[K], T.Iterator[K]):
+    """An observer that can be iterated, blocking, from other threads.
+
+    Values are handed to the iterating threads in batches of at most ``batch_size`` values, flushed
+    when full or once the loop is done with its current callbacks, so iteration doesn't take a lock
+    per value. At most ``maxsize`` values are buffered, after which asend waits for iteration to
+    catch up.
+
+    Iteration stops, after all buffered values, once the observer is closed. An exception thrown
+    into the observer is raised by the iteration, after which the observer closes.
+
+    .. Note::
+
+        An iterating thread that stops before the end should call :meth:`close`, which closes the
+        observer and discards buffered values.
+    """
+
+    __slots__ = (
+        "_loop",
+        "_size",
+        "_batch",
+        "_queue",
+        "_waiter",
+        "_current",
+        "_maxsize",
+        "_timeout",
+        "_detached",
+        "_finished",
+        "_condition",
+        "_scheduled",
+        "_batch_size",
+    )
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1024,
+        batch_size: int = 64,
+        timeout: T.Optional[float] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        """BlockingIteratorObserver constructor.
+
+        Arguments:
+            maxsize: Maximum amount of values buffered ahead of iteration.
+            batch_size: Maximum amount of values in each batch handed to iteration.
+            timeout: Maximum time, in seconds, iteration waits for a value, after which
+                     TimeoutError is raised. Unlimited by default.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        assert maxsize > 0
+        assert batch_size > 0
+
+        try:
+            loop: T.Optional[AbstractEventLoop] = get_running_loop()
+        except RuntimeError:
+            # Created outside of a loop, the loop is recorded once data is received
+            loop = None
+
+        # Internal
+        self._loop = loop
+        self._size = 0
+        self._batch: T.List[K] = []
+        self._queue: T.Deque[T.Tuple[bool, T.Any]] = deque()
+        self._waiter: T.Optional["Future[None]"] = None
+        self._current: T.Deque[K] = deque()
+        self._maxsize = maxsize
+        self._timeout = timeout
+        self._detached = False
+        self._finished = False
+        self._condition = Condition(Lock())
+        self._scheduled = False
+        self._batch_size = batch_size
+
+    def _flush(self) -> None:
+        self._scheduled = False
+
+        if not self._batch:
+            return
+
+        batch, self._batch = self._batch, []
+        with self._condition:
+            if not self._detached:
+                self._queue.append((False, batch))
+                self._size += len(batch)
+                self._condition.notify()
+
+    async def _wait_for_space(self) -> None:
+        self._flush()
+
+        with self._condition:
+            if self._detached or self._size < self._maxsize:
+                return
+
+            if self._waiter is None:
+                self._waiter = get_running_loop().create_future()
+
+            waiter = self._waiter
+
+        await waiter
+
+    def _on_detach(self) -> None:
+        if self._waiter is not None:
+            _wakeup(self._waiter)
+
+        if not self.closed:
+            # Must use create_task to avoid deadlock
+            get_running_loop().create_task(self.aclose())
+
+    async def _asend(self, value: K, _: "Namespace") -> None:
+        if self._loop is None:
+            self._loop = get_running_loop()
+
+        while not self._detached and self._size + len(self._batch) >= self._maxsize:
+            await self._wait_for_space()
+
+        if self._detached:
+            # Nobody is iterating anymore
+            self._on_detach()
+            return
+
+        self._batch.append(value)
+
+        if len(self._batch) >= self._batch_size:
+            self._flush()
+        elif not self._scheduled:
+            # Flush partial batch once the loop is done with its current callbacks
+            self._scheduled = True
+            self._loop.call_soon(self._flush)
+
+    async def _athrow(self, err: Exception, _: "Namespace") -> bool:
+        if self._loop is None:
+            self._loop = get_running_loop()
+
+        self._flush()
+
+        with self._condition:
+            self._queue.append((True, err))
+            self._condition.notify()
+
+        return True
+
+    async def _aclose(self) -> None:
+        self._flush()
+
+        with self._condition:
+            self._finished = True
+            self._condition.notify_all()
+
+    def __iter__(self) -> T.Iterator[K]:
+        return self
+
+    def __next__(self) -> K:
+        while True:
+            try:
+                return self._current.popleft()
+            except IndexError:
+                pass
+
+            with self._condition:
+                if self._current:
+                    # Another thread got a batch in the meantime
+                    continue
+
+                if not self._condition.wait_for(
+                    lambda: self._queue or self._finished, self._timeout
+                ):
+                    raise TimeoutError(f"{self}: Timed out waiting for a value")
+
+                if not self._queue:
+                    raise StopIteration
+
+                is_error, payload = self._queue.popleft()
+
+                if not is_error:
+                    self._size -= len(payload)
+                    self._current.extend(payload)
+
+                waiter, self._waiter = self._waiter, None
+
+            if waiter is not None:
+                # Room for another batch, wake up any asend waiting for it
+                assert self._loop is not None
+                self._loop.call_soon_threadsafe(_wakeup, waiter)
+
+            if is_error:
+                assert isinstance(payload, Exception)
+                raise payload
+
+            # Remove reference early to avoid keeping large objects in memory
+            del payload
+
+    def close(self) -> None:
+        """Stop iteration, from any thread, discarding buffered values and closing the observer."""
+        with self._condition:
+            if self._detached:
+                return
+
+            self._detached = True
+            self._size = 0
+            self._queue.clear()
+            self._current.clear()
+            self._finished = True
+            self._condition.notify_all()
+
+            loop = self._loop
+
+        if loop is None:
+            # No data was ever received, so there is nothing in flight to wait for
+            self._closed = True
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(self._on_detach)
+
+
+__all__ = ("BlockingIteratorObserver",)
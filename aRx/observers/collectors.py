@@ -0,0 +1,325 @@
+"""Collectors
+
+Terminal observers that reduce all data they receive into a single awaitable result.
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from abc import abstractmethod
+from asyncio import Future, get_running_loop
+
+# External
+from async_tools.abstract import AsyncABCMeta
+
+# Project
+from ..errors import ConsumerClosedError
+from .observer import Observer
+
+if T.TYPE_CHECKING:
+    # External
+    import numpy
+
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+_NOT_PROVIDED: T.Final = object()
+
+
+class Collector(Observer[K], T.Awaitable[L], metaclass=AsyncABCMeta):
+    """Observer that reduces all received data into :attr:`result`.
+
+    The result is available once the collector closes, and can be retrieved by awaiting the
+    collector itself. Errors are set as the result exception and close the collector.
+    """
+
+    __slots__ = ("result",)
+
+    def __init__(self, **kwargs: T.Any) -> None:
+        super().__init__(keep_alive=False, **kwargs)
+
+        self.result: "Future[L]" = get_running_loop().create_future()
+
+    def __await__(self) -> T.Generator[T.Any, None, L]:
+        return self.result.__await__()
+
+    def _complete(self, result: L) -> None:
+        """Set result and mark collector as closed.
+
+        Allows closing from inside _asend without going through athrow, or scheduling aclose, as
+        there is nothing left for _aclose to do.
+
+        Arguments:
+            result: Collector result.
+
+        """
+        if not self.result.done():
+            self.result.set_result(result)
+
+        self._closed = True
+
+    @abstractmethod
+    def _collect(self) -> L:
+        """Compute result once collector is closed.
+
+        Raises:
+            ConsumerClosedError: When there is no result.
+
+        """
+        raise NotImplementedError
+
+    async def _athrow(self, exc: Exception, _: "Namespace") -> bool:
+        if not self.result.done():
+            self.result.set_exception(exc)
+
+        return True
+
+    async def _aclose(self) -> None:
+        if self.result.done():
+            return
+
+        try:
+            self.result.set_result(self._collect())
+        except Exception as exc:
+            self.result.set_exception(exc)
+
+
+class First(Collector[K, K]):
+    """Collect the first value received, closing right after it."""
+
+    __slots__ = ("_default",)
+
+    def __init__(self, default: T.Any = _NOT_PROVIDED, **kwargs: T.Any) -> None:
+        """First constructor.
+
+        Arguments:
+            default: Result when no value is received, otherwise ConsumerClosedError is raised.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        self._default = default
+
+    async def _asend(self, value: K, _: "Namespace") -> None:
+        self._complete(value)
+
+    def _collect(self) -> K:
+        if self._default is _NOT_PROVIDED:
+            raise ConsumerClosedError
+
+        return T.cast(K, self._default)
+
+
+class Last(Collector[K, K]):
+    """Collect the last value received."""
+
+    __slots__ = ("_last",)
+
+    def __init__(self, default: T.Any = _NOT_PROVIDED, **kwargs: T.Any) -> None:
+        """Last constructor.
+
+        Arguments:
+            default: Result when no value is received, otherwise ConsumerClosedError is raised.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        self._last: T.Any = default
+
+    async def _asend(self, value: K, _: "Namespace") -> None:
+        self._last = value
+
+    def _collect(self) -> K:
+        if self._last is _NOT_PROVIDED:
+            raise ConsumerClosedError
+
+        return T.cast(K, self._last)
+
+
+class Count(Collector[T.Any, int]):
+    """Count the values received."""
+
+    __slots__ = ("_count", "_batched")
+
+    def __init__(self, *, batched: bool = False, **kwargs: T.Any) -> None:
+        """Count constructor.
+
+        Arguments:
+            batched: Whether each value is a sized batch of values to be counted.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        self._count = 0
+        self._batched = batched
+
+    async def _asend(self, value: T.Any, _: "Namespace") -> None:
+        self._count += len(value) if self._batched else 1
+
+    def _collect(self) -> int:
+        return self._count
+
+
+class ToList(Collector[T.Any, T.List[K]]):
+    """Collect all values received into a list."""
+
+    __slots__ = ("_size", "_items", "_batched")
+
+    def __init__(self, *, size_hint: int = 0, batched: bool = False, **kwargs: T.Any) -> None:
+        """ToList constructor.
+
+        Arguments:
+            size_hint: Expected amount of values, used to preallocate the list.
+            batched: Whether each value is an iterable batch of values to be collected.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        self._size = 0
+        self._items: T.List[K] = [None] * size_hint  # type: ignore
+        self._batched = batched
+
+    async def _asend(self, value: T.Any, _: "Namespace") -> None:
+        items = self._items
+        size = self._size
+
+        if not self._batched:
+            if size < len(items):
+                items[size] = value
+            else:
+                items.append(value)
+
+            self._size = size + 1
+            return
+
+        if size < len(items):
+            # Fill preallocated space, any excess is appended by the slice assignment
+            value = tuple(value)
+            items[size : size + len(value)] = value
+            self._size = size + len(value)
+        else:
+            items.extend(value)
+            self._size = len(items)
+
+    def _collect(self) -> T.List[K]:
+        # Drop unused preallocated space
+        del self._items[self._size :]
+        return self._items
+
+
+class ToDict(Collector[K, T.Dict[T.Hashable, T.Any]]):
+    """Collect all values received into a dict."""
+
+    __slots__ = ("_key", "_items", "_value")
+
+    def __init__(
+        self,
+        key: T.Callable[[K], T.Hashable],
+        value: T.Optional[T.Callable[[K], T.Any]] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        """ToDict constructor.
+
+        Arguments:
+            key: Function that computes each entry key. Later values overwrite earlier ones.
+            value: Function that computes each entry value, defaults to the value itself.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        self._key = key
+        self._items: T.Dict[T.Hashable, T.Any] = {}
+        self._value = value
+
+    async def _asend(self, value: K, _: "Namespace") -> None:
+        self._items[self._key(value)] = value if self._value is None else self._value(value)
+
+    def _collect(self) -> T.Dict[T.Hashable, T.Any]:
+        return self._items
+
+
+class ToArray(Collector[T.Any, "numpy.ndarray[T.Any, T.Any]"]):
+    """Collect all values received into a NumPy array.
+
+    .. Note::
+
+        Requires NumPy to be installed.
+    """
+
+    __slots__ = ("_size", "_buffer", "_batched", "_numpy")
+
+    def __init__(
+        self,
+        *,
+        dtype: T.Any = float,
+        size_hint: int = 1024,
+        batched: bool = False,
+        **kwargs: T.Any,
+    ) -> None:
+        """ToArray constructor.
+
+        Arguments:
+            dtype: NumPy data type of the resulting array.
+            size_hint: Expected amount of values, used to preallocate the array.
+            batched: Whether each value is an array like batch of values to be collected.
+            kwargs: Keyword parameters for super.
+
+        """
+        try:
+            # External
+            import numpy
+        except ImportError as exc:  # pragma: no cover
+            raise ImportError(f"{type(self).__qualname__} requires numpy to be installed") from exc
+
+        super().__init__(**kwargs)
+
+        self._size = 0
+        self._numpy = numpy
+        self._buffer = numpy.empty(max(size_hint, 1), dtype=dtype)
+        self._batched = batched
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._buffer)
+        if size <= capacity:
+            return
+
+        # Grow geometrically so appends are amortized O(1)
+        while capacity < size:
+            capacity *= 2
+
+        buffer = self._numpy.empty(capacity, dtype=self._buffer.dtype)
+        buffer[: self._size] = self._buffer[: self._size]
+        self._buffer = buffer
+
+    async def _asend(self, value: T.Any, _: "Namespace") -> None:
+        if self._batched:
+            batch = self._numpy.asarray(value, dtype=self._buffer.dtype)
+            size = self._size + len(batch)
+            self._reserve(size)
+            self._buffer[self._size : size] = batch
+        else:
+            size = self._size + 1
+            self._reserve(size)
+            self._buffer[self._size] = value
+
+        self._size = size
+
+    def _collect(self) -> "numpy.ndarray[T.Any, T.Any]":
+        buffer = self._buffer[: self._size]
+        # Copy to release unused preallocated space
+        return buffer.copy() if self._size < len(self._buffer) else buffer
+
+
+__all__ = ("Collector", "First", "Last", "Count", "ToList", "ToDict", "ToArray")
@@ -7,44 +7,21 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 # Internal
 import typing as T
-from asyncio import Future, get_running_loop
 
 # Project
-from ..errors import ConsumerClosedError
-from .observer import Observer
-
-if T.TYPE_CHECKING:
-    # Project
-    from ..namespace import Namespace
-
+from .collectors import First
 
 # Generic Types
 K = T.TypeVar("K")
 
 
-class Consumer(Observer[K]):
-    def __init__(self, **kwargs: T.Any) -> None:
-        super().__init__(keep_alive=False, **kwargs)
-
-        self.result: "Future[K]" = get_running_loop().create_future()
-
-    async def _asend(self, value: K, _: "Namespace") -> None:
-        if self.result.done():
-            return
-
-        self.result.set_result(value)
-
-        # Use exception as shorthand for closing consumer
-        raise ConsumerClosedError
+class Consumer(First[K]):
+    """Observer that resolves :attr:`result` with the first value received.
 
-    async def _athrow(self, exc: Exception, _: "Namespace") -> bool:
-        if not self.result.done():
-            self.result.set_exception(exc)
-        return True
+    Kept for backwards compatibility, see :class:`~.collectors.First`.
+    """
 
-    async def _aclose(self) -> None:
-        if not self.result.done():
-            self.result.set_exception(ConsumerClosedError)
+    __slots__ = ()
 
 
 __all__ = ("Consumer",)
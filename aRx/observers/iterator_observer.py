@@ -11,6 +11,7 @@ from asyncio import Future, get_running_loop
 from collections import deque
 
 # Project
+from ..credits import Credits
 from .observer import Observer
 
 if T.TYPE_CHECKING:
@@ -25,15 +26,23 @@ K = T.TypeVar("K")
 class IteratorObserver(Observer[K], T.AsyncIterator[K]):
     """An async observers that can be iterated asynchronously."""
 
-    def __init__(self, **kwargs: T.Any) -> None:
+    __slots__ = ("_queue", "credits", "_control", "_counter")
+
+    def __init__(self, *, prefetch: T.Optional[int] = None, **kwargs: T.Any) -> None:
         """IteratorObserver constructor
 
         Arguments:
+            prefetch: Maximum amount of values buffered ahead of iteration, through the demand
+                protocol. Unlimited by default.
             kwargs: Keyword parameters for super.
         """
 
         super().__init__(**kwargs)
 
+        assert prefetch is None or prefetch > 0
+
+        self.credits: T.Optional[Credits] = None if prefetch is None else Credits(prefetch)
+
         # Private
         self._queue: T.Deque[T.Tuple[bool, T.Union[K, Exception]]] = deque()
         self._counter = 0
@@ -63,6 +72,9 @@ class IteratorObserver(Observer[K], T.AsyncIterator[K]):
         return True
 
     async def _aclose(self) -> None:
+        if self.credits is not None:
+            self.credits.close()
+
         if self._control and not self._control.done():
             self._control.set_result(True)
 
@@ -78,6 +90,10 @@ class IteratorObserver(Observer[K], T.AsyncIterator[K]):
 
         is_error, value = self._next_value
 
+        if self.credits is not None and not is_error:
+            # Value left the buffer, so there is room for another one
+            self.credits.grant()
+
         if is_error:
             assert isinstance(value, Exception)
             raise value
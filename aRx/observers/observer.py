@@ -23,12 +23,7 @@ K = T.TypeVar("K")
 L = T.TypeVar("L")
 
 
-class Observer(
-    BasicRepr,
-    T.Generic[K],
-    T.AsyncContextManager["Observer[K]"],
-    metaclass=AsyncABCMeta,
-):
+class Observer(BasicRepr, T.Generic[K], metaclass=AsyncABCMeta):
     """Observer abstract class.
 
     An abstract implementation of the ObserverProtocol that defines some basis for the data flow,
@@ -41,6 +36,8 @@ class Observer(
         "_close_guard",
         "_propagation_count",
         "_propagation_guard",
+        # Namespaces keep weak references to observers
+        *(() if BasicRepr.__weakrefoffset__ else ("__weakref__",)),
     )
 
     def __init__(self, *, keep_alive: bool = False, **kwargs: T.Any) -> None:
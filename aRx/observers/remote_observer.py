@@ -0,0 +1,197 @@
+"""RemoteObserver
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import Lock, Task, TimerHandle, get_running_loop
+from contextlib import suppress
+
+# Project
+from ..codecs import SEND, CLOSE, THROW, CREDIT, Codec, PickleCodec, read_frame, write_frame
+from ..credits import Credits
+from .observer import Observer
+
+if T.TYPE_CHECKING:
+    # Internal
+    from asyncio import StreamReader, StreamWriter
+
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class RemoteObserver(Observer[K]):
+    """Observer that sends all data received to a :class:`~aRx.observables.RemoteObservable`.
+
+    Data is sent over a stream, like a Unix domain socket connection, in batches of at most
+    ``batch_size`` messages, whatever their size in bytes. Batches are flushed when full, or
+    ``flush_interval`` seconds after their first message.
+
+    Values are only sent while the remote observable grants credits for them, so asend waits
+    while the remote observable, and its observer, fall behind.
+
+    On close, the stream is only half-closed, and aclose waits for the remote observable to read
+    all data sent and close its side of the stream.
+    """
+
+    __slots__ = (
+        "_batch",
+        "_codec",
+        "_timer",
+        "_reader",
+        "_writer",
+        "_credits",
+        "_drain_lock",
+        "_receiver",
+        "_batch_size",
+        "_flush_interval",
+    )
+
+    def __init__(
+        self,
+        reader: "StreamReader",
+        writer: "StreamWriter",
+        *,
+        codec: T.Optional[Codec] = None,
+        batch_size: int = 128,
+        flush_interval: float = 0.001,
+        **kwargs: T.Any,
+    ) -> None:
+        """RemoteObserver constructor.
+
+        Arguments:
+            reader: Stream through which credits are received.
+            writer: Stream through which data is sent.
+            codec: Codec used to serialize data, pickle by default.
+            batch_size: Maximum amount of messages, not bytes, in each batch.
+            flush_interval: Maximum time, in seconds, messages wait to be sent.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        assert batch_size > 0
+        assert flush_interval >= 0
+
+        # Internal
+        self._batch: T.List[T.List[T.Any]] = []
+        self._codec = PickleCodec() if codec is None else codec
+        self._timer: T.Optional[TimerHandle] = None
+        self._reader = reader
+        self._writer = writer
+        self._credits = Credits()
+        self._drain_lock: T.Optional[Lock] = None
+        self._receiver: T.Optional["Task[None]"] = None
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+
+    async def _receive(self) -> None:
+        try:
+            while True:
+                messages = await read_frame(self._reader, self._codec)
+                if messages is None:
+                    break
+
+                for kind, payload in messages:
+                    if kind == CREDIT:
+                        self._credits.grant(payload)
+        except ConnectionError:
+            pass
+        finally:
+            # Remote observable is gone, stop waiting for credits
+            self._credits.close()
+
+        if not self.closed:
+            # Must use create_task to avoid deadlock
+            get_running_loop().create_task(self.aclose())
+
+    def _write(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._batch:
+            batch, self._batch = self._batch, []
+            write_frame(self._writer, self._codec, batch)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._write()
+
+    async def _flush(self) -> None:
+        self._write()
+
+        if self._drain_lock is None:
+            self._drain_lock = Lock()
+
+        # Concurrent drains aren't supported by all python versions
+        async with self._drain_lock:
+            await self._writer.drain()
+
+    async def _push(self, kind: int, payload: T.Any) -> None:
+        self._batch.append([kind, payload])
+
+        if len(self._batch) >= self._batch_size:
+            await self._flush()
+        elif self._timer is None:
+            self._timer = get_running_loop().call_later(self._flush_interval, self._on_timer)
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        if self._receiver is None:
+            self._receiver = get_running_loop().create_task(self._receive())
+
+        if not self._credits.try_acquire():
+            # Remote observable must receive pending values to grant more credits
+            await self._flush()
+            await self._credits.acquire()
+
+        if self._credits.closed:
+            raise ConnectionResetError(f"{self}: Remote observable disconnected")
+
+        awaitable = self._push(SEND, value)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await awaitable
+
+    async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
+        await self._push(THROW, self._codec.encode_exception(exc))
+        await self._flush()
+
+        # RemoteObserver doesn't close on raise
+        return False
+
+    async def _aclose(self) -> None:
+        with suppress(ConnectionError):
+            if not self._writer.is_closing():
+                self._batch.append([CLOSE, None])
+                await self._flush()
+
+                if self._writer.can_write_eof():
+                    # Closing the whole stream now could drop data still unread by the remote
+                    # observable, so only half-close it and wait for the remote side to close,
+                    # which it does once all data was read
+                    self._writer.write_eof()
+
+                    if self._receiver is None:
+                        self._receiver = get_running_loop().create_task(self._receive())
+
+                    await self._receiver
+
+        self._writer.close()
+        with suppress(ConnectionError):
+            await self._writer.wait_closed()
+
+        if self._receiver is not None:
+            self._receiver.cancel()
+
+
+__all__ = ("RemoteObserver",)
@@ -10,7 +10,13 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
 # Project
+from .join_op import join
 from .pipe_op import pipe
 from .sink_op import sink
+from .merge_op import merge
 from .concat_op import concat
 from .observe_op import observe
+from .pipeline_op import pipeline
+from .zip_with_op import zip_with
+from .merge_sorted_op import merge_sorted
+from .combine_latest_op import combine_latest
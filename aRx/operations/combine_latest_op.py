@@ -0,0 +1,36 @@
+"""combine_latest
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..protocols import ObservableProtocol
+    from ..observables import Observable
+
+
+def combine_latest(
+    *sources: "ObservableProtocol[T.Any]", **kwargs: T.Any
+) -> "Observable[T.Tuple[T.Any, ...]]":
+    """Emit tuples with the latest value of each source, whenever any of them emits.
+
+    Arguments:
+        sources: Observables to be combined.
+        kwargs: Keyword parameters for :class:`~.combinators.CombineLatest`.
+
+    Returns:
+        Observable that emits the combined data.
+
+    """
+    # Project
+    from ..observables._internal.combinators import CombineLatest
+
+    return CombineLatest(*sources, **kwargs)
+
+
+__all__ = ("combine_latest",)
@@ -8,9 +8,6 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # Internal
 import typing as T
 
-# Project
-from .observe_op import observe
-
 if T.TYPE_CHECKING:
     # Project
     from ..protocols import ObservableProtocol
@@ -19,27 +16,26 @@ if T.TYPE_CHECKING:
 
 # Generic Types
 K = T.TypeVar("K")
-L = T.TypeVar("L")
-M = T.TypeVar("M")
 
 
-async def concat(
-    a: "ObservableProtocol[K]", b: "ObservableProtocol[L]"
-) -> "Observable[T.Union[K, L]]":
-    # Project
-    from ..streams import SingleStream
+def concat(
+    *sources: "ObservableProtocol[K]", prefetch: int = 1, **kwargs: T.Any
+) -> "Observable[K]":
+    """Emit the data of each source, in order, one source after the other.
 
-    sink: SingleStream[T.Any] = SingleStream()
+    Arguments:
+        sources: Observables to be concatenated.
+        prefetch: Amount of upcoming sources to observe, and buffer, ahead of time.
+        kwargs: Keyword parameters for :class:`~.combinators.Concat`.
 
-    await observe(a, sink)
+    Returns:
+        Observable that emits the concatenated data.
 
-    try:
-        await observe(b, sink)
-    except Exception:
-        await observe(a, sink).dispose()
-        raise
+    """
+    # Project
+    from ..observables._internal.combinators import Concat
 
-    return sink
+    return Concat(*sources, prefetch=prefetch, **kwargs)
 
 
 __all__ = ("concat",)
@@ -0,0 +1,53 @@
+"""join
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..protocols import ObservableProtocol
+    from ..observables import Observable
+
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+
+def join(
+    left: "ObservableProtocol[K]",
+    right: "ObservableProtocol[L]",
+    left_key: T.Callable[[K], T.Hashable],
+    right_key: T.Callable[[L], T.Hashable],
+    *,
+    window: float,
+    timestamp: T.Optional[T.Callable[[T.Union[K, L]], float]] = None,
+    **kwargs: T.Any,
+) -> "Observable[T.Tuple[K, L]]":
+    """Emit pairs of values, one of each source, with equal keys that arrived within a time window.
+
+    Arguments:
+        left: Observable whose values are the first element of each pair.
+        right: Observable whose values are the second element of each pair.
+        left_key: Function that extracts the join key of left values.
+        right_key: Function that extracts the join key of right values.
+        window: Maximum time, in seconds, between the two values of a pair.
+        timestamp: Function that extracts the event time of values, instead of using arrival time.
+        kwargs: Keyword parameters for :class:`~.combinators.Join`.
+
+    Returns:
+        Observable that emits the matched pairs.
+
+    """
+    # Project
+    from ..observables._internal.combinators import Join
+
+    return Join(left, right, left_key, right_key, window=window, timestamp=timestamp, **kwargs)
+
+
+__all__ = ("join",)
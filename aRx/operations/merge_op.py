@@ -0,0 +1,41 @@
+"""merge
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..protocols import ObservableProtocol
+    from ..observables import Observable
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+def merge(
+    *sources: "ObservableProtocol[K]", max_concurrent: T.Optional[int] = None, **kwargs: T.Any
+) -> "Observable[K]":
+    """Emit the data of all sources as it arrives, serving them in round-robin.
+
+    Arguments:
+        sources: Observables to be merged.
+        max_concurrent: Maximum amount of sources observed at the same time.
+        kwargs: Keyword parameters for :class:`~.combinators.Merge`.
+
+    Returns:
+        Observable that emits the merged data.
+
+    """
+    # Project
+    from ..observables._internal.combinators import Merge
+
+    return Merge(*sources, max_concurrent=max_concurrent, **kwargs)
+
+
+__all__ = ("merge",)
@@ -0,0 +1,45 @@
+"""merge_sorted
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..protocols import ObservableProtocol
+    from ..observables import Observable
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+def merge_sorted(
+    *sources: "ObservableProtocol[K]",
+    key: T.Optional[T.Callable[[K], T.Any]] = None,
+    buffer_size: int = 8,
+    **kwargs: T.Any,
+) -> "Observable[K]":
+    """Merge sources, whose data is individually sorted, into a single sorted data flow.
+
+    Arguments:
+        sources: Observables to be merged, each one must emit its data sorted.
+        key: Function that extracts the comparison key of each value.
+        buffer_size: Maximum amount of values buffered per source.
+        kwargs: Keyword parameters for :class:`~.combinators.MergeSorted`.
+
+    Returns:
+        Observable that emits the merged data.
+
+    """
+    # Project
+    from ..observables._internal.combinators import MergeSorted
+
+    return MergeSorted(*sources, key=key, buffer_size=buffer_size, **kwargs)
+
+
+__all__ = ("merge_sorted",)
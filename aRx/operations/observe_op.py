@@ -20,20 +20,34 @@ if T.TYPE_CHECKING:
 K = T.TypeVar("K")
 
 
-class observe(
-    T.Generic[K], T.Awaitable["ObserverProtocol[K]"], T.AsyncContextManager["ObserverProtocol[K]"]
-):
+class observe(T.Generic[K], T.Awaitable["ObserverProtocol[K]"]):
+    """Observation of an observable by an observer.
+
+    Observation starts when awaited or entered, and ends when disposed or exited.
+
+    .. Note::
+
+        With ``weak``, the observable only keeps a weak reference to the observer, so an observer
+        that is dropped without being closed stops being observed once garbage collected. It must be
+        supported by the observable, like :class:`~aRx.streams.MultiStream`, through the ``weak``
+        keyword parameter of ``__observe__``.
+    """
+
+    __slots__ = ("_weak", "_observer", "_keep_alive", "_observable")
+
     def __init__(
         self,
         observable: "ObservableProtocol[K]",
         observer: "ObserverProtocol[K]",
         *,
         keep_alive: T.Optional[bool] = None,
+        weak: bool = False,
         **kwargs: T.Any,
     ):
         super().__init__(**kwargs)  # type: ignore
 
         # Internal
+        self._weak = weak
         self._observer = observer
         self._observable = observable
         self._keep_alive = keep_alive
@@ -46,7 +60,10 @@ class observe(
 
     async def __aenter__(self) -> "ObserverProtocol[K]":
         try:
-            await self._observable.__observe__(self._observer)
+            if self._weak:
+                await self._observable.__observe__(self._observer, weak=True)  # type: ignore
+            else:
+                await self._observable.__observe__(self._observer)
         except Exception as exc:
             if not await self.__aexit__(type(exc), exc, exc.__traceback__):
                 raise
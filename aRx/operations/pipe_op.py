@@ -9,7 +9,7 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import typing as T
 
 # Project
-from .sink_op import sink
+from .sink_op import sink, chain
 from ..protocols import (
     ObserverProtocol,
     ObservableProtocol,
@@ -31,6 +31,8 @@ M = T.TypeVar("M")
 
 
 class pipe(observe[K], T.Generic[K, L]):
+    __slots__ = ("_previous", "_transformer")
+
     def __init__(
         self,
         observable: ObservableProtocol[K],
@@ -56,10 +58,8 @@ class pipe(observe[K], T.Generic[K, L]):
         return self._transformer
 
     async def __aenter__(self) -> TransformerProtocolWithOperators[K, L]:
-        await super().__aenter__()
-
-        if self._previous:
-            await self._previous.__aenter__()
+        for operation in chain(self):
+            await observe.__aenter__(operation)
 
         return self._transformer
 
@@ -69,7 +69,5 @@ class pipe(observe[K], T.Generic[K, L]):
         exc_value: T.Optional[BaseException],
         traceback: T.Optional["TracebackType"],
     ) -> None:
-        if self._previous is not None:
-            await self._previous.__aexit__(exc_type, exc_value, traceback)
-
-        await super().__aexit__(exc_type, exc_value, traceback)
+        for operation in reversed(chain(self)):
+            await observe.__aexit__(operation, exc_type, exc_value, traceback)
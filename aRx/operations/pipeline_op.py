@@ -0,0 +1,121 @@
+"""pipeline
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+# Project
+from .pipe_op import pipe
+from .sink_op import sink
+from ..protocols import TransformerProtocol, implements
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..protocols import ObserverProtocol, ObservableProtocol
+
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+
+class pipeline(T.Generic[K, L]):
+    """Reusable template of a chain of transformers.
+
+    Each instantiation creates new transformers, through the given factories, and links them
+    directly into a chain of pipes. So instances are as cheap as possible, skipping the per
+    operator checks done by ``|``.
+
+    .. Note::
+
+        Factories must return a new transformer on each call, as transformers can't be shared
+        between pipelines.
+    """
+
+    __slots__ = ("_factories", "_checked")
+
+    def __init__(self, *factories: T.Callable[[], TransformerProtocol[T.Any, T.Any]]) -> None:
+        """pipeline constructor.
+
+        Arguments:
+            factories: Functions, like transformer classes, that create each transformer.
+
+        """
+        assert factories
+
+        self._checked = False
+        self._factories = factories
+
+    def _instantiate(self, source: "ObservableProtocol[K]") -> "pipe[T.Any, L]":
+        previous: T.Optional[pipe[T.Any, T.Any]] = None
+        observable: "ObservableProtocol[T.Any]" = source
+
+        for factory in self._factories:
+            transformer = factory()
+
+            if not self._checked and not implements(transformer, TransformerProtocol):
+                raise TypeError(
+                    "Factories must create objects that implement the TransformerProtocol"
+                )
+
+            previous = pipe(observable, transformer, previous_pipe=previous)
+            observable = previous._transformer
+
+        # Only check the first instantiation, as factories are expected to always create the same
+        # kind of transformers
+        self._checked = True
+
+        return T.cast("pipe[T.Any, L]", previous)
+
+    @T.overload
+    def __call__(self, source: "ObservableProtocol[K]") -> "pipe[T.Any, L]":
+        ...
+
+    @T.overload
+    def __call__(
+        self, source: "ObservableProtocol[K]", observer: "ObserverProtocol[L]"
+    ) -> sink[L]:
+        ...
+
+    def __call__(
+        self, source: "ObservableProtocol[K]", observer: T.Optional["ObserverProtocol[L]"] = None
+    ) -> T.Union["pipe[T.Any, L]", sink[L]]:
+        """Instantiate the template.
+
+        Arguments:
+            source: Observable whose data flows through the chain.
+            observer: Observer of the chain output.
+
+        Returns:
+            Last pipe of the chain, or a sink into the observer when it is given.
+
+        """
+        last = self._instantiate(source)
+        return last if observer is None else sink(last._transformer, observer, previous_pipe=last)
+
+    def many(
+        self,
+        sources: T.Iterable["ObservableProtocol[K]"],
+        observers: T.Optional[T.Iterable["ObserverProtocol[L]"]] = None,
+    ) -> T.List[T.Union["pipe[T.Any, L]", sink[L]]]:
+        """Instantiate the template in bulk.
+
+        Arguments:
+            sources: Observables whose data flows through each chain.
+            observers: Observers of each chain output, paired with sources.
+
+        Returns:
+            List of instances, in the order of sources.
+
+        """
+        if observers is None:
+            return [self(source) for source in sources]
+
+        return [self(source, observer) for source, observer in zip(sources, observers)]
+
+
+__all__ = ("pipeline",)
@@ -24,7 +24,29 @@ if T.TYPE_CHECKING:
 K = T.TypeVar("K")
 
 
+def chain(operation: "T.Union[sink[T.Any], pipe[T.Any, T.Any]]") -> T.List[observe[T.Any]]:
+    """Flatten a chain of pipe operations, linked through their previous pipe.
+
+    Arguments:
+        operation: Last operation of the chain.
+
+    Returns:
+        Operations, from the last one to the first one.
+
+    """
+    operations: T.List[observe[T.Any]] = []
+
+    current: T.Optional[T.Union[sink[T.Any], pipe[T.Any, T.Any]]] = operation
+    while current is not None:
+        operations.append(current)
+        current = current._previous
+
+    return operations
+
+
 class sink(observe[K]):
+    __slots__ = ("_previous",)
+
     def __init__(
         self,
         observable: "ObservableProtocol[K]",
@@ -39,10 +61,10 @@ class sink(observe[K]):
         self._previous = previous_pipe
 
     async def __aenter__(self) -> "ObserverProtocol[K]":
-        await super().__aenter__()
-
-        if self._previous:
-            await self._previous.__aenter__()
+        # Observe from the last operation to the first one, so data only starts flowing when the
+        # whole chain is connected
+        for operation in chain(self):
+            await observe.__aenter__(operation)
 
         return self._observer
 
@@ -52,7 +74,5 @@ class sink(observe[K]):
         exc_value: T.Optional[BaseException],
         traceback: T.Optional["TracebackType"],
     ) -> None:
-        if self._previous is not None:
-            await self._previous.__aexit__(exc_type, exc_value, traceback)
-
-        await super().__aexit__(exc_type, exc_value, traceback)
+        for operation in reversed(chain(self)):
+            await observe.__aexit__(operation, exc_type, exc_value, traceback)
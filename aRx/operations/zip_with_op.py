@@ -0,0 +1,38 @@
+"""zip_with
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..protocols import ObservableProtocol
+    from ..observables import Observable
+
+
+def zip_with(
+    *sources: "ObservableProtocol[T.Any]", **kwargs: T.Any
+) -> "Observable[T.Tuple[T.Any, ...]]":
+    """Emit tuples with the n-th value of each source.
+
+    Named ``zip_with`` so it doesn't shadow the :func:`zip` builtin.
+
+    Arguments:
+        sources: Observables to be zipped.
+        kwargs: Keyword parameters for :class:`~.combinators.Zip`.
+
+    Returns:
+        Observable that emits the zipped data.
+
+    """
+    # Project
+    from ..observables._internal.combinators import Zip
+
+    return Zip(*sources, **kwargs)
+
+
+__all__ = ("zip_with",)
@@ -40,4 +40,18 @@ from .skip import Skip
 from .stop import Stop
 from .take import Take
 from .filter import Filter
+from .sample import Sample
+from .reorder import Reorder
+from .conflate import Conflate
+from .debounce import Debounce
+from .distinct import Distinct, DistinctUntilChanged
+from .flat_map import FlatMap, ConcatMap, SwitchMap
+from .group_by import GroupBy
+from .throttle import Throttle
 from .assertion import Assert
+from .reservoir import Reservoir, SampleByKey
+from .audit_time import AuditTime
+from .approximate import HeavyHitters, CountMinSketch, ApproxCountDistinct
+from .parallel_map import ParallelMap
+from .process_stage import ProcessStage
+from .sliding_window import SlidingWindowAggregate
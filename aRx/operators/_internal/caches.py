@@ -0,0 +1,185 @@
+"""Caches
+
+Bounded mappings used to memoize operators results.
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from collections import OrderedDict
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L", contravariant=True)
+
+MISSING: T.Final = object()
+
+
+class Cache(T.Protocol[L]):
+    def get(self, key: T.Hashable, now: float) -> T.Union[L, object]:
+        """Retrieve a cached value.
+
+        Arguments:
+            key: Key of the cached value.
+            now: Current time, in seconds.
+
+        Returns:
+            Cached value, or :data:`MISSING`.
+
+        """
+        ...
+
+    def set(self, key: T.Hashable, value: L, now: float) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+
+class LRUCache(T.Generic[K]):
+    """Cache that evicts the least recently used value when full."""
+
+    __slots__ = ("_data", "_maxsize")
+
+    def __init__(self, maxsize: int) -> None:
+        assert maxsize > 0
+
+        self._data: "OrderedDict[T.Hashable, K]" = OrderedDict()
+        self._maxsize = maxsize
+
+    def get(self, key: T.Hashable, _: float) -> T.Union[K, object]:
+        value = self._data.get(key, MISSING)
+        if value is not MISSING:
+            self._data.move_to_end(key)
+
+        return value
+
+    def set(self, key: T.Hashable, value: K, _: float) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TTLCache(T.Generic[K]):
+    """LRU cache whose values also expire ``ttl`` seconds after being set."""
+
+    __slots__ = ("_ttl", "_data", "_maxsize")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        assert maxsize > 0
+        assert ttl > 0
+
+        self._ttl = ttl
+        self._data: "OrderedDict[T.Hashable, T.Tuple[float, K]]" = OrderedDict()
+        self._maxsize = maxsize
+
+    def get(self, key: T.Hashable, now: float) -> T.Union[K, object]:
+        entry = self._data.get(key, None)
+        if entry is None:
+            return MISSING
+
+        expires, value = entry
+        if expires <= now:
+            del self._data[key]
+            return MISSING
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: T.Hashable, value: K, now: float) -> None:
+        self._data[key] = (now + self._ttl, value)
+        self._data.move_to_end(key)
+
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class LFUCache(T.Generic[K]):
+    """Cache that evicts the least frequently used value when full.
+
+    Ties are broken by evicting the least recently used value. All operations are O(1).
+    """
+
+    __slots__ = ("_data", "_maxsize", "_buckets", "_min_count")
+
+    def __init__(self, maxsize: int) -> None:
+        assert maxsize > 0
+
+        # Key -> (use count, value)
+        self._data: T.Dict[T.Hashable, T.Tuple[int, K]] = {}
+        self._maxsize = maxsize
+        # Use count -> Keys with that use count, in usage order
+        self._buckets: T.Dict[int, "OrderedDict[T.Hashable, None]"] = {}
+        self._min_count = 0
+
+    def _touch(self, key: T.Hashable, count: int) -> int:
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+
+        count += 1
+        self._buckets.setdefault(count, OrderedDict())[key] = None
+
+        return count
+
+    def get(self, key: T.Hashable, _: float) -> T.Union[K, object]:
+        entry = self._data.get(key, None)
+        if entry is None:
+            return MISSING
+
+        count, value = entry
+        self._data[key] = (self._touch(key, count), value)
+
+        return value
+
+    def set(self, key: T.Hashable, value: K, _: float) -> None:
+        entry = self._data.get(key, None)
+        if entry is not None:
+            self._data[key] = (self._touch(key, entry[0]), value)
+            return
+
+        if len(self._data) >= self._maxsize:
+            bucket = self._buckets[self._min_count]
+            evicted = bucket.popitem(last=False)[0]
+            if not bucket:
+                del self._buckets[self._min_count]
+
+            del self._data[evicted]
+
+        self._data[key] = (1, value)
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+__all__ = ("MISSING", "Cache", "LRUCache", "LFUCache", "TTLCache")
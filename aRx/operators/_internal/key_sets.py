@@ -0,0 +1,135 @@
+"""KeySets
+
+Membership structures used to remember which keys were already seen by an operator.
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from math import log, ceil
+from collections import OrderedDict
+
+# Arbitrary constant used to derive a second, independent, hash from a key hash
+_SALT: T.Final = 0x9E3779B97F4A7C15
+
+
+class KeySet(T.Protocol):
+    def add(self, key: T.Hashable, now: float) -> bool:
+        """Register key as seen.
+
+        Arguments:
+            key: Key to be registered.
+            now: Current time, in seconds.
+
+        Returns:
+            Whether the key wasn't seen before.
+
+        """
+        ...
+
+    def clear(self) -> None:
+        ...
+
+
+class UnboundedKeySet:
+    """Exact key set, memory grows with the number of distinct keys."""
+
+    __slots__ = ("_keys",)
+
+    def __init__(self) -> None:
+        self._keys: T.Set[T.Hashable] = set()
+
+    def add(self, key: T.Hashable, _: float) -> bool:
+        size = len(self._keys)
+        self._keys.add(key)
+        return len(self._keys) != size
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+
+class LRUKeySet:
+    """Exact key set that only remembers the ``capacity`` most recently seen keys.
+
+    Keys that were not seen for more than ``ttl`` seconds are forgotten as well.
+    """
+
+    __slots__ = ("_ttl", "_keys", "_capacity")
+
+    def __init__(self, capacity: int, ttl: T.Optional[float] = None) -> None:
+        assert capacity > 0
+        assert ttl is None or ttl > 0
+
+        self._ttl = ttl
+        self._keys: "OrderedDict[T.Hashable, float]" = OrderedDict()
+        self._capacity = capacity
+
+    def add(self, key: T.Hashable, now: float) -> bool:
+        keys = self._keys
+
+        if self._ttl is not None:
+            # Keys are ordered by last access, so expired ones are always at the start
+            limit = now - self._ttl
+            while keys and next(iter(keys.values())) <= limit:
+                keys.popitem(last=False)
+
+        is_new = key not in keys
+        if not is_new:
+            keys.move_to_end(key)
+
+        keys[key] = now
+
+        if len(keys) > self._capacity:
+            keys.popitem(last=False)
+
+        return is_new
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+
+class BloomKeySet:
+    """Approximate key set backed by a Bloom filter.
+
+    Memory is fixed by ``capacity`` and ``error_rate``. New keys may be wrongly reported as seen
+    with probability ``error_rate`` while less than ``capacity`` keys were added, but seen keys are
+    never reported as new.
+    """
+
+    __slots__ = ("_bits", "_size", "_hashes")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        assert capacity > 0
+        assert 0 < error_rate < 1
+
+        self._size = ceil(-capacity * log(error_rate) / (log(2) ** 2))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._hashes = max(1, round(self._size / capacity * log(2)))
+
+    def add(self, key: T.Hashable, _: float) -> bool:
+        bits = self._bits
+        size = self._size
+        is_new = False
+
+        # Double hashing: derive all bit positions from two hashes of the key
+        first = hash(key)
+        second = hash((first, _SALT)) | 1
+
+        for index in range(self._hashes):
+            position = (first + index * second) % size
+            mask = 1 << (position & 7)
+            position >>= 3
+            if not bits[position] & mask:
+                is_new = True
+                bits[position] |= mask
+
+        return is_new
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+
+
+__all__ = ("KeySet", "LRUKeySet", "BloomKeySet", "UnboundedKeySet")
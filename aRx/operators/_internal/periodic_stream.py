@@ -0,0 +1,90 @@
+"""PeriodicStream
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from abc import abstractmethod
+from asyncio import get_running_loop
+
+# Project
+from .timer_stream import TimerStream
+
+if T.TYPE_CHECKING:
+    # Project
+    from ...namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+
+class PeriodicStream(TimerStream[K, L]):
+    """Base for operators that accumulate the values received and emit a summary of them.
+
+    The summary is emitted on close or, when ``interval`` is given, ``interval`` seconds after the
+    first value received since the previous emission.
+    """
+
+    __slots__ = ("_interval", "_namespace")
+
+    def __init__(self, *, interval: T.Optional[float] = None, **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        assert interval is None or interval > 0
+
+        self._interval = interval
+        self._namespace: T.Optional["Namespace"] = None
+
+    @abstractmethod
+    def _add(self, value: L) -> None:
+        """Accumulate value.
+
+        Arguments:
+            value: Value received.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _summary(self) -> T.Optional[K]:
+        """Compute value emitted from the values accumulated.
+
+        Returns:
+            Value to be emitted, or None when there is nothing to emit.
+
+        """
+        raise NotImplementedError
+
+    def _stage(self) -> None:
+        namespace = self._namespace
+        if namespace is None:
+            return
+
+        self._namespace = None
+        summary = self._summary()
+        if summary is not None:
+            self._pending = (summary, namespace)
+
+    def _fire(self, _: float) -> None:
+        self._stage()
+        self._emit_pending()
+
+    async def _asend(self, value: L, namespace: "Namespace") -> None:
+        self._add(value)
+
+        if self._namespace is None and self._interval is not None:
+            self._schedule(get_running_loop().time() + self._interval)
+
+        self._namespace = namespace
+
+    async def _aclose(self) -> None:
+        self._stage()
+        await super()._aclose()
+
+
+__all__ = ("PeriodicStream",)
@@ -0,0 +1,82 @@
+"""ReservoirSampler
+
+Fixed size uniform random sample of an unbounded sequence of values.
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from math import exp, log, floor
+from random import Random
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class ReservoirSampler(T.Generic[K]):
+    """Reservoir sampling through Algorithm L.
+
+    Instead of drawing a random number per value, draws how many values to skip until the next one
+    that enters the sample. So most values cost a single counter decrement.
+
+    .. Note::
+
+        Li, Kim-Hung. Reservoir-Sampling Algorithms of Time Complexity O(n(1 + log(N/n))).
+        ACM Transactions on Mathematical Software, 20(4), 1994.
+    """
+
+    __slots__ = ("_k", "_w", "_skip", "_random", "sample")
+
+    def __init__(self, k: int, random: Random) -> None:
+        assert k > 0
+
+        self._k = k
+        self._w = 1.0
+        self._skip = 0
+        self._random = random
+        self.sample: T.List[K] = []
+
+    def _uniform(self) -> float:
+        # Open interval (0, 1), so neither log nor the skip computation can fail
+        value = 0.0
+        while value == 0.0:
+            value = self._random.random()
+
+        return value
+
+    def _draw(self) -> None:
+        self._w *= exp(log(self._uniform()) / self._k)
+        self._skip = floor(log(self._uniform()) / log(1 - self._w))
+
+    def add(self, value: K) -> None:
+        if self._skip > 0:
+            self._skip -= 1
+            return
+
+        if len(self.sample) < self._k:
+            self.sample.append(value)
+            if len(self.sample) == self._k:
+                self._draw()
+        else:
+            self.sample[self._random.randrange(self._k)] = value
+            self._draw()
+
+    def reset(self) -> T.List[K]:
+        """Restart sampling.
+
+        Returns:
+            The sample taken so far.
+
+        """
+        sample = self.sample
+        self._w = 1.0
+        self._skip = 0
+        self.sample = []
+
+        return sample
+
+
+__all__ = ("ReservoirSampler",)
@@ -0,0 +1,49 @@
+"""ResumableSlice
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class ResumableSlice(T.Iterator[K]):
+    """Equivalent of :func:`itertools.islice` that keeps working after its iterator raises.
+
+    Used by fused operators, whose errors must not end the whole fused chain.
+    """
+
+    __slots__ = ("_skip", "_iterator", "_remaining")
+
+    def __init__(self, iterator: T.Iterator[K], skip: int, take: T.Optional[int] = None) -> None:
+        assert skip >= 0
+        assert take is None or take >= 0
+
+        self._skip = skip
+        self._iterator = iterator
+        self._remaining = take
+
+    def __next__(self) -> K:
+        # Counters are only updated after the iterator succeeds, so no value is lost on errors
+        while self._skip > 0:
+            next(self._iterator)
+            self._skip -= 1
+
+        if self._remaining is None:
+            return next(self._iterator)
+
+        if self._remaining <= 0:
+            raise StopIteration
+
+        value = next(self._iterator)
+        self._remaining -= 1
+
+        return value
+
+
+__all__ = ("ResumableSlice",)
@@ -0,0 +1,327 @@
+"""Shared Ring
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import os
+import pickle
+import struct
+import typing as T
+from asyncio import get_running_loop
+from multiprocessing import Pipe
+from multiprocessing.shared_memory import SharedMemory
+
+if T.TYPE_CHECKING:
+    # Internal
+    from multiprocessing.connection import Connection
+
+# Indexes are kept in distinct cache lines, so producer and consumer don't contend for them
+_HEAD = 0
+_TAIL = 64
+_HEADER_SIZE = 128
+
+_LENGTH = struct.Struct("<Q")
+_FRAME_HEADER = struct.Struct("<BI")
+
+
+class SharedRing:
+    """Ring buffer of variable sized frames, in shared memory, for a single producer and consumer.
+
+    The producer only writes the head index and the consumer only writes the tail index, both of
+    which grow monotonically, so no lock is required between processes.
+    """
+
+    __slots__ = ("_shm", "_data", "_index", "_owner", "_capacity")
+
+    def __init__(self, capacity: int, name: T.Optional[str] = None) -> None:
+        """SharedRing constructor.
+
+        Arguments:
+            capacity: Size, in bytes, of the ring data.
+            name: Name of an existing ring shared memory, to attach to instead of creating one.
+
+        """
+        assert capacity > _LENGTH.size
+
+        self._shm = (
+            SharedMemory(create=True, size=_HEADER_SIZE + capacity)
+            if name is None
+            else SharedMemory(name)
+        )
+        buf = self._shm.buf
+        assert buf is not None
+
+        self._data = buf[_HEADER_SIZE : _HEADER_SIZE + capacity]
+        self._index = buf[:_HEADER_SIZE].cast("Q")
+        # Forked processes inherit the ring, but only the creator process removes it
+        self._owner = os.getpid() if name is None else None
+        self._capacity = capacity
+
+        if name is None:
+            self._index[_HEAD // 8] = 0
+            self._index[_TAIL // 8] = 0
+
+    def __reduce__(self) -> T.Tuple[T.Any, ...]:
+        # Other processes attach to the same shared memory
+        return type(self), (self._capacity, self._shm.name)
+
+    def _copy_in(self, position: int, data: T.Union[bytes, memoryview]) -> None:
+        view = memoryview(data).cast("B")
+        start = position % self._capacity
+        first = min(len(view), self._capacity - start)
+
+        self._data[start : start + first] = view[:first]
+        if first < len(view):
+            self._data[: len(view) - first] = view[first:]
+
+    def _copy_out(self, position: int, target: bytearray) -> None:
+        view = memoryview(target)
+        start = position % self._capacity
+        first = min(len(view), self._capacity - start)
+
+        view[:first] = self._data[start : start + first]
+        if first < len(view):
+            view[first:] = self._data[: len(view) - first]
+
+    def try_write(self, parts: T.Sequence[T.Union[bytes, memoryview]]) -> bool:
+        """Write a frame, composed of the concatenation of parts, if there is space for it.
+
+        Raises:
+            ValueError: When the frame can never fit the ring.
+
+        Returns:
+            Whether the frame was written.
+
+        """
+        size = sum(memoryview(part).nbytes for part in parts)
+        total = _LENGTH.size + size
+        if total > self._capacity:
+            raise ValueError(f"Frame of {total} bytes exceeds ring capacity of {self._capacity}")
+
+        head = self._index[_HEAD // 8]
+        if self._capacity - (head - self._index[_TAIL // 8]) < total:
+            return False
+
+        self._copy_in(head, _LENGTH.pack(size))
+        position = head + _LENGTH.size
+        for part in parts:
+            self._copy_in(position, part)
+            position += memoryview(part).nbytes
+
+        # Publish frame only after it is fully written
+        self._index[_HEAD // 8] = head + total
+
+        return True
+
+    def try_read(self) -> T.Optional[bytearray]:
+        """Read a copy of the oldest frame, if any.
+
+        Returns:
+            Frame data, or None when the ring is empty.
+
+        """
+        tail = self._index[_TAIL // 8]
+        if self._index[_HEAD // 8] == tail:
+            return None
+
+        length = bytearray(_LENGTH.size)
+        self._copy_out(tail, length)
+        (size,) = _LENGTH.unpack(length)
+
+        frame = bytearray(size)
+        self._copy_out(tail + _LENGTH.size, frame)
+
+        # Release frame space only after it is fully read
+        self._index[_TAIL // 8] = tail + _LENGTH.size + size
+
+        return frame
+
+    def close(self) -> None:
+        """Detach from the shared memory, removing it when this is the ring creator."""
+        self._data.release()
+        self._index.release()
+        self._shm.close()
+
+        if self._owner == os.getpid():
+            self._shm.unlink()
+
+
+def encode(kind: int, obj: T.Any) -> T.List[T.Union[bytes, memoryview]]:
+    """Serialize an object into frame parts, through pickle protocol 5.
+
+    Buffers of objects that support out-of-band pickling, like bytearrays or numpy arrays, aren't
+    copied into the pickle data, but referenced as distinct parts.
+    """
+    buffers: T.List[pickle.PickleBuffer] = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+
+    return [
+        _FRAME_HEADER.pack(kind, len(raws)),
+        struct.pack(f"<{len(raws) + 1}Q", len(data), *(raw.nbytes for raw in raws)),
+        data,
+        *raws,
+    ]
+
+
+def decode(frame: bytearray) -> T.Tuple[int, T.Any]:
+    """Deserialize a frame created from parts given by :func:`encode`.
+
+    Out-of-band buffers are views of the frame, so objects rebuilt from them, like numpy arrays,
+    don't need to copy them again.
+    """
+    view = memoryview(frame)
+    kind, amount = _FRAME_HEADER.unpack_from(view)
+    offset = _FRAME_HEADER.size
+    sizes = struct.unpack_from(f"<{amount + 1}Q", view, offset)
+    offset += 8 * (amount + 1)
+
+    parts = []
+    for size in sizes:
+        parts.append(view[offset : offset + size])
+        offset += size
+
+    return kind, pickle.loads(parts[0], buffers=parts[1:])
+
+
+def _ring(fd: int) -> None:
+    try:
+        os.write(fd, b"\0")
+    except BlockingIOError:
+        # Pipe is full, so the other side was already signaled
+        pass
+
+
+def _drain(fd: int) -> None:
+    try:
+        while os.read(fd, 4096):
+            pass
+    except BlockingIOError:
+        pass
+
+
+async def _readable(fd: int, sentinel: T.Optional[int]) -> bool:
+    """Wait for fd, or sentinel, to be readable.
+
+    Returns:
+        Whether the sentinel is readable.
+
+    """
+    loop = get_running_loop()
+    future = loop.create_future()
+
+    def wakeup(result: bool) -> None:
+        if not future.done():
+            future.set_result(result)
+
+    loop.add_reader(fd, wakeup, False)
+    if sentinel is not None:
+        loop.add_reader(sentinel, wakeup, True)
+
+    try:
+        return T.cast(bool, await future)
+    finally:
+        loop.remove_reader(fd)
+        if sentinel is not None:
+            loop.remove_reader(sentinel)
+
+
+class Channel:
+    """Frames flowing from one process to another through a :class:`SharedRing`.
+
+    Pipes are used as doorbells, to wake up the consumer when frames are written and the producer
+    when space is released, so both sides can wait from an event loop.
+    """
+
+    __slots__ = ("_ring", "_data_r", "_data_w", "_space_r", "_space_w")
+
+    def __init__(self, capacity: int) -> None:
+        """Channel constructor.
+
+        Arguments:
+            capacity: Size, in bytes, of the ring data.
+
+        """
+        self._ring = SharedRing(capacity)
+        self._data_r, self._data_w = Pipe(duplex=False)
+        self._space_r, self._space_w = Pipe(duplex=False)
+
+        for connection in self._connections:
+            os.set_blocking(connection.fileno(), False)
+
+    @property
+    def _connections(self) -> T.Tuple["Connection", ...]:
+        return self._data_r, self._data_w, self._space_r, self._space_w
+
+    async def send(self, kind: int, obj: T.Any, sentinel: T.Optional[int] = None) -> None:
+        """Send a frame, waiting for space in the ring.
+
+        Arguments:
+            kind: Frame type.
+            obj: Object to be sent.
+            sentinel: File descriptor that is readable when the consumer process exits.
+
+        Raises:
+            BrokenPipeError: When the consumer process exits while waiting.
+
+        """
+        parts = encode(kind, obj)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del obj
+
+        if not self._ring.try_write(parts):
+            space = self._space_r.fileno()
+            while True:
+                _drain(space)
+                if self._ring.try_write(parts):
+                    break
+
+                if await _readable(space, sentinel):
+                    raise BrokenPipeError("Consumer process exited")
+
+        _ring(self._data_w.fileno())
+
+    async def recv(self, sentinel: T.Optional[int] = None) -> T.Tuple[int, T.Any]:
+        """Receive a frame, waiting for one to be available.
+
+        Arguments:
+            sentinel: File descriptor that is readable when the producer process exits.
+
+        Raises:
+            BrokenPipeError: When the producer process exits without further frames.
+
+        Returns:
+            Frame type and object.
+
+        """
+        frame = self._ring.try_read()
+        if frame is None:
+            exited = False
+            data = self._data_r.fileno()
+            while True:
+                _drain(data)
+                frame = self._ring.try_read()
+                if frame is not None:
+                    break
+
+                if exited:
+                    raise BrokenPipeError("Producer process exited")
+
+                exited = await _readable(data, sentinel)
+
+        _ring(self._space_w.fileno())
+
+        return decode(frame)
+
+    def close(self) -> None:
+        """Release channel resources in this process."""
+        self._ring.close()
+        for connection in self._connections:
+            connection.close()
+
+
+__all__ = ("Channel", "SharedRing", "encode", "decode")
@@ -0,0 +1,288 @@
+"""Sketches
+
+Fixed size probabilistic summaries of unbounded sequences of values. Sketches with the same
+parameters can be merged, so partitions of a stream can be summarized independently.
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from math import log
+from array import array
+from hashlib import blake2b
+from operator import add
+from collections import OrderedDict
+
+# Generic Types
+K = T.TypeVar("K")
+
+_MASK_64: T.Final = (1 << 64) - 1
+
+
+def hash128(value: T.Any) -> int:
+    """Stable 128 bits hash of a value.
+
+    Unlike :func:`hash`, it doesn't change between processes, which is required for sketches of
+    distinct processes to be merged. The value type is part of the hashed data, so values of
+    distinct types with the same representation (e.g.: ``1`` and ``"1"``) don't collide.
+
+    Arguments:
+        value: Bytes, str or any value with a deterministic :func:`repr`.
+
+    Returns:
+        Hash as an integer.
+
+    """
+    if isinstance(value, str):
+        data = value.encode()
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        data = bytes(value)
+    else:
+        data = repr(value).encode()
+
+    kind = type(value)
+    digest = blake2b(f"{kind.__module__}.{kind.__qualname__}".encode(), digest_size=16)
+    # Separator can't appear in a type name, so type and data can't be confused
+    digest.update(b"\0")
+    digest.update(data)
+
+    return int.from_bytes(digest.digest(), "little")
+
+
+class HyperLogLog:
+    """Estimate the amount of distinct values added.
+
+    Uses ``2 ** precision`` one byte registers, with a standard error of about
+    ``1.04 / sqrt(2 ** precision)``.
+    """
+
+    __slots__ = ("_precision", "registers")
+
+    def __init__(self, precision: int = 14) -> None:
+        assert 4 <= precision <= 18
+
+        self._precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value: T.Any) -> None:
+        hashed = hash128(value) & _MASK_64
+        width = 64 - self._precision
+        index = hashed >> width
+        # Position of the leftmost 1 bit in the remaining bits
+        rank = width - (hashed & ((1 << width) - 1)).bit_length() + 1
+
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def estimate(self) -> int:
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0**-register for register in self.registers)
+
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            # Small range correction through linear counting
+            estimate = size * log(size / zeros)
+
+        return round(estimate)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other._precision != self._precision:
+            raise ValueError("Can't merge HyperLogLog sketches with distinct precision")
+
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def copy(self) -> "HyperLogLog":
+        sketch = HyperLogLog(self._precision)
+        sketch.registers[:] = self.registers
+        return sketch
+
+
+class CountMin:
+    """Estimate how many times each value was added.
+
+    Estimates are never lower than the true count, and exceed it by at most ``e / width`` times
+    the total count with probability ``1 - exp(-depth)``.
+    """
+
+    __slots__ = ("_width", "_depth", "counters", "total")
+
+    def __init__(self, width: int = 2048, depth: int = 4) -> None:
+        assert width > 0
+        assert depth > 0
+
+        self._width = width
+        self._depth = depth
+        self.total = 0
+        self.counters = array("Q", bytes(8 * width * depth))
+
+    def _indexes(self, value: T.Any) -> T.Iterator[int]:
+        # Double hashing, derive depth hashes from two independent 64 bits hashes
+        hashed = hash128(value)
+        first, second = hashed & _MASK_64, hashed >> 64
+
+        for row in range(self._depth):
+            yield row * self._width + (first + row * second) % self._width
+
+    def add(self, value: T.Any, count: int = 1) -> None:
+        counters = self.counters
+        for index in self._indexes(value):
+            counters[index] += count
+
+        self.total += count
+
+    def estimate(self, value: T.Any) -> int:
+        counters = self.counters
+        return min(counters[index] for index in self._indexes(value))
+
+    def merge(self, other: "CountMin") -> None:
+        if other._width != self._width or other._depth != self._depth:
+            raise ValueError("Can't merge CountMin sketches with distinct dimensions")
+
+        self.counters = array("Q", map(add, self.counters, other.counters))
+        self.total += other.total
+
+    def copy(self) -> "CountMin":
+        sketch = CountMin(self._width, self._depth)
+        sketch.counters[:] = self.counters
+        sketch.total = self.total
+        return sketch
+
+
+class SpaceSaving(T.Generic[K]):
+    """Track the ``k`` most frequent values added.
+
+    Each tracked value count exceeds its true count by at most its error, and any value whose true
+    count is above ``total / k`` is tracked. Values are kept in buckets by count, so adding with
+    unit counts is O(1).
+    """
+
+    __slots__ = ("_k", "_counts", "_errors", "_buckets", "_min_count", "total")
+
+    def __init__(self, k: int) -> None:
+        assert k > 0
+
+        self._k = k
+        self.total = 0
+        # Value -> count
+        self._counts: T.Dict[K, int] = {}
+        # Value -> overestimation of its count
+        self._errors: T.Dict[K, int] = {}
+        # Count -> Values with that count, in arrival order
+        self._buckets: T.Dict[int, "OrderedDict[K, None]"] = {}
+        self._min_count = 0
+
+    def _insert(self, value: K, count: int, error: int) -> None:
+        self._counts[value] = count
+        self._errors[value] = error
+        self._buckets.setdefault(count, OrderedDict())[value] = None
+
+        if len(self._counts) == 1 or count < self._min_count:
+            self._min_count = count
+
+    def _remove(self, value: K) -> int:
+        count = self._counts.pop(value)
+        del self._errors[value]
+
+        bucket = self._buckets[count]
+        del bucket[value]
+        if not bucket:
+            del self._buckets[count]
+
+        return count
+
+    def _update_min_count(self, removed: int, inserted: int) -> None:
+        # Called after a value with count ``removed`` is removed, right before a value with count
+        # ``inserted`` is inserted
+        if removed != self._min_count or removed in self._buckets:
+            return
+
+        if inserted - removed == 1 or not self._buckets:
+            # No bucket can exist between removed and inserted counts
+            self._min_count = inserted
+        else:
+            self._min_count = min(min(self._buckets), inserted)
+
+    def _reset(self) -> None:
+        self.total = 0
+        self._counts.clear()
+        self._errors.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+    def add(self, value: K, count: int = 1) -> None:
+        assert count > 0
+
+        self.total += count
+
+        if value in self._counts:
+            error = self._errors[value]
+            previous = self._remove(value)
+            self._update_min_count(previous, previous + count)
+            self._insert(value, previous + count, error)
+            return
+
+        if len(self._counts) < self._k:
+            self._insert(value, count, 0)
+            return
+
+        # Replace value with the lowest count, the new value inherits its count as error
+        minimum = self._min_count
+        evicted = next(iter(self._buckets[minimum]))
+        self._remove(evicted)
+        self._update_min_count(minimum, minimum + count)
+        self._insert(value, minimum + count, minimum)
+
+    def top(self, n: T.Optional[int] = None) -> T.List[T.Tuple[K, int, int]]:
+        """Most frequent values.
+
+        Arguments:
+            n: Maximum amount of values returned, defaults to ``k``.
+
+        Returns:
+            List of ``(value, count, error)``, in descending count order.
+
+        """
+        items = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+        return [(value, count, self._errors[value]) for value, count in items[:n]]
+
+    def merge(self, other: "SpaceSaving[K]") -> None:
+        if other._k != self._k:
+            raise ValueError("Can't merge SpaceSaving sketches with distinct sizes")
+
+        # Values untracked by a full sketch may have any count up to its minimum
+        own_floor = self._min_count if len(self._counts) >= self._k else 0
+        other_floor = other._min_count if len(other._counts) >= other._k else 0
+
+        merged = []
+        for value in self._counts.keys() | other._counts.keys():
+            merged.append(
+                (
+                    self._counts.get(value, own_floor) + other._counts.get(value, other_floor),
+                    self._errors.get(value, own_floor) + other._errors.get(value, other_floor),
+                    value,
+                )
+            )
+
+        merged.sort(key=lambda item: item[0], reverse=True)
+
+        total = self.total + other.total
+        self._reset()
+        self.total = total
+        for count, error, value in merged[: self._k]:
+            self._insert(value, count, error)
+
+    def copy(self) -> "SpaceSaving[K]":
+        sketch: SpaceSaving[K] = SpaceSaving(self._k)
+        sketch.total = self.total
+        sketch._counts.update(self._counts)
+        sketch._errors.update(self._errors)
+        sketch._buckets.update((count, bucket.copy()) for count, bucket in self._buckets.items())
+        sketch._min_count = self._min_count
+        return sketch
+
+
+__all__ = ("hash128", "CountMin", "HyperLogLog", "SpaceSaving")
@@ -0,0 +1,131 @@
+"""TimerStream
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from abc import abstractmethod
+from asyncio import Task, TimerHandle, get_running_loop
+
+# External
+from async_tools.abstract import AsyncABCMeta
+
+# Project
+from ...errors import ObserverClosedError
+from ...streams.single_stream import SingleStreamBase
+
+if T.TYPE_CHECKING:
+    # Project
+    from ...namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+
+class TimerStream(SingleStreamBase[K, L], metaclass=AsyncABCMeta):
+    """Base for operators that hold a pending value and emit it from a loop timer.
+
+    Only a single timer handle is kept scheduled per operator, and emissions triggered by it are
+    chained one after the other, so their order is kept. Any pending value is emitted on close, unless
+    the operator isn't observed by then.
+    """
+
+    __slots__ = ("_timer", "_pending", "_emission")
+
+    def __init__(self, **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        # Internal
+        self._timer: T.Optional[TimerHandle] = None
+        self._pending: T.Optional[T.Tuple[K, "Namespace"]] = None
+        self._emission: T.Optional["Task[None]"] = None
+
+    def _schedule(self, when: float) -> None:
+        if self._timer is None:
+            self._timer = get_running_loop().call_at(when, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._fire(get_running_loop().time())
+
+    @abstractmethod
+    def _fire(self, now: float) -> None:
+        """Handle scheduled timer expiration.
+
+        Arguments:
+            now: Loop time when the timer expired.
+
+        """
+        raise NotImplementedError
+
+    def _emit_pending(self) -> bool:
+        """Emit pending value, if any, after any ongoing timed emission.
+
+        Returns:
+            Whether there was a pending value.
+
+        """
+        if self._pending is None:
+            return False
+
+        value, namespace = self._pending
+        self._pending = None
+        self._emission = get_running_loop().create_task(
+            self._emit(value, namespace, self._emission)
+        )
+
+        return True
+
+    async def _emit(
+        self, value: K, namespace: "Namespace", previous: T.Optional["Task[None]"]
+    ) -> None:
+        if previous is not None:
+            await previous
+
+        try:
+            await super()._asend(T.cast(L, value), namespace)
+        except Exception as exc:
+            if not self.closed:
+                await self.athrow(exc, namespace)
+            elif not isinstance(exc, ObserverClosedError):
+                get_running_loop().call_exception_handler(
+                    {
+                        "message": f"{self}: Failed to emit pending value on close",
+                        "exception": exc,
+                    }
+                )
+
+    async def _wait_emission(self) -> None:
+        """Wait any ongoing timed emission, so direct emissions don't overtake it."""
+        if self._emission is not None:
+            await self._emission
+
+    async def _asend_impl(self, value: L) -> K:
+        # Values reach SingleStreamBase._asend already in their output form
+        return T.cast(K, value)
+
+    async def _aclose(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._observer is None:
+            # Nobody will ever receive the pending value, so drop it and release any emission
+            # still waiting for an observer
+            self._pending = None
+            if not self._lock.done():
+                self._lock.set_exception(ObserverClosedError(self))
+        else:
+            self._emit_pending()
+
+        await self._wait_emission()
+
+        await super()._aclose()
+
+
+__all__ = ("TimerStream",)
@@ -0,0 +1,131 @@
+"""Approximate
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from abc import abstractmethod
+
+# Project
+from ._internal.sketches import CountMin, HyperLogLog, SpaceSaving
+from ._internal.periodic_stream import PeriodicStream
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+S = T.TypeVar("S", HyperLogLog, CountMin, SpaceSaving[T.Any])
+
+
+class _SketchStream(PeriodicStream[K, L], T.Generic[K, L, S]):
+    """Base for operators that summarize all values received into :attr:`sketch`.
+
+    The summary is emitted on close or, when ``interval`` is given, ``interval`` seconds after the
+    first value received since the previous emission. Summaries are cumulative, and sketches of
+    distinct operators with the same parameters can be merged.
+    """
+
+    __slots__ = ("_key", "sketch")
+
+    def __init__(
+        self, sketch: S, *, key: T.Optional[T.Callable[[L], T.Any]] = None, **kwargs: T.Any
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self.sketch: S = sketch
+
+        # Internal
+        self._key = key
+
+    @abstractmethod
+    def _summary(self) -> K:
+        """Compute value emitted from the current sketch state."""
+        raise NotImplementedError
+
+    def _add(self, value: L) -> None:
+        self.sketch.add(value if self._key is None else self._key(value))
+
+    def merge(self, other: T.Union[S, "_SketchStream[K, T.Any, S]"]) -> None:
+        """Merge another sketch, or the sketch of another operator, into this one.
+
+        Arguments:
+            other: Sketch, or operator, with the same parameters as this one.
+
+        """
+        self.sketch.merge(other.sketch if isinstance(other, _SketchStream) else other)
+
+
+class ApproxCountDistinct(_SketchStream[int, K, HyperLogLog]):
+    """Emit an estimate of the amount of distinct values received, through HyperLogLog.
+
+    Uses ``2 ** precision`` bytes, for a standard error of about ``1.04 / sqrt(2 ** precision)``.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, precision: int = 14, **kwargs: T.Any) -> None:
+        """ApproxCountDistinct constructor.
+
+        Arguments:
+            precision: Amount of bits used to index the sketch registers.
+            kwargs: Keyword parameters for super, ``key`` and ``interval``.
+
+        """
+        super().__init__(HyperLogLog(precision), **kwargs)
+
+    def _summary(self) -> int:
+        return self.sketch.estimate()
+
+
+class CountMinSketch(_SketchStream[CountMin, K, CountMin]):
+    """Emit a copy of a Count-Min sketch of the values received.
+
+    The emitted sketch estimates how many times each value was received through
+    :meth:`~._internal.sketches.CountMin.estimate`, never underestimating it.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, width: int = 2048, depth: int = 4, **kwargs: T.Any) -> None:
+        """CountMinSketch constructor.
+
+        Arguments:
+            width: Amount of counters per row, estimates exceed the true count by at most
+                ``e / width`` times the total count.
+            depth: Amount of rows, the estimate error bound holds with probability
+                ``1 - exp(-depth)``.
+            kwargs: Keyword parameters for super, ``key`` and ``interval``.
+
+        """
+        super().__init__(CountMin(width, depth), **kwargs)
+
+    def _summary(self) -> CountMin:
+        return self.sketch.copy()
+
+
+class HeavyHitters(_SketchStream[T.List[T.Tuple[T.Any, int, int]], K, SpaceSaving[T.Any]]):
+    """Emit the ``k`` most frequent values received, through Space-Saving.
+
+    Emits a list of ``(value, count, error)``, in descending count order, where count exceeds the
+    true count by at most error.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, k: int, **kwargs: T.Any) -> None:
+        """HeavyHitters constructor.
+
+        Arguments:
+            k: Amount of values tracked.
+            kwargs: Keyword parameters for super, ``key`` and ``interval``.
+
+        """
+        super().__init__(SpaceSaving(k), **kwargs)
+
+    def _summary(self) -> T.List[T.Tuple[T.Any, int, int]]:
+        return self.sketch.top()
+
+
+__all__ = ("HeavyHitters", "CountMinSketch", "ApproxCountDistinct")
@@ -24,6 +24,10 @@ K = T.TypeVar("K")
 
 
 class Assert(SingleStream[K]):
+    __slots__ = ("_exc", "_asend_predicate")
+
+    _forwards_demand = True
+
     def __init__(
         self,
         asend_predicate: T.Callable[[K], T.Union[T.Awaitable[bool], bool]],
@@ -37,6 +41,7 @@ class Assert(SingleStream[K]):
 
     async def _asend(self, value: K, namespace: "Namespace") -> None:
         if not await attempt_await(self._asend_predicate(value)):
+            self._refund_credit()
             raise self._exc
 
         awaitable = super()._asend(value, namespace)
@@ -0,0 +1,46 @@
+"""AuditTime
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import get_running_loop
+
+# Project
+from ._internal.timer_stream import TimerStream
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class AuditTime(TimerStream[K, K]):
+    """Upon receiving a value, wait ``interval`` seconds and then emit the latest value received."""
+
+    __slots__ = ("_interval",)
+
+    def __init__(self, interval: float, **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        assert interval > 0
+
+        self._interval = interval
+
+    def _fire(self, _: float) -> None:
+        self._emit_pending()
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        self._pending = (value, namespace)
+
+        if self._timer is None:
+            self._schedule(get_running_loop().time() + self._interval)
+
+
+__all__ = ("AuditTime",)
@@ -0,0 +1,96 @@
+"""Conflate
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import Task, get_running_loop
+
+# Project
+from ..errors import ObserverClosedError
+from ..streams.single_stream import SingleStream
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class Conflate(SingleStream[K]):
+    """Deliver only the latest value of each key, whenever the observer is ready for it.
+
+    Values are stored, by key, until the observer finishes handling the previous value, so asend
+    never waits on the observer. A value replaces any undelivered value with the same key, keeping
+    its delivery position. So pending values are bounded by the amount of distinct keys, instead of
+    by the rate at which they arrive. Without ``key`` only the latest value is kept. Pending values
+    are delivered on close, or dropped if there is no observer.
+    """
+
+    __slots__ = ("_key", "_dirty", "_drain")
+
+    def __init__(
+        self, key: T.Optional[T.Callable[[K], T.Hashable]] = None, **kwargs: T.Any
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self._key = key
+        # Latest undelivered value of each key, in order of first arrival
+        self._dirty: T.Dict[T.Hashable, T.Tuple[K, "Namespace"]] = {}
+        self._drain: T.Optional["Task[None]"] = None
+
+    async def _drain_dirty(self) -> None:
+        dirty = self._dirty
+
+        while dirty:
+            key = next(iter(dirty))
+            value, namespace = dirty.pop(key)
+
+            try:
+                awaitable = super()._asend(value, namespace)
+
+                # Remove reference early to avoid keeping large objects in memory
+                del value
+
+                await awaitable
+            except Exception as exc:
+                if not self.closed:
+                    await self.athrow(exc, namespace)
+                elif not isinstance(exc, ObserverClosedError):
+                    get_running_loop().call_exception_handler(
+                        {
+                            "message": f"{self}: Failed to deliver conflated value on close",
+                            "exception": exc,
+                        }
+                    )
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        self._dirty[None if self._key is None else self._key(value)] = (value, namespace)
+
+        if self._drain is None or self._drain.done():
+            self._drain = get_running_loop().create_task(self._drain_dirty())
+
+    async def _aclose(self) -> None:
+        if self._observer is None:
+            # Nobody will ever receive the pending values, so drop them and release any delivery
+            # still waiting for an observer
+            self._dirty.clear()
+            if not self._lock.done():
+                self._lock.set_exception(ObserverClosedError(self))
+
+        # Flush values still pending
+        if self._drain is not None:
+            await self._drain
+
+        if self._dirty:
+            await self._drain_dirty()
+
+        await super()._aclose()
+
+
+__all__ = ("Conflate",)
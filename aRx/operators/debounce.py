@@ -0,0 +1,51 @@
+"""Debounce
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import get_running_loop
+
+# Project
+from ._internal.timer_stream import TimerStream
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class Debounce(TimerStream[K, K]):
+    """Emit the latest value only after no other value arrived for ``quiet_period`` seconds."""
+
+    __slots__ = ("_deadline", "_quiet_period")
+
+    def __init__(self, quiet_period: float, **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        assert quiet_period > 0
+
+        self._deadline = 0.0
+        self._quiet_period = quiet_period
+
+    def _fire(self, now: float) -> None:
+        if now < self._deadline:
+            # New values arrived since the timer was scheduled, so the timer is lazily moved instead
+            # of being cancelled and recreated for each of them
+            self._schedule(self._deadline)
+        else:
+            self._emit_pending()
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        self._pending = (value, namespace)
+        self._deadline = get_running_loop().time() + self._quiet_period
+        self._schedule(self._deadline)
+
+
+__all__ = ("Debounce",)
@@ -0,0 +1,130 @@
+"""Distinct
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import get_running_loop
+
+# External
+from async_tools import attempt_await
+
+# Project
+from ..streams import SingleStream
+from ._internal.key_sets import KeySet, LRUKeySet, BloomKeySet, UnboundedKeySet
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+_NOT_PROVIDED: T.Final = object()
+
+
+class Distinct(SingleStream[K]):
+    """Only let through values whose key wasn't seen before.
+
+    The seen keys are kept by one of the following backends:
+
+    - ``"set"``: Exact, but memory grows with the number of distinct keys.
+    - ``"lru"``: Exact for the ``capacity`` most recent keys, optionally forgetting keys unseen
+      for ``ttl`` seconds.
+    - ``"bloom"``: Fixed memory, defined by ``capacity`` and ``error_rate``. A new key can be
+      wrongly considered a duplicate with probability ``error_rate``.
+    """
+
+    __slots__ = ("_key", "_ttl", "_keys")
+
+    def __init__(
+        self,
+        key: T.Optional[T.Callable[[K], T.Union[T.Awaitable[T.Hashable], T.Hashable]]] = None,
+        *,
+        backend: T.Literal["set", "lru", "bloom"] = "set",
+        capacity: T.Optional[int] = None,
+        ttl: T.Optional[float] = None,
+        error_rate: float = 0.01,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self._key = key
+        self._ttl = ttl
+        self._keys: KeySet
+
+        if ttl is not None and backend != "lru":
+            raise ValueError(f"Distinct backend {backend} doesn't support ttl")
+
+        if capacity is None and backend in ("lru", "bloom"):
+            raise ValueError(f"Distinct backend {backend} requires a capacity")
+
+        if backend == "set":
+            self._keys = UnboundedKeySet()
+        elif backend == "lru":
+            assert capacity is not None
+            self._keys = LRUKeySet(capacity, ttl)
+        elif backend == "bloom":
+            assert capacity is not None
+            self._keys = BloomKeySet(capacity, error_rate)
+        else:
+            raise ValueError(f"Unknown Distinct backend: {backend}")
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        key = value if self._key is None else await attempt_await(self._key(value))
+
+        if not self._keys.add(key, get_running_loop().time() if self._ttl else 0.0):
+            return
+
+        awaitable = super()._asend(value, namespace)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await awaitable
+
+    async def _aclose(self) -> None:
+        self._keys.clear()
+
+        await super()._aclose()
+
+
+class DistinctUntilChanged(SingleStream[K]):
+    """Only let through values whose key differs from the previous value key."""
+
+    __slots__ = ("_key", "_last")
+
+    def __init__(
+        self,
+        key: T.Optional[T.Callable[[K], T.Union[T.Awaitable[T.Any], T.Any]]] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self._key = key
+        self._last: T.Any = _NOT_PROVIDED
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        key = value if self._key is None else await attempt_await(self._key(value))
+
+        if self._last is not _NOT_PROVIDED and self._last == key:
+            return
+
+        self._last = key
+        awaitable = super()._asend(value, namespace)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await awaitable
+
+    async def _aclose(self) -> None:
+        self._last = _NOT_PROVIDED
+
+        await super()._aclose()
+
+
+__all__ = ("Distinct", "DistinctUntilChanged")
@@ -7,6 +7,7 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 # Internal
 import typing as T
+from inspect import iscoroutinefunction
 
 # External
 from async_tools import attempt_await
@@ -43,6 +44,10 @@ class FilterCallableWithIndex(T.Protocol[M]):
 
 
 class Filter(SingleStream[K]):
+    __slots__ = ("_index", "_asend_predicate", "_athrow_predicate")
+
+    _forwards_demand = True
+
     @T.overload
     def __init__(
         self,
@@ -93,7 +98,20 @@ class Filter(SingleStream[K]):
         self._asend_predicate = asend_predicate
         self._athrow_predicate = athrow_predicate
 
-    async def _asend(self, value: K, namespace: "Namespace") -> None:
+    def _fuse(self) -> T.Optional[T.Callable[[T.Iterator[K]], T.Iterator[K]]]:
+        predicate = self._asend_predicate
+        if (
+            predicate is None
+            or self._index is not None
+            or self._athrow_predicate is not None
+            or iscoroutinefunction(predicate)
+            or iscoroutinefunction(getattr(predicate, "__call__", None))
+        ):
+            return None
+
+        return lambda iterator: filter(T.cast(FilterCallable[K], predicate), iterator)
+
+    async def _test(self, value: K) -> bool:
         if self._asend_predicate is None:
             awaitable: T.Union[T.Awaitable[bool], bool] = True
         elif self._index is None:
@@ -110,13 +128,25 @@ class Filter(SingleStream[K]):
             awaitable = self._asend_predicate(value, self._index)
             self._index += 1
 
-        if await attempt_await(awaitable):
+        return bool(await attempt_await(awaitable))
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        try:
+            accepted = await self._test(value)
+        except Exception:
+            # No value will be emitted, so its credit must be returned
+            self._refund_credit()
+            raise
+
+        if accepted:
             result = super()._asend(value, namespace)
 
             # Remove reference early to avoid keeping large objects in memory
             del value
 
             await result
+        else:
+            self._refund_credit()
 
     async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
         if self._athrow_predicate is None or await attempt_await(self._athrow_predicate(exc)):
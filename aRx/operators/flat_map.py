@@ -0,0 +1,179 @@
+"""FlatMap
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import Task, Future, get_running_loop
+
+# External
+from async_tools import attempt_await, wait_with_care
+
+# Project
+from ..observers import Observer
+from ..operations import observe
+from ..streams.single_stream import SingleStreamBase
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+    from ..protocols import ObservableProtocol
+
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+
+class _InnerObserver(Observer[K]):
+    """Observer that redirects an inner observable data to its FlatMap downstream."""
+
+    __slots__ = ("_outer",)
+
+    def __init__(self, outer: "FlatMap[K, T.Any]", **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        self._outer = outer
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        awaitable = self._outer._emit(value, namespace)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await awaitable
+
+    async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
+        # Inner observables are only finished by close, or when there is no one to receive them
+        return await self._outer._emit_error(exc, namespace)
+
+    async def _aclose(self) -> None:
+        self._outer._release(self)
+
+
+class FlatMap(SingleStreamBase[K, L]):
+    """Map each value to an observable and emit the data of all of them as it arrives.
+
+    At most ``max_concurrency`` inner observables are observed at the same time, asend waits for
+    one of them to complete before observing a new one. On close, waits for the inner observables
+    still active to complete.
+    """
+
+    __slots__ = ("_inners", "_mapper", "_released", "_disposals", "_max_concurrency")
+
+    def __init__(
+        self,
+        mapper: T.Callable[
+            [L], T.Union[T.Awaitable["ObservableProtocol[K]"], "ObservableProtocol[K]"]
+        ],
+        *,
+        max_concurrency: T.Optional[int] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+
+        assert max_concurrency is None or max_concurrency > 0
+
+        self._mapper = mapper
+        self._inners: T.Dict[_InnerObserver[K], observe[K]] = {}
+        self._released: T.Optional["Future[None]"] = None
+        self._disposals: T.Set["Task[None]"] = set()
+        self._max_concurrency = max_concurrency
+
+    async def _wait_release(self) -> None:
+        if self._released is None:
+            self._released = get_running_loop().create_future()
+
+        await self._released
+
+    def _release(self, inner: _InnerObserver[K]) -> None:
+        subscription = self._inners.pop(inner, None)
+        if subscription is None:
+            return
+
+        if self._released is not None:
+            self._released.set_result(None)
+            self._released = None
+
+        # Inner observer can be closed by its own observable, so disposition must be scheduled to
+        # avoid the observable awaiting itself
+        task = get_running_loop().create_task(subscription.dispose())
+        self._disposals.add(task)
+        task.add_done_callback(self._disposals.discard)
+
+    async def _emit(self, value: K, namespace: "Namespace") -> None:
+        awaitable = super()._asend(T.cast(L, value), namespace)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await awaitable
+
+    async def _emit_error(self, exc: Exception, namespace: "Namespace") -> bool:
+        return await super()._athrow(exc, namespace)
+
+    async def _supersede(self) -> None:
+        """Hook called before a new inner observable is observed."""
+        while self._max_concurrency is not None and len(self._inners) >= self._max_concurrency:
+            await self._wait_release()
+
+    async def _asend(self, value: L, namespace: "Namespace") -> None:
+        inner = await attempt_await(self._mapper(value))
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await self._supersede()
+
+        observer: _InnerObserver[K] = _InnerObserver(self)
+        subscription = self._inners[observer] = observe(inner, observer)
+
+        await subscription
+
+    async def _asend_impl(self, value: L) -> K:
+        # Only inner observables data reach SingleStreamBase._asend
+        return T.cast(K, value)
+
+    async def _aclose(self) -> None:
+        while self._inners:
+            await self._wait_release()
+
+        await wait_with_care(*self._disposals)
+
+        await super()._aclose()
+
+
+class ConcatMap(FlatMap[K, L]):
+    """Map each value to an observable and emit the data of each one, in order, after the other."""
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        mapper: T.Callable[
+            [L], T.Union[T.Awaitable["ObservableProtocol[K]"], "ObservableProtocol[K]"]
+        ],
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(mapper, max_concurrency=1, **kwargs)
+
+
+class SwitchMap(FlatMap[K, L]):
+    """Map each value to an observable and only emit the data of the latest one.
+
+    Observation of the previous inner observable is disposed as soon as a new value arrives.
+    """
+
+    __slots__ = ()
+
+    async def _supersede(self) -> None:
+        inners = tuple(self._inners.values())
+        self._inners.clear()
+
+        await wait_with_care(*(subscription.dispose() for subscription in inners))
+
+
+__all__ = ("FlatMap", "ConcatMap", "SwitchMap")
@@ -0,0 +1,147 @@
+"""GroupBy
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import Task, TimerHandle, get_running_loop
+from collections import OrderedDict
+
+# External
+from async_tools import attempt_await, wait_with_care
+
+# Project
+from ..streams import MultiStream
+from ..streams.single_stream import SingleStreamBase
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class Group(MultiStream[K]):
+    """MultiStream that receives all values that share the same key."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: T.Hashable, **kwargs: T.Any) -> None:
+        """Group constructor.
+
+        Arguments:
+            key: Key shared by all values in this group.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        self.key = key
+
+
+class GroupBy(SingleStreamBase[Group[K], K]):
+    """Split values into a :class:`Group` per key.
+
+    Each group is emitted once, when the first value with its key arrives, right before that value
+    is sent through it. So observers must be registered into the group during its emission to
+    receive all its values.
+
+    When ``idle_timeout`` is given, groups that don't receive values for that many seconds are
+    closed and forgotten. A value whose key arrives afterwards will create a new group.
+    """
+
+    __slots__ = ("_key", "_timer", "_groups", "_evictions", "_last_seen", "_idle_timeout")
+
+    def __init__(
+        self,
+        key: T.Callable[[K], T.Union[T.Awaitable[T.Hashable], T.Hashable]],
+        *,
+        idle_timeout: T.Optional[float] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+
+        assert idle_timeout is None or idle_timeout > 0
+
+        self._key = key
+        self._timer: T.Optional[TimerHandle] = None
+        self._groups: "OrderedDict[T.Hashable, Group[K]]" = OrderedDict()
+        self._last_seen: T.Dict[T.Hashable, float] = {}
+        self._evictions: T.Set["Task[bool]"] = set()
+        self._idle_timeout = idle_timeout
+
+    def _evict_idle(self) -> None:
+        assert self._idle_timeout is not None
+
+        loop = get_running_loop()
+        now = loop.time()
+        limit = now - self._idle_timeout
+
+        self._timer = None
+
+        # Groups are ordered by last activity, so idle ones are always at the start
+        while self._groups:
+            key = next(iter(self._groups))
+            # Groups still being emitted have no activity registered yet, consider them active
+            last_seen = self._last_seen.get(key, now)
+            if last_seen > limit:
+                self._timer = loop.call_at(last_seen + self._idle_timeout, self._evict_idle)
+                break
+
+            self._last_seen.pop(key, None)
+            _, group = self._groups.popitem(last=False)
+
+            task = loop.create_task(group.aclose())
+            self._evictions.add(task)
+            task.add_done_callback(self._evictions.discard)
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        key = await attempt_await(self._key(value))
+        group = self._groups.get(key, None)
+
+        if group is None:
+            group = self._groups[key] = Group(key)
+
+            # Wait for observers
+            await self._lock
+
+            # _observer must be available at this point
+            assert self._observer
+
+            await self._observer.asend(group, namespace)
+        elif self._idle_timeout is not None:
+            self._groups.move_to_end(key)
+
+        if self._idle_timeout is not None:
+            loop = get_running_loop()
+            now = self._last_seen[key] = loop.time()
+            if self._timer is None:
+                self._timer = loop.call_at(now + self._idle_timeout, self._evict_idle)
+
+        awaitable = group.asend(value, namespace)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await awaitable
+
+    async def _aclose(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        groups = tuple(self._groups.values())
+        self._groups.clear()
+        self._last_seen.clear()
+
+        await wait_with_care(*self._evictions, *(group.aclose() for group in groups))
+
+        await super()._aclose()
+
+
+__all__ = ("Group", "GroupBy")
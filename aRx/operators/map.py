@@ -7,11 +7,14 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 # Internal
 import typing as T
+from asyncio import Future, get_running_loop
+from inspect import iscoroutinefunction
 
 # External
 from async_tools import attempt_await
 
 # Project
+from ._internal.caches import MISSING, Cache, LFUCache, LRUCache, TTLCache
 from ..streams.single_stream import SingleStreamBase
 
 if T.TYPE_CHECKING:
@@ -26,6 +29,13 @@ M = T.TypeVar("M", covariant=True)
 N = T.TypeVar("N", contravariant=True)
 
 
+class CacheInfo(T.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
 @T.runtime_checkable
 class MapperCallable(T.Protocol[M, N]):
     def __call__(self, __value: N) -> M:
@@ -56,7 +66,27 @@ class MapperAwaitableCallableWithIndex(T.Protocol[M, N]):
         ...
 
 
+class _Memo(T.Generic[K]):
+    """Memoization state of a cached Map."""
+
+    __slots__ = ("key", "hits", "cache", "misses", "maxsize", "in_flight")
+
+    def __init__(
+        self, cache: Cache[K], maxsize: int, key: T.Optional[T.Callable[[T.Any], T.Hashable]]
+    ) -> None:
+        self.key = key
+        self.hits = 0
+        self.cache = cache
+        self.misses = 0
+        self.maxsize = maxsize
+        self.in_flight: T.Dict[T.Hashable, "Future[K]"] = {}
+
+
 class Map(SingleStreamBase[K, L]):
+    __slots__ = ("_memo", "_index", "_asend_mapper", "_athrow_mapper")
+
+    _forwards_demand = True
+
     @T.overload
     def __init__(
         self,
@@ -125,8 +155,29 @@ class Map(SingleStreamBase[K, L]):
         athrow_mapper: T.Optional[MapperErrorCallable] = None,
         *,
         with_index: bool = False,
+        cache: T.Optional[T.Literal["lru", "lfu", "ttl"]] = None,
+        cache_key: T.Optional[T.Callable[[L], T.Hashable]] = None,
+        cache_ttl: T.Optional[float] = None,
+        cache_size: int = 128,
         **kwargs: T.Any,
     ) -> None:
+        """Map constructor.
+
+        When ``cache`` is given, asend_mapper results are memoized by the value (or by
+        ``cache_key(value)``), so asend_mapper must be a pure function. Concurrent values with the
+        same key, whose result is still being computed, share that same computation.
+
+        Arguments:
+            asend_mapper: Function that maps each value.
+            athrow_mapper: Function that maps each error.
+            with_index: Whether asend_mapper also receives the value index.
+            cache: Cache eviction policy, one of: ``"lru"``, ``"lfu"`` or ``"ttl"``.
+            cache_key: Function that computes the cache key of a value.
+            cache_ttl: Seconds a result is kept in cache, required by the ``"ttl"`` policy.
+            cache_size: Maximum amount of results kept in cache.
+            kwargs: Keyword parameters for super.
+
+        """
         super().__init__(**kwargs)
 
         # There must be passed at least one predicate as argument
@@ -136,7 +187,96 @@ class Map(SingleStreamBase[K, L]):
         self._asend_mapper = asend_mapper
         self._athrow_mapper = athrow_mapper
 
+        # Memoization state is only allocated when requested, to keep uncached Maps cheap
+        self._memo: T.Optional[_Memo[K]] = None
+        if cache is not None:
+            # Results that depend on the index can't be reused
+            assert not with_index
+
+            store: Cache[K]
+            if cache == "lru":
+                store = LRUCache(cache_size)
+            elif cache == "lfu":
+                store = LFUCache(cache_size)
+            elif cache == "ttl":
+                assert cache_ttl is not None
+                store = TTLCache(cache_size, cache_ttl)
+            else:
+                raise ValueError(f"Unknown Map cache policy: {cache}")
+
+            self._memo = _Memo(store, cache_size, cache_key)
+
+    @property
+    def cache_info(self) -> CacheInfo:
+        """Cache statistics, calls that shared an ongoing computation are counted as hits."""
+        memo = self._memo
+        if memo is None:
+            return CacheInfo(0, 0, 0, 0)
+
+        return CacheInfo(memo.hits, memo.misses, memo.maxsize, len(memo.cache))
+
+    def _fuse(self) -> T.Optional[T.Callable[[T.Iterator[L]], T.Iterator[K]]]:
+        mapper = self._asend_mapper
+        if (
+            mapper is None
+            or self._memo is not None
+            or self._index is not None
+            or self._athrow_mapper is not None
+            or iscoroutinefunction(mapper)
+            or iscoroutinefunction(getattr(mapper, "__call__", None))
+        ):
+            return None
+
+        return lambda iterator: map(T.cast(MapperCallable[L, K], mapper), iterator)
+
     async def _asend_impl(self, value: L) -> K:
+        try:
+            return await (self._map(value) if self._memo is None else self._memoized(value))
+        except Exception:
+            # No value will be emitted, so its credit must be returned
+            self._refund_credit()
+            raise
+
+    async def _memoized(self, value: L) -> K:
+        memo = self._memo
+        assert memo is not None
+
+        key = value if memo.key is None else memo.key(value)
+        now = get_running_loop().time()
+
+        result = memo.cache.get(key, now)
+        if result is not MISSING:
+            memo.hits += 1
+            return T.cast(K, result)
+
+        in_flight = memo.in_flight.get(key, None)
+        if in_flight is not None:
+            memo.hits += 1
+            return await in_flight
+
+        memo.misses += 1
+        in_flight = memo.in_flight[key] = get_running_loop().create_future()
+
+        try:
+            result = await self._map(value)
+        except Exception as exc:
+            in_flight.set_exception(exc)
+            # Avoid warnings about unretrieved exceptions when no one else awaited it
+            in_flight.exception()
+            raise
+        except BaseException:
+            # Computation was cancelled, so must be everyone waiting for it
+            in_flight.cancel()
+            raise
+        else:
+            in_flight.set_result(result)
+            memo.cache.set(key, result, now)
+        finally:
+            del memo.in_flight[key]
+
+        return result
+
+    async def _map(self, value: L) -> K:
         if self._asend_mapper is None:
             awaitable: T.Union[T.Awaitable[K], K] = T.cast(K, value)
         elif self._index is None:
@@ -166,6 +306,12 @@ class Map(SingleStreamBase[K, L]):
 
         return await result
 
+    async def _aclose(self) -> None:
+        if self._memo is not None:
+            self._memo.cache.clear()
+
+        await super()._aclose()
+
     async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
         if self._athrow_mapper:
             exc = await attempt_await(self._athrow_mapper(exc))
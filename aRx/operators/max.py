@@ -27,6 +27,8 @@ _NOT_PROVIDED = object()
 
 
 class Max(SingleStream[K]):
+    __slots__ = ("_max", "_namespace")
+
     def __init__(self, **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
         self._max: K = _NOT_PROVIDED  # type: ignore
@@ -30,6 +30,8 @@ _NOT_PROVIDED: T.Final = object()
 
 
 class Min(SingleStream[M]):
+    __slots__ = ("_min", "_namespace")
+
     def __init__(self, **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
         self._min: M = _NOT_PROVIDED  # type: ignore
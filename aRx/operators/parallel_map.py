@@ -0,0 +1,136 @@
+"""ParallelMap
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import Task, Queue, get_running_loop
+
+# External
+from async_tools import attempt_await, wait_with_care
+
+# Project
+from ..errors import ObserverClosedError
+from ..streams.single_stream import SingleStreamBase
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+
+class ParallelMap(SingleStreamBase[K, L]):
+    """Map values concurrently, keeping the order of values that share the same key.
+
+    Each value key is hashed to one of ``workers`` tasks, each one with its own queue of at most
+    ``queue_size`` values, which map its values one after the other. So values with the same key
+    are always emitted in order, while values with distinct keys are mapped concurrently. When the
+    queue of a worker is full, asend waits for it to have space.
+    """
+
+    __slots__ = ("_key", "_tasks", "_mapper", "_queues", "_workers", "_queue_size")
+
+    def __init__(
+        self,
+        mapper: T.Callable[[L], T.Union[T.Awaitable[K], K]],
+        *,
+        key: T.Optional[T.Callable[[L], T.Hashable]] = None,
+        workers: int = 4,
+        queue_size: int = 64,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+
+        assert workers > 0
+        assert queue_size > 0
+
+        self._key = key
+        self._tasks: T.List["Task[None]"] = []
+        self._mapper = mapper
+        self._queues: T.List["Queue[T.Optional[T.Tuple[L, Namespace]]]"] = []
+        self._workers = workers
+        self._queue_size = queue_size
+
+    def _start_workers(self) -> None:
+        loop = get_running_loop()
+
+        for _ in range(self._workers):
+            queue: "Queue[T.Optional[T.Tuple[L, Namespace]]]" = Queue(self._queue_size)
+            self._queues.append(queue)
+            self._tasks.append(loop.create_task(self._worker(queue)))
+
+    def _report(self, exc: Exception) -> None:
+        if not isinstance(exc, ObserverClosedError):
+            get_running_loop().call_exception_handler(
+                {"message": f"{self}: Failed to map value while closing", "exception": exc}
+            )
+
+    async def _worker(self, queue: "Queue[T.Optional[T.Tuple[L, Namespace]]]") -> None:
+        stopped = False
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+
+            if stopped:
+                # Keep consuming the queue, so asend and aclose don't block on it
+                continue
+
+            value, namespace = item
+            del item
+
+            try:
+                awaitable = attempt_await(self._mapper(value))
+
+                # Remove reference early to avoid keeping large objects in memory
+                del value
+
+                await super()._asend(T.cast(L, await awaitable), namespace)
+            except Exception as exc:
+                if self.closed:
+                    self._report(exc)
+                    continue
+
+                try:
+                    await self.athrow(exc, namespace)
+                except Exception as athrow_exc:
+                    # athrow only fails when the stream is closing, drop the remaining values
+                    stopped = True
+                    self._report(athrow_exc)
+
+    async def _asend(self, value: L, namespace: "Namespace") -> None:
+        if not self._queues:
+            self._start_workers()
+
+        key = value if self._key is None else self._key(value)
+        awaitable = self._queues[hash(key) % self._workers].put((value, namespace))
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await awaitable
+
+    async def _asend_impl(self, value: L) -> K:
+        # Only values already mapped by the workers reach SingleStreamBase._asend
+        return T.cast(K, value)
+
+    async def _aclose(self) -> None:
+        for queue in self._queues:
+            await queue.put(None)
+
+        await wait_with_care(*self._tasks)
+
+        self._tasks.clear()
+        self._queues.clear()
+
+        await super()._aclose()
+
+
+__all__ = ("ParallelMap",)
@@ -0,0 +1,328 @@
+"""ProcessStage
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import os
+import typing as T
+from asyncio import Task, run, get_running_loop
+from itertools import chain
+from contextlib import suppress
+from multiprocessing import get_context, get_all_start_methods
+
+# External
+from async_tools import wait_with_care
+
+# Project
+from ..errors import ObserverClosedError
+from ..namespace import Namespace
+from ..observers import Observer
+from ..operations.sink_op import chain as operations
+from ._internal.shared_ring import Channel
+from ..streams.single_stream import SingleStreamBase
+
+if T.TYPE_CHECKING:
+    # Internal
+    from multiprocessing.context import BaseContext
+    from multiprocessing.process import BaseProcess
+
+    # Project
+    from ..protocols import ObserverProtocol, TransformerProtocol, TransformerProtocolWithOperators
+    from ..operations import pipe
+
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+_Factory = T.Callable[
+    [], T.Union["TransformerProtocolWithOperators[T.Any, T.Any]", "pipe[T.Any, T.Any]"]
+]
+
+# Frame types
+_SEND = 0
+_THROW = 1
+_CLOSE = 2
+
+
+class _Outlet(Observer[K]):
+    """Observer, in a worker process, that sends the sub-pipeline output back to the stage."""
+
+    __slots__ = ("_channel",)
+
+    def __init__(self, channel: Channel, **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        # Internal
+        self._channel = channel
+
+    async def _asend(self, value: K, namespace: Namespace) -> None:
+        awaitable = self._channel.send(_SEND, value)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await awaitable
+
+    async def _athrow(self, exc: Exception, namespace: Namespace) -> bool:
+        try:
+            await self._channel.send(_THROW, exc)
+        except Exception:
+            # Exception can't be pickled
+            await self._channel.send(_THROW, RuntimeError(repr(exc)))
+
+        return False
+
+    async def _aclose(self) -> None:
+        await self._channel.send(_CLOSE, None)
+
+
+async def _work(
+    factory: _Factory,
+    inlet: Channel,
+    outlet: Channel,
+) -> None:
+    observer: _Outlet[T.Any] = _Outlet(outlet)
+    operation = factory() > observer
+    # The first observable of a sub-pipeline is always a transformer, created by the factory
+    head = T.cast("TransformerProtocol[T.Any, T.Any]", operations(operation)[-1]._observable)
+
+    async with operation:
+        while not observer.closed:
+            kind, value = await inlet.recv()
+
+            if kind == _CLOSE:
+                # Flush sub-pipeline, which closes the outlet
+                await head.aclose()
+                break
+
+            try:
+                await head.asend(value)
+            except ObserverClosedError:
+                # Sub-pipeline closed itself
+                break
+
+
+def _serve(
+    factory: _Factory,
+    inlet: Channel,
+    outlet: Channel,
+) -> None:
+    """Entrypoint of worker processes."""
+    try:
+        run(_work(factory, inlet, outlet))
+    finally:
+        inlet.close()
+        outlet.close()
+
+
+class ProcessStage(SingleStreamBase[K, L]):
+    """Run a sub-pipeline in ``workers`` processes.
+
+    Each worker process creates its own sub-pipeline, through ``factory``, and values are routed to
+    the workers in turns or, when ``key`` is given, by the hash of their key. The output of all
+    workers is emitted as it arrives, so order is only kept among values handled by the same
+    worker.
+
+    Values are moved between processes through shared memory ring buffers of ``capacity`` bytes,
+    one for each direction of each worker. asend waits while the ring of its worker is full, so a
+    slow sub-pipeline slows down its producers.
+
+    Worker processes are started when the stage is observed, and stopped when it is closed, which
+    first flushes their sub-pipelines. When the sub-pipeline of any worker closes by itself, the
+    stage is closed too. Exceptions raised inside the sub-pipelines are thrown from the stage,
+    while exceptions received by the stage are forwarded straight to its observer.
+
+    .. Note::
+
+        Values are serialized through pickle protocol 5. Buffers of objects that support
+        out-of-band pickling, like bytearrays or numpy arrays, are copied straight into shared
+        memory, and out of it on the other side, without intermediary copies made by pickle. Other
+        objects, including bytes, are pickled in-band. Values must fit the ring buffers.
+
+    .. Note::
+
+        By default worker processes are started by a forkserver, or spawned where that isn't
+        available, as forking a process with a running event loop, and possibly other threads, is
+        unsafe. So the factory, and anything it references, must be picklable, for example being a
+        module level function.
+    """
+
+    __slots__ = (
+        "_key",
+        "_next",
+        "_inlets",
+        "_context",
+        "_factory",
+        "_outlets",
+        "_workers",
+        "_capacity",
+        "_namespace",
+        "_processes",
+        "_sentinels",
+        "_collectors",
+    )
+
+    def __init__(
+        self,
+        factory: T.Callable[[], T.Union["TransformerProtocolWithOperators[L, K]", "pipe[L, K]"]],
+        *,
+        key: T.Optional[T.Callable[[L], T.Hashable]] = None,
+        workers: int = 1,
+        capacity: int = 2**20,
+        context: T.Optional["BaseContext"] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        """ProcessStage constructor.
+
+        Arguments:
+            factory: Function that creates the sub-pipeline, a transformer or a chain of them.
+            key: Function that returns the key used to route values to workers.
+            workers: Amount of worker processes.
+            capacity: Size, in bytes, of each ring buffer.
+            context: Multiprocessing context used to start worker processes, defaults to the
+                ``"forkserver"`` start method, or ``"spawn"`` where it isn't available.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        assert workers > 0
+
+        self._key = key
+        self._next = 0
+        self._inlets: T.List[Channel] = []
+        self._context = (
+            get_context("forkserver" if "forkserver" in get_all_start_methods() else "spawn")
+            if context is None
+            else context
+        )
+        self._factory = factory
+        self._outlets: T.List[Channel] = []
+        self._workers = workers
+        self._capacity = capacity
+        self._namespace = Namespace(self, "_collect")
+        self._processes: T.List["BaseProcess"] = []
+        self._sentinels: T.List[int] = []
+        self._collectors: T.List["Task[None]"] = []
+
+    def _start_workers(self) -> None:
+        loop = get_running_loop()
+
+        for _ in range(self._workers):
+            inlet = Channel(self._capacity)
+            outlet = Channel(self._capacity)
+            process = self._context.Process(  # type: ignore
+                target=_serve, args=(self._factory, inlet, outlet), daemon=True
+            )
+            process.start()
+
+            self._inlets.append(inlet)
+            self._outlets.append(outlet)
+            self._processes.append(process)
+            # Senders and collector wait on the sentinel concurrently, so each needs its own fd
+            self._sentinels.append(os.dup(process.sentinel))
+            self._collectors.append(loop.create_task(self._collect(outlet, process.sentinel)))
+
+    async def _collect(self, outlet: Channel, sentinel: int) -> None:
+        namespace = self._namespace
+
+        while True:
+            try:
+                kind, value = await outlet.recv(sentinel)
+            except BrokenPipeError as exc:
+                # Worker process exited without closing its sub-pipeline
+                kind, value = _CLOSE, exc
+            except Exception as exc:
+                kind, value = _THROW, exc
+
+            if kind == _CLOSE:
+                break
+
+            try:
+                if kind == _SEND:
+                    awaitable = super()._asend(value, namespace)
+
+                    # Remove reference early to avoid keeping large objects in memory
+                    del value
+
+                    await awaitable
+                elif not self.closed:
+                    await self.athrow(value, namespace)
+            except Exception as exc:
+                if not self.closed:
+                    await self.athrow(exc, namespace)
+                elif not isinstance(exc, ObserverClosedError):
+                    get_running_loop().call_exception_handler(
+                        {
+                            "message": f"{self}: Failed to emit worker output while closing",
+                            "exception": exc,
+                        }
+                    )
+
+        if self.closed:
+            return
+
+        if value is not None:
+            await self.athrow(value, namespace)
+
+        # Must use create_task to avoid deadlock
+        get_running_loop().create_task(self.aclose())
+
+    async def _asend(self, value: L, namespace: "Namespace") -> None:
+        # Wait for observers, which start the workers
+        await self._lock
+
+        if self._key is None:
+            index = self._next
+            self._next = (index + 1) % self._workers
+        else:
+            index = hash(self._key(value)) % self._workers
+
+        awaitable = self._inlets[index].send(_SEND, value, self._sentinels[index])
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await awaitable
+
+    async def _asend_impl(self, value: L) -> K:
+        # Only the output of the workers reaches SingleStreamBase._asend
+        return T.cast(K, value)
+
+    async def _aclose(self) -> None:
+        for inlet, sentinel in zip(self._inlets, self._sentinels):
+            with suppress(BrokenPipeError):
+                await inlet.send(_CLOSE, None, sentinel)
+
+        await wait_with_care(*self._collectors)
+
+        loop = get_running_loop()
+        for process in self._processes:
+            await loop.run_in_executor(None, process.join)
+
+        for channel in chain(self._inlets, self._outlets):
+            channel.close()
+
+        for sentinel in self._sentinels:
+            os.close(sentinel)
+
+        self._inlets.clear()
+        self._outlets.clear()
+        self._processes.clear()
+        self._sentinels.clear()
+        self._collectors.clear()
+
+        await super()._aclose()
+
+    async def __observe__(self, observer: "ObserverProtocol[K]") -> None:
+        await super().__observe__(observer)
+
+        if not (self._processes or self.closed):
+            self._start_workers()
+
+
+__all__ = ("ProcessStage",)
@@ -0,0 +1,110 @@
+"""Reorder
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from heapq import heappop, heappush
+from itertools import count
+
+# Project
+from ..errors import LateValueError, ObserverClosedError
+from ..streams import SingleStream
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class Reorder(SingleStream[K]):
+    """Emit values sorted by event time, tolerating values out of order by up to ``max_delay``.
+
+    Values are buffered in a heap until the watermark, the highest timestamp seen minus
+    ``max_delay``, surpasses them. So the buffer is bounded by the values received during the
+    lateness window. Values older than the watermark are handled by the ``late`` policy:
+
+    - ``"drop"``: Value is discarded.
+    - ``"emit"``: Value is emitted immediately, out of order.
+    - ``"raise"``: :class:`~aRx.errors.LateValueError` is raised.
+
+    Remaining values are emitted, in order, on close, or dropped if there is no observer.
+    """
+
+    __slots__ = ("_heap", "_late", "_counter", "_max_delay", "_timestamp", "_watermark")
+
+    def __init__(
+        self,
+        timestamp: T.Callable[[K], float],
+        max_delay: float,
+        *,
+        late: T.Literal["drop", "emit", "raise"] = "drop",
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+
+        assert max_delay >= 0
+        assert late in ("drop", "emit", "raise")
+
+        self._late = late
+        self._heap: T.List[T.Tuple[float, int, K, "Namespace"]] = []
+        self._counter = count()
+        self._max_delay = max_delay
+        self._timestamp = timestamp
+        self._watermark = float("-inf")
+
+    @property
+    def watermark(self) -> float:
+        """Event time up to which all values were already emitted."""
+        return self._watermark
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        timestamp = self._timestamp(value)
+
+        if timestamp < self._watermark:
+            if self._late == "raise":
+                raise LateValueError(value, timestamp, self._watermark)
+            elif self._late == "emit":
+                awaitable = super()._asend(value, namespace)
+
+                # Remove reference early to avoid keeping large objects in memory
+                del value
+
+                await awaitable
+
+            return
+
+        # Counter keeps values with the same timestamp in arrival order, and avoids comparing them
+        heappush(self._heap, (timestamp, next(self._counter), value, namespace))
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        self._watermark = max(self._watermark, timestamp - self._max_delay)
+
+        while self._heap and self._heap[0][0] <= self._watermark:
+            _, _, value, namespace = heappop(self._heap)
+            await super()._asend(value, namespace)
+
+    async def _aclose(self) -> None:
+        if self._observer is None:
+            # Nobody will ever receive the buffered values, so drop them and release any emission
+            # still waiting for an observer
+            self._heap.clear()
+            if not self._lock.done():
+                self._lock.set_exception(ObserverClosedError(self))
+
+        while self._heap:
+            _, _, value, namespace = heappop(self._heap)
+            await super()._asend(value, namespace)
+
+        await super()._aclose()
+
+
+__all__ = ("Reorder",)
@@ -0,0 +1,113 @@
+"""Reservoir
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from random import Random
+
+# Project
+from ._internal.periodic_stream import PeriodicStream
+from ._internal.reservoir_sampler import ReservoirSampler
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+
+class _SamplingStream(PeriodicStream[K, L]):
+    """Base for operators that emit a sample of the values received.
+
+    The sample is emitted on close or, when ``interval`` is given, ``interval`` seconds after the
+    first value received since the previous emission, after which sampling starts over.
+    """
+
+    __slots__ = ("_random",)
+
+    def __init__(self, *, seed: T.Any = None, **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        self._random = Random(seed)
+
+
+class Reservoir(_SamplingStream[T.List[K], K]):
+    """Emit a uniform random sample of at most ``k`` of the values received.
+
+    Uses constant memory, and most values are dropped at the cost of a single counter decrement.
+    """
+
+    __slots__ = ("_sampler",)
+
+    def __init__(self, k: int, **kwargs: T.Any) -> None:
+        """Reservoir constructor.
+
+        Arguments:
+            k: Sample size.
+            kwargs: Keyword parameters for super, ``interval`` and ``seed`` of the random generator.
+
+        """
+        super().__init__(**kwargs)
+
+        self._sampler: ReservoirSampler[K] = ReservoirSampler(k, self._random)
+
+    def _summary(self) -> T.Optional[T.List[K]]:
+        return self._sampler.reset() or None
+
+    def _add(self, value: K) -> None:
+        self._sampler.add(value)
+
+
+class SampleByKey(_SamplingStream[T.Dict[T.Hashable, T.List[K]], K]):
+    """Emit a dict with a uniform random sample of at most ``k_per_key`` values of each key.
+
+    At most ``max_keys`` keys are sampled, values of keys first seen after that are dropped until
+    sampling starts over.
+    """
+
+    __slots__ = ("_key", "_max_keys", "_samplers", "_k_per_key")
+
+    def __init__(
+        self, k_per_key: int, max_keys: int, key: T.Callable[[K], T.Hashable], **kwargs: T.Any
+    ) -> None:
+        """SampleByKey constructor.
+
+        Arguments:
+            k_per_key: Sample size of each key.
+            max_keys: Maximum amount of keys sampled.
+            key: Function that computes each value key.
+            kwargs: Keyword parameters for super, ``interval`` and ``seed`` of the random generator.
+
+        """
+        super().__init__(**kwargs)
+
+        assert k_per_key > 0
+        assert max_keys > 0
+
+        self._key = key
+        self._samplers: T.Dict[T.Hashable, ReservoirSampler[K]] = {}
+        self._max_keys = max_keys
+        self._k_per_key = k_per_key
+
+    def _summary(self) -> T.Optional[T.Dict[T.Hashable, T.List[K]]]:
+        samplers = self._samplers
+        self._samplers = {}
+
+        return {key: sampler.sample for key, sampler in samplers.items()} or None
+
+    def _add(self, value: K) -> None:
+        key = self._key(value)
+        sampler = self._samplers.get(key, None)
+
+        if sampler is None:
+            if len(self._samplers) >= self._max_keys:
+                return
+
+            sampler = self._samplers[key] = ReservoirSampler(self._k_per_key, self._random)
+
+        sampler.add(value)
+
+
+__all__ = ("Reservoir", "SampleByKey")
@@ -0,0 +1,61 @@
+"""Sample
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from math import floor
+from asyncio import get_running_loop
+
+# Project
+from ._internal.timer_stream import TimerStream
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class Sample(TimerStream[K, K]):
+    """Emit, every ``interval`` seconds, the latest value received since the previous emission.
+
+    Ticks are aligned to the arrival of the first value. The timer is only kept scheduled while
+    values are arriving.
+    """
+
+    __slots__ = ("_origin", "_interval")
+
+    def __init__(self, interval: float, **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        assert interval > 0
+
+        self._origin: T.Optional[float] = None
+        self._interval = interval
+
+    def _next_tick(self, now: float) -> float:
+        assert self._origin is not None
+        return self._origin + (floor((now - self._origin) / self._interval) + 1) * self._interval
+
+    def _fire(self, now: float) -> None:
+        if self._emit_pending():
+            self._schedule(self._next_tick(now))
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        self._pending = (value, namespace)
+
+        if self._timer is None:
+            now = get_running_loop().time()
+            if self._origin is None:
+                self._origin = now
+
+            self._schedule(self._next_tick(now))
+
+
+__all__ = ("Sample",)
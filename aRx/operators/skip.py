@@ -11,6 +11,7 @@ from collections import deque
 
 # Project
 from ..streams import SingleStream
+from ._internal.resumable_slice import ResumableSlice
 
 if T.TYPE_CHECKING:
     # Project
@@ -23,6 +24,10 @@ K = T.TypeVar("K")
 
 class Skip(SingleStream[K]):
     # TODO: Implement Skip athrow
+    __slots__ = ("_count", "_reverse_queue")
+
+    _forwards_demand = True
+
     def __init__(self, count: int, **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
 
@@ -31,6 +36,13 @@ class Skip(SingleStream[K]):
             deque(maxlen=self._count) if count < 0 else None
         )
 
+    def _fuse(self) -> T.Optional[T.Callable[[T.Iterator[K]], T.Iterator[K]]]:
+        if self._reverse_queue is not None:
+            return None
+
+        count = self._count
+        return lambda iterator: ResumableSlice(iterator, count)
+
     async def _asend(self, value: K, namespace: "Namespace") -> None:
         if self._reverse_queue is not None:
             # Skip values from end
@@ -40,6 +52,7 @@ class Skip(SingleStream[K]):
         elif self._count > 0:
             # Skip values from start
             self._count -= 1
+            self._refund_credit()
             return
 
         awaitable = super()._asend(value, namespace)
@@ -0,0 +1,157 @@
+"""SlidingWindowAggregate
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import get_running_loop
+from collections import deque
+
+# External
+from async_tools import attempt_await
+
+# Project
+from ..streams.single_stream import SingleStreamBase
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+
+class SlidingWindowAggregate(SingleStreamBase[K, L]):
+    """Emit the aggregate of the last ``count`` items or of the items seen in the last ``duration``
+    seconds, for every item received.
+
+    Uses the two-stack algorithm, so any associative ``aggregate`` (including non-invertible ones,
+    like :func:`max`) costs amortized O(1) per item, instead of recomputing the whole window.
+
+    By default time windows use the loop clock. When ``timestamp`` is given, the window follows the
+    values event time instead, advancing with the highest timestamp seen, so it can be applied
+    after a :class:`~aRx.operators.reorder.Reorder`.
+    """
+
+    __slots__ = (
+        "_now",
+        "_back",
+        "_count",
+        "_front",
+        "_mapper",
+        "_duration",
+        "_aggregate",
+        "_timestamp",
+        "_back_aggregate",
+    )
+
+    def __init__(
+        self,
+        aggregate: T.Callable[[K, K], K],
+        *,
+        count: T.Optional[int] = None,
+        duration: T.Optional[float] = None,
+        mapper: T.Optional[T.Callable[[L], T.Union[T.Awaitable[K], K]]] = None,
+        timestamp: T.Optional[T.Callable[[L], float]] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        """SlidingWindowAggregate constructor.
+
+        Arguments:
+            aggregate: Associative function that combines two window values into one.
+            count: Maximum number of items kept in the window.
+            duration: Maximum age, in seconds, of the items kept in the window.
+            mapper: Lift each input into the value type used by aggregate (e.g.: 1 for counting).
+            timestamp: Extract the event time, in seconds, of each input.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        # There must be passed at least one window bound as argument
+        assert count is not None or duration is not None
+        assert count is None or count > 0
+        assert duration is None or duration > 0
+
+        self._now = float("-inf")
+        self._count = count
+        self._mapper = mapper
+        self._duration = duration
+        self._aggregate = aggregate
+        self._timestamp = timestamp
+
+        # Back stack holds the raw values in arrival order, together with their running aggregate.
+        # Front stack holds, for each value, the aggregate from it up to the newest value in the
+        # front stack, with the oldest value on top.
+        self._back: T.Deque[T.Tuple[float, K]] = deque()
+        self._front: T.List[T.Tuple[float, K]] = []
+        self._back_aggregate: T.Optional[K] = None
+
+    def _flip(self) -> None:
+        aggregate = self._aggregate
+        timestamp, accumulated = self._back.pop()
+        self._front.append((timestamp, accumulated))
+
+        while self._back:
+            timestamp, value = self._back.pop()
+            accumulated = aggregate(value, accumulated)
+            self._front.append((timestamp, accumulated))
+
+        self._back_aggregate = None
+
+    def _evict(self) -> None:
+        if not self._front:
+            self._flip()
+
+        self._front.pop()
+
+    @property
+    def _oldest(self) -> float:
+        return self._front[-1][0] if self._front else self._back[0][0]
+
+    async def _asend_impl(self, value: L) -> K:
+        if self._timestamp is not None:
+            now = self._now = max(self._now, self._timestamp(value))
+        elif self._duration is not None:
+            now = get_running_loop().time()
+        else:
+            now = 0.0
+
+        if self._mapper is None:
+            item = T.cast(K, value)
+        else:
+            item = await attempt_await(self._mapper(value))
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        if self._duration is not None:
+            limit = now - self._duration
+            while (self._front or self._back) and self._oldest <= limit:
+                self._evict()
+
+        self._back_aggregate = (
+            self._aggregate(T.cast(K, self._back_aggregate), item) if self._back else item
+        )
+        self._back.append((now, item))
+
+        if self._count is not None:
+            while len(self._front) + len(self._back) > self._count:
+                self._evict()
+
+        if not self._front:
+            return self._back_aggregate
+        elif not self._back:
+            return self._front[-1][1]
+        else:
+            return self._aggregate(self._front[-1][1], self._back_aggregate)
+
+    async def _aclose(self) -> None:
+        self._back.clear()
+        self._front.clear()
+        self._back_aggregate = None
+
+        await super()._aclose()
+
+
+__all__ = ("SlidingWindowAggregate",)
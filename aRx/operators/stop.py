@@ -33,6 +33,10 @@ class _StopMark(ObserverClosedError):
 
 
 class Stop(SingleStream[K]):
+    __slots__ = ("_index", "_asend_predicate", "_athrow_predicate")
+
+    _forwards_demand = True
+
     @T.overload
     def __init__(
         self,
@@ -12,9 +12,11 @@ from collections import deque
 # Project
 from ..errors import ObserverClosedError
 from ..streams import SingleStream
+from ._internal.resumable_slice import ResumableSlice
 
 if T.TYPE_CHECKING:
     # Project
+    from ..credits import Credits
     from ..namespace import Namespace
 
 
@@ -27,6 +29,10 @@ class _TakeMark(ObserverClosedError):
 
 
 class Take(SingleStream[K]):
+    __slots__ = ("_count", "_reverse_queue")
+
+    _forwards_demand = True
+
     def __init__(self, count: int, **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
 
@@ -35,6 +41,18 @@ class Take(SingleStream[K]):
             deque(maxlen=self._count) if count < 0 else None
         )
 
+    @property
+    def credits(self) -> T.Optional["Credits"]:
+        # Values taken from the end are only emitted on close, so demand can't be forwarded
+        return super().credits if self._reverse_queue is None else None
+
+    def _fuse(self) -> T.Optional[T.Callable[[T.Iterator[K]], T.Iterator[K]]]:
+        if self._reverse_queue is not None:
+            return None
+
+        count = self._count
+        return lambda iterator: ResumableSlice(iterator, 0, count)
+
     async def _asend(self, value: K, namespace: "Namespace") -> None:
         if self._reverse_queue is None:
             if self._count <= 0:
@@ -0,0 +1,67 @@
+"""Throttle
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import get_running_loop
+
+# Project
+from ._internal.timer_stream import TimerStream
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class Throttle(TimerStream[K, K]):
+    """Emit a value, then ignore the following ones for ``interval`` seconds.
+
+    When ``trailing`` is set, the latest value ignored during the interval is emitted at its end.
+    """
+
+    __slots__ = ("_interval", "_trailing", "_window_end")
+
+    def __init__(self, interval: float, *, trailing: bool = False, **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        assert interval > 0
+
+        self._interval = interval
+        self._trailing = trailing
+        self._window_end = float("-inf")
+
+    def _fire(self, now: float) -> None:
+        if self._emit_pending():
+            self._window_end = now + self._interval
+            self._schedule(self._window_end)
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        now = get_running_loop().time()
+
+        if now < self._window_end:
+            if self._trailing:
+                self._pending = (value, namespace)
+                self._schedule(self._window_end)
+            return
+
+        self._window_end = now + self._interval
+
+        await self._wait_emission()
+
+        awaitable = super()._asend(value, namespace)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await awaitable
+
+
+__all__ = ("Throttle",)
@@ -9,6 +9,8 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
 # Project
+from .conformance import implements
+from .demand_protocol import DemandProtocol
 from .observer_protocol import ObserverProtocol
 from .observable_protocol import ObservableProtocol, ObservableProtocolWithOperators
 from .transformer_protocol import TransformerProtocol, TransformerProtocolWithOperators
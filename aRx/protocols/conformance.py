@@ -0,0 +1,56 @@
+"""Conformance
+
+Cached runtime checks of protocols conformance.
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from functools import lru_cache
+
+_conforming_types: T.Set[T.Tuple[type, type]] = set()
+
+
+@lru_cache(maxsize=None)
+def _protocol_members(protocol: type) -> T.FrozenSet[str]:
+    members = getattr(protocol, "__protocol_attrs__", None)
+    if members is None:
+        # Python < 3.12
+        members = T._get_protocol_attrs(protocol)  # type: ignore
+
+    return frozenset(members)
+
+
+def implements(obj: T.Any, protocol: type) -> bool:
+    """Check whether an object implements a runtime checkable protocol.
+
+    Equivalent to ``isinstance(obj, protocol)``, which checks each protocol member every time it is
+    called. Types that define all protocol members in the class itself are remembered, so further
+    checks of their instances are a single set lookup. Instances that only conform due to their
+    own attributes are always fully checked.
+
+    Arguments:
+        obj: Object to be checked.
+        protocol: Runtime checkable protocol.
+
+    Returns:
+        Whether the object implements the protocol.
+
+    """
+    key = (type(obj), protocol)
+    if key in _conforming_types:
+        return True
+
+    if not isinstance(obj, protocol):
+        return False
+
+    if all(hasattr(key[0], member) for member in _protocol_members(protocol)):
+        _conforming_types.add(key)
+
+    return True
+
+
+__all__ = ("implements",)
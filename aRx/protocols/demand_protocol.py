@@ -0,0 +1,29 @@
+"""DemandProtocol
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+
+# Internal
+import typing as T
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..credits import Credits
+
+
+class DemandProtocol(T.Protocol):
+    """Demand protocol class.
+
+    Optional protocol of observers that limit how much data is sent to them. Any value sent to it
+    must first acquire one of its credits.
+    """
+
+    @property
+    def credits(self) -> T.Optional["Credits"]:
+        ...
+
+
+__all__ = ("DemandProtocol",)
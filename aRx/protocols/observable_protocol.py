@@ -8,6 +8,9 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # Internal
 import typing as T
 
+# Project
+from .conformance import implements
+
 if T.TYPE_CHECKING:
     # Project
     from ..operations import pipe, sink
@@ -46,8 +49,8 @@ def add_operators(transformer: ObservableProtocol[L]) -> ObservableProtocolWithO
     # Project
     from ..observables import Observable
 
-    if isinstance(transformer, ObservableProtocolWithOperators):
-        return transformer
+    if implements(transformer, ObservableProtocolWithOperators):
+        return T.cast(ObservableProtocolWithOperators[L], transformer)
     else:
         # Don't change the original object
         new = copy(transformer)
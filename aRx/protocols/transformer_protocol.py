@@ -10,6 +10,7 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import typing as T
 
 # Project
+from .conformance import implements
 from .observer_protocol import ObserverProtocol
 from .observable_protocol import (
     ObservableProtocol,
@@ -46,8 +47,8 @@ def add_operators(
     transformer: TransformerProtocol[M, N]
 ) -> TransformerProtocolWithOperators[M, N]:
     new = observable_add_operators(transformer)
-    assert isinstance(new, TransformerProtocolWithOperators)
-    return new
+    assert implements(new, TransformerProtocolWithOperators)
+    return T.cast(TransformerProtocolWithOperators[M, N], new)
 
 
 __all__ = ("TransformerProtocol", "TransformerProtocolWithOperators", "add_operators")
@@ -12,3 +12,5 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # Project
 from .multi_stream import MultiStream
 from .single_stream import SingleStream
+from .threadsafe_sender import ThreadSafeSender
+from .sharded_multi_stream import ShardedMultiStream
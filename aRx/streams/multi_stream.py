@@ -8,6 +8,8 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # Internal
 import typing as T
 from asyncio import ALL_COMPLETED, Future, AbstractEventLoop, wait, get_running_loop
+from weakref import WeakSet
+from itertools import chain
 from contextlib import suppress
 
 # External
@@ -15,6 +17,7 @@ from async_tools import wait_with_care
 
 # Project
 from ..errors import ObserverClosedError
+from ..credits import get_credits
 from ..observers import Observer
 from ..operations import observe
 from ..observables import Observable
@@ -37,8 +40,21 @@ class MultiStream(Observer[K], Observable[K]):
         The AsyncMultiStream is hot in the sense that it will drop events if there are currently no
         observers running, and all redirection only enqueue the observers action, not waiting for
         it's execution.
+
+    .. Note::
+
+        Values are only sent to observers that implement the demand protocol after acquiring one of
+        their credits, and asend waits for all observers. So the slowest observer demand is
+        propagated upstream.
+
+    .. Note::
+
+        Observers can be weakly observed, through ``observe(stream, observer, weak=True)``. They
+        are removed from the stream once garbage collected, even if never closed.
     """
 
+    __slots__ = ("_observers", "_disposables", "_weak_observers")
+
     def __init__(self, **kwargs: T.Any) -> None:
         """MultiStream constructor.
 
@@ -51,10 +67,15 @@ class MultiStream(Observer[K], Observable[K]):
         # Internal
         self._observers: T.Set["ObserverProtocol[K]"] = set()
         self._disposables: T.Optional[T.Awaitable[T.Any]] = None
+        self._weak_observers: "WeakSet[ObserverProtocol[K]]" = WeakSet()
+
+    def _iter_observers(self) -> T.Iterator["ObserverProtocol[K]"]:
+        # Snapshot weak observers, as they can be garbage collected during iteration
+        return chain(self._observers, tuple(self._weak_observers))
 
     async def _clear_closed_observers(self) -> None:
         await wait_with_care(
-            *set(observe(self, obv).dispose() for obv in self._observers if obv.closed)
+            *set(observe(self, obv).dispose() for obv in self._iter_observers() if obv.closed)
         )
         self._disposables = None
 
@@ -82,16 +103,37 @@ class MultiStream(Observer[K], Observable[K]):
             # Enqueue clearing
             self._disposables = loop.create_task(self._clear_closed_observers())
 
+    @staticmethod
+    async def _asend_with_credit(
+        observer: "ObserverProtocol[K]", value: K, namespace: "Namespace"
+    ) -> None:
+        credits = get_credits(observer)
+        assert credits is not None
+
+        if not credits.try_acquire():
+            await credits.acquire()
+
+        awaitable = observer.asend(value, namespace)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await awaitable
+
     async def _asend(self, value: K, namespace: "Namespace") -> None:
-        if not self._observers:
+        if not (self._observers or self._weak_observers):
             return
 
         loop = get_running_loop()
 
         awaitable = wait(
             tuple(
-                loop.create_task(obv.asend(value, namespace))
-                for obv in self._observers
+                loop.create_task(
+                    obv.asend(value, namespace)
+                    if get_credits(obv) is None
+                    else self._asend_with_credit(obv, value, namespace)
+                )
+                for obv in self._iter_observers()
                 if not obv.closed
             ),
             return_when=ALL_COMPLETED,
@@ -107,12 +149,12 @@ class MultiStream(Observer[K], Observable[K]):
         self._process_done(get_running_loop(), done)
 
     async def _athrow(self, main_exc: Exception, namespace: "Namespace") -> bool:
-        if self._observers:
+        if self._observers or self._weak_observers:
             loop = get_running_loop()
             done, pending = await wait(
                 tuple(
                     loop.create_task(obv.athrow(main_exc, namespace))
-                    for obv in self._observers
+                    for obv in self._iter_observers()
                     if not obv.closed
                 ),
                 return_when=ALL_COMPLETED,
@@ -129,15 +171,22 @@ class MultiStream(Observer[K], Observable[K]):
         if self._disposables:
             await self._disposables
 
-        await wait_with_care(*(observe(self, observer).dispose() for observer in self._observers))
+        await wait_with_care(
+            *(observe(self, observer).dispose() for observer in self._iter_observers())
+        )
 
-    async def __observe__(self, observer: "ObserverProtocol[K]") -> None:
+    async def __observe__(self, observer: "ObserverProtocol[K]", *, weak: bool = False) -> None:
         # Add observers to internal observation set
-        self._observers.add(observer)
+        if weak:
+            self._weak_observers.add(observer)
+        else:
+            self._observers.add(observer)
 
     async def __dispose__(self, observer: "ObserverProtocol[K]") -> None:
         with suppress(KeyError):
             self._observers.remove(observer)
 
+        self._weak_observers.discard(observer)
+
 
 __all__ = ("MultiStream",)
@@ -0,0 +1,272 @@
+"""ShardedMultiStream
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import (
+    AbstractEventLoop,
+    wrap_future,
+    new_event_loop,
+    set_event_loop,
+    get_running_loop,
+    run_coroutine_threadsafe,
+)
+from threading import Thread
+
+# Project
+from ..errors import ObserverClosedError
+from ..observers import Observer
+from ..operations import observe
+from ..observables import Observable
+from .multi_stream import MultiStream
+from .threadsafe_sender import ThreadSafeSender
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+    from ..protocols import ObserverProtocol
+
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+
+async def _send(sender: ThreadSafeSender[K], value: K) -> None:
+    # Never block the running loop, wait for space in an executor instead
+    if not sender.send(value, timeout=0):
+        await get_running_loop().run_in_executor(None, sender.send, value)
+
+
+async def _dispose(stream: MultiStream[K], observer: "ObserverProtocol[K]") -> None:
+    await observe(stream, observer).dispose()
+
+
+def _run_in(loop: AbstractEventLoop, awaitable: T.Awaitable[L]) -> T.Awaitable[L]:
+    async def wrapper() -> L:
+        return await awaitable
+
+    return wrap_future(run_coroutine_threadsafe(wrapper(), loop))
+
+
+class _Shard(T.Generic[K]):
+    __slots__ = ("loop", "stream", "sender", "thread")
+
+    def __init__(self, index: int, maxsize: T.Optional[int]) -> None:
+        self.loop = new_event_loop()
+        self.stream: MultiStream[K] = MultiStream()
+        self.sender = ThreadSafeSender(self.stream, loop=self.loop, maxsize=maxsize)
+        self.thread = Thread(target=self._run, name=f"aRx-shard-{index}", daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        finally:
+            self.loop.close()
+
+    async def aclose(self) -> None:
+        # Deliver all pending data, and close the shard stream, before stopping its loop
+        await _run_in(self.loop, self.sender.aclose())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        await get_running_loop().run_in_executor(None, self.thread.join)
+
+
+class _Forwarder(Observer[K]):
+    """Observer that forwards the data of a shard to a sender of another loop."""
+
+    __slots__ = ("_sender",)
+
+    def __init__(self, sender: ThreadSafeSender[K], **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        # Internal
+        self._sender = sender
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        try:
+            await _send(self._sender, value)
+        except ObserverClosedError:
+            # Must use create_task to avoid deadlock
+            get_running_loop().create_task(self.aclose())
+
+    async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
+        # Exceptions are thrown directly into the sender, once, by the ShardedMultiStream
+        return False
+
+    async def _aclose(self) -> None:
+        pass
+
+
+class _ShardObservable(Observable[K]):
+    """Observable of the data of a single shard."""
+
+    __slots__ = ("_index", "_parent")
+
+    def __init__(self, parent: "ShardedMultiStream[K]", index: int, **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        # Internal
+        self._index = index
+        self._parent = parent
+
+    async def __observe__(self, observer: "ObserverProtocol[K]") -> None:
+        shard = self._parent._get_shards()[self._index]
+        await _run_in(shard.loop, shard.stream.__observe__(observer))
+
+    async def __dispose__(self, observer: "ObserverProtocol[K]") -> None:
+        shards = self._parent._shards
+        if shards is None:
+            return
+
+        shard = shards[self._index]
+        if not shard.loop.is_closed():
+            # Dispose, and close, observer from the loop it runs on
+            await _run_in(shard.loop, _dispose(shard.stream, observer))
+
+
+class ShardedMultiStream(Observer[K], Observable[K]):
+    """Hot stream whose data is partitioned between multiple event loops, each in its own thread.
+
+    Each value is sent to a single shard, chosen by the hash of ``key(value)``, which delivers it
+    to a :class:`~.MultiStream` in the shard loop. Values are handed to shards, and back from
+    them, in batches through :class:`~.ThreadSafeSender`, so each shard takes its share of the
+    framework overhead.
+
+    Observers of the ShardedMultiStream receive the data of all shards in the loop they were
+    observed from. Observers of a single shard, obtained by :meth:`shard`, run in the shard loop.
+
+    Shard loops are started on first use, and closing the ShardedMultiStream delivers all pending
+    data, closes every observer, unless kept alive, and stops the shard loops.
+
+    .. Note::
+
+        Exceptions are thrown into all shards, and once into each observer of all shards.
+
+    .. Warning::
+
+        Observers of a single shard must only be used from the shard loop.
+    """
+
+    __slots__ = ("_key", "_count", "_shards", "_maxsize", "_observers")
+
+    def __init__(
+        self,
+        shards: int,
+        *,
+        key: T.Optional[T.Callable[[K], T.Hashable]] = None,
+        maxsize: T.Optional[int] = 1024,
+        **kwargs: T.Any,
+    ) -> None:
+        """ShardedMultiStream constructor.
+
+        Arguments:
+            shards: Amount of shards, each with its own event loop and thread.
+            key: Function that extracts the partition key from each value, the value by default.
+            maxsize: Maximum amount of values queued for each shard, or observer, before asend
+                     waits for them to be delivered.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        assert shards > 0
+
+        # Internal
+        self._key = key
+        self._count = shards
+        self._shards: T.Optional[T.List[_Shard[K]]] = None
+        self._maxsize = maxsize
+        self._observers: T.Dict[
+            "ObserverProtocol[K]", T.Tuple[ThreadSafeSender[K], T.List[_Forwarder[K]]]
+        ] = {}
+
+    def _get_shards(self) -> T.List[_Shard[K]]:
+        if self.closed:
+            raise ObserverClosedError(self)
+
+        if self._shards is None:
+            self._shards = [_Shard(index, self._maxsize) for index in range(self._count)]
+
+        return self._shards
+
+    def shard(self, index: int) -> Observable[K]:
+        """Observable of the data of a single shard.
+
+        Arguments:
+            index: Index of the shard.
+
+        Returns:
+            Observable whose observers run in the shard loop.
+
+        """
+        if not 0 <= index < self._count:
+            raise IndexError(f"{self}: Shard index out of range: {index}")
+
+        return _ShardObservable(self, index)
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        shards = self._get_shards()
+        key = value if self._key is None else self._key(value)
+        awaitable = _send(shards[hash(key) % self._count].sender, value)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del key, value
+
+        await awaitable
+
+    async def _athrow(self, main_exc: Exception, namespace: "Namespace") -> bool:
+        if self._shards is not None:
+            for shard in self._shards:
+                shard.sender.throw(main_exc)
+
+        for sender, _ in self._observers.values():
+            if not sender.closed:
+                sender.throw(main_exc)
+
+        # A ShardedMultiStream never closes on athrow
+        return False
+
+    async def _aclose(self) -> None:
+        shards, self._shards = self._shards, None
+        if shards is not None:
+            for shard in shards:
+                await shard.aclose()
+
+        observers, self._observers = self._observers, {}
+        for sender, _ in observers.values():
+            await sender.aclose()
+
+    async def __observe__(self, observer: "ObserverProtocol[K]") -> None:
+        if observer in self._observers:
+            return
+
+        shards = self._get_shards()
+        sender = ThreadSafeSender(observer, maxsize=self._maxsize)
+        forwarders = [_Forwarder(sender) for _ in shards]
+        self._observers[observer] = (sender, forwarders)
+
+        for shard, forwarder in zip(shards, forwarders):
+            await _run_in(shard.loop, shard.stream.__observe__(forwarder))
+
+    async def __dispose__(self, observer: "ObserverProtocol[K]") -> None:
+        entry = self._observers.pop(observer, None)
+        if entry is None:
+            return
+
+        sender, forwarders = entry
+        if self._shards is not None:
+            for shard, forwarder in zip(self._shards, forwarders):
+                await _run_in(shard.loop, _dispose(shard.stream, forwarder))
+
+        # Deliver data already forwarded to the observer
+        await sender.aclose()
+
+
+__all__ = ("ShardedMultiStream",)
@@ -15,12 +15,14 @@ from async_tools.abstract import AsyncABCMeta
 
 # Project
 from ..errors import SingleStreamError, ObserverClosedError
+from ..credits import get_credits
 from ..observers import Observer
 from ..operations import observe
 from ..observables import Observable
 
 if T.TYPE_CHECKING:
     # Project
+    from ..credits import Credits
     from ..namespace import Namespace
     from ..protocols import ObserverProtocol
 
@@ -42,6 +44,13 @@ class SingleStreamBase(Observable[K], Observer[L], metaclass=AsyncABCMeta):
 
     __slots__ = ("__lock", "_observer")
 
+    _forwards_demand: T.ClassVar[bool] = False
+    """Whether the demand of the observer is forwarded upstream.
+
+    Only safe for streams that emit at most one value for each value received, which must refund
+    the credit of any value not emitted through :meth:`_refund_credit`.
+    """
+
     def __init__(self, **kwargs: T.Any) -> None:
         """SingleStream constructor.
 
@@ -62,8 +71,35 @@ class SingleStreamBase(Observable[K], Observer[L], metaclass=AsyncABCMeta):
 
         return self.__lock
 
-    async def _asend(self, value: L, namespace: "Namespace") -> None:
+    @property
+    def credits(self) -> T.Optional["Credits"]:
+        """Credits of the observer, when demand is forwarded and the observer implements it."""
+        if not self._forwards_demand or self._observer is None:
+            return None
+
+        return get_credits(self._observer)
+
+    def _refund_credit(self) -> None:
+        """Return the credit acquired for a value that wasn't emitted."""
+        credits = self.credits
+        if credits is not None:
+            credits.grant()
+
+    def _fuse(self) -> T.Optional[T.Callable[[T.Iterator[L]], T.Iterator[K]]]:
+        """Synchronous equivalent of this stream, used by sources to pull data through it.
 
+        Only streams that don't handle errors themselves and whose transformation is synchronous
+        can be fused. Errors raised while pulling are thrown straight into the first observer that
+        isn't fused.
+
+        Returns:
+            Function that applies this stream transformation to an iterator, or None when it can't
+            be fused.
+
+        """
+        return None
+
+    async def _asend(self, value: L, namespace: "Namespace") -> None:
         # Wait for observers
         await self._lock
 
@@ -81,7 +117,6 @@ class SingleStreamBase(Observable[K], Observer[L], metaclass=AsyncABCMeta):
         raise NotImplementedError
 
     async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
-
         # Wait for observers
         await self._lock
 
@@ -98,7 +133,6 @@ class SingleStreamBase(Observable[K], Observer[L], metaclass=AsyncABCMeta):
         return False
 
     async def _aclose(self) -> None:
-
         # Cancel all awaiting event in the case we weren't subscribed
         if not self._lock.done():
             self._lock.set_exception(ObserverClosedError(self))
@@ -135,6 +169,8 @@ class SingleStreamBase(Observable[K], Observer[L], metaclass=AsyncABCMeta):
 
 
 class SingleStream(SingleStreamBase[K, K]):
+    __slots__ = ()
+
     async def _asend_impl(self, value: K) -> K:
         return value
 
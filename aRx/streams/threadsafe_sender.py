@@ -0,0 +1,241 @@
+"""ThreadSafeSender
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import Task, AbstractEventLoop, get_running_loop
+from threading import Lock, Condition
+from collections import deque
+
+# Project
+from ..errors import ObserverClosedError
+
+if T.TYPE_CHECKING:
+    # Internal
+    from asyncio import Future
+
+    # Project
+    from ..protocols import ObserverProtocol
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+# Item types
+_SEND = 0
+_THROW = 1
+_CLOSE = 2
+
+
+class ThreadSafeSender(T.Generic[K]):
+    """Send data, from any thread, into an observer that lives in an event loop.
+
+    Data is appended to a queue, which is drained by the loop in batches. Only the first item
+    queued after each batch wakes up the loop, so producers don't pay for a future and a loop
+    wakeup per item.
+
+    When ``maxsize`` is given, at most that many values are queued or being delivered. A full
+    sender either blocks producers or, with ``overflow="drop"``, drops new values.
+
+    .. Note::
+
+        A blocking sender must not be used from the loop thread, as it would wait for the loop
+        it blocks.
+    """
+
+    __slots__ = (
+        "_loop",
+        "_size",
+        "_task",
+        "_queue",
+        "_closed",
+        "_dropped",
+        "_maxsize",
+        "_drained",
+        "_not_full",
+        "_observer",
+        "_overflow",
+        "_scheduled",
+    )
+
+    def __init__(
+        self,
+        observer: "ObserverProtocol[K]",
+        *,
+        loop: T.Optional[AbstractEventLoop] = None,
+        maxsize: T.Optional[int] = None,
+        overflow: str = "block",
+    ) -> None:
+        """ThreadSafeSender constructor.
+
+        Arguments:
+            observer: Observer that receives the data.
+            loop: Event loop of the observer, the running loop by default.
+            maxsize: Maximum amount of values queued or being delivered.
+            overflow: What to do with values sent while full, either "block" or "drop".
+
+        """
+        assert maxsize is None or maxsize > 0
+
+        if overflow not in ("block", "drop"):
+            raise ValueError(f"Unknown ThreadSafeSender overflow: {overflow}")
+
+        self._loop = get_running_loop() if loop is None else loop
+        self._size = 0
+        self._task: T.Optional["Task[None]"] = None
+        self._queue: T.Deque[T.Tuple[int, T.Any]] = deque()
+        self._closed = False
+        self._dropped = 0
+        self._maxsize = maxsize
+        self._drained: "Future[None]" = self._loop.create_future()
+        self._not_full = Condition(Lock())
+        self._observer = observer
+        self._overflow = overflow
+        self._scheduled = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the sender is closed, after which it doesn't accept data."""
+        return self._closed
+
+    @property
+    def dropped(self) -> int:
+        """Amount of values dropped due to overflow."""
+        return self._dropped
+
+    def _enqueue(self, kind: int, value: T.Any) -> None:
+        # Must be called while holding the lock
+        self._queue.append((kind, value))
+
+        if not self._scheduled:
+            # Only wake up the loop once per batch
+            self._scheduled = True
+            self._loop.call_soon_threadsafe(self._wakeup)
+
+    def send(self, value: K, timeout: T.Optional[float] = None) -> bool:
+        """Send a value to the observer.
+
+        Arguments:
+            value: Value to be sent.
+            timeout: Maximum time, in seconds, a blocking sender waits for space.
+
+        Raises:
+            ObserverClosedError: When the sender is closed.
+
+        Returns:
+            Whether the value was queued, false when it was dropped or the timeout expired.
+
+        """
+        with self._not_full:
+            if self._closed:
+                raise ObserverClosedError(self._observer)
+
+            maxsize = self._maxsize
+            if maxsize is not None and self._size >= maxsize:
+                if self._overflow == "drop":
+                    self._dropped += 1
+                    return False
+
+                if not self._not_full.wait_for(
+                    lambda: self._closed or self._size < maxsize, timeout
+                ):
+                    return False
+
+                if self._closed:
+                    raise ObserverClosedError(self._observer)
+
+            self._size += 1
+            self._enqueue(_SEND, value)
+
+        return True
+
+    def throw(self, exc: Exception) -> None:
+        """Throw an exception into the observer, after any data already sent.
+
+        Arguments:
+            exc: Exception to be thrown.
+
+        Raises:
+            ObserverClosedError: When the sender is closed.
+
+        """
+        with self._not_full:
+            if self._closed:
+                raise ObserverClosedError(self._observer)
+
+            self._enqueue(_THROW, exc)
+
+    def close(self) -> None:
+        """Close the observer, unless kept alive, after all data already sent is delivered."""
+        with self._not_full:
+            if self._closed:
+                return
+
+            self._closed = True
+            self._enqueue(_CLOSE, None)
+
+            # Wake up blocked producers, so they find out it is closed
+            self._not_full.notify_all()
+
+    async def aclose(self) -> None:
+        """Close the sender, from the loop thread, waiting for all data to be delivered."""
+        self.close()
+        await self._drained
+
+    def _wakeup(self) -> None:
+        if self._task is None:
+            self._task = self._loop.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        observer = self._observer
+        finished = False
+
+        while not finished:
+            with self._not_full:
+                batch = self._queue
+                if not batch:
+                    self._task = None
+                    self._scheduled = False
+                    return
+
+                self._queue = deque()
+
+            for kind, value in batch:
+                try:
+                    if kind == _SEND:
+                        await observer.asend(value)
+                    elif kind == _THROW:
+                        await observer.athrow(value)
+                    else:
+                        finished = True
+                        if not (observer.closed or observer.keep_alive):
+                            await observer.aclose()
+                except ObserverClosedError:
+                    # Observer was closed elsewhere, so stop accepting data
+                    finished = True
+                    break
+                except Exception as exc:
+                    self._loop.call_exception_handler(
+                        {"message": f"{self}: Failed to deliver data", "exception": exc}
+                    )
+
+            with self._not_full:
+                self._size -= sum(kind == _SEND for kind, _ in batch)
+                if finished:
+                    self._closed = True
+                    self._queue.clear()
+
+                self._not_full.notify_all()
+
+            # Remove reference early to avoid keeping large objects in memory
+            del batch, value
+
+        self._task = None
+        self._drained.set_result(None)
+
+
+__all__ = ("ThreadSafeSender",)
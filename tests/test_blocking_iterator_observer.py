@@ -0,0 +1,135 @@
+# Internal
+import asyncio
+import unittest
+import threading
+
+# External
+import asynctest
+
+from aRx.observers import BlockingIteratorObserver
+
+
+def consume(observer, results, errors):
+    try:
+        for value in observer:
+            results.append(value)
+    except Exception as exc:
+        errors.append(exc)
+
+
+# noinspection PyAttributeOutsideInit
+@asynctest.strict
+class TestBlockingIteratorObserver(asynctest.TestCase, unittest.TestCase):
+    async def setUp(self):
+        self.exception_ctx = None
+        self.loop.set_exception_handler(lambda l, c: setattr(self, "exception_ctx", c))
+
+    async def join(self, thread):
+        await asyncio.wait_for(self.loop.run_in_executor(None, thread.join), 1)
+
+    async def test_iterate(self):
+        errors = []
+        results = []
+        observer = BlockingIteratorObserver(maxsize=16, batch_size=4)
+
+        thread = threading.Thread(target=consume, args=(observer, results, errors))
+        thread.start()
+
+        for x in range(1000):
+            await observer.asend(x)
+
+        await observer.aclose()
+        await self.join(thread)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(errors, [])
+        self.assertEqual(results, list(range(1000)))
+
+    async def test_iterate_athrow(self):
+        errors = []
+        results = []
+        observer = BlockingIteratorObserver()
+
+        thread = threading.Thread(target=consume, args=(observer, results, errors))
+        thread.start()
+
+        await observer.asend(1)
+        await observer.asend(2)
+        await observer.athrow(ValueError("Test"))
+        await self.join(thread)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, [1, 2])
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+
+    async def test_iterate_timeout(self):
+        errors = []
+        results = []
+        observer = BlockingIteratorObserver(timeout=0.01)
+
+        thread = threading.Thread(target=consume, args=(observer, results, errors))
+        thread.start()
+        await self.join(thread)
+
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], TimeoutError)
+
+        await observer.aclose()
+
+    async def test_close_from_thread(self):
+        results = []
+        observer = BlockingIteratorObserver(maxsize=4, batch_size=2)
+
+        def take_two():
+            iterator = iter(observer)
+            results.extend((next(iterator), next(iterator)))
+            observer.close()
+
+        thread = threading.Thread(target=take_two)
+        thread.start()
+
+        # Iteration stopping must release asend, even while waiting for room
+        for x in range(100):
+            if observer.closed:
+                break
+
+            await observer.asend(x)
+
+        await self.join(thread)
+
+        for _ in range(100):
+            if observer.closed:
+                break
+
+            await asyncio.sleep(0.01)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, [0, 1])
+        self.assertTrue(observer.closed)
+
+
+    async def test_close_before_first_value(self):
+        observer = BlockingIteratorObserver()
+
+        await self.loop.run_in_executor(None, observer.close)
+
+        for _ in range(100):
+            if observer.closed:
+                break
+
+            await asyncio.sleep(0.01)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(observer.closed)
+
+        # Observers created outside of a loop close right away
+        observer = await self.loop.run_in_executor(None, BlockingIteratorObserver)
+        await self.loop.run_in_executor(None, observer.close)
+
+        self.assertTrue(observer.closed)
+        self.assertEqual(list(observer), [])
+
+if __name__ == "__main__":
+    unittest.main()
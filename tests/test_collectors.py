@@ -0,0 +1,59 @@
+# Internal
+import unittest
+
+# External
+import asynctest
+
+from aRx.errors import ConsumerClosedError
+from aRx.observers import Last, Count, First, ToDict, ToList, Consumer
+from aRx.operations import observe
+from aRx.observables import FromIterable
+
+
+# noinspection PyAttributeOutsideInit
+@asynctest.strict
+class TestCollectors(asynctest.TestCase, unittest.TestCase):
+    async def setUp(self):
+        self.exception_ctx = None
+        self.loop.set_exception_handler(lambda l, c: setattr(self, "exception_ctx", c))
+
+    async def collect(self, iterable, collector):
+        async with observe(FromIterable(iterable), collector):
+            result = await collector
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(collector.closed)
+
+        return result
+
+    async def test_first(self):
+        self.assertEqual(await self.collect(range(3, 10), First()), 3)
+        self.assertEqual(await self.collect((), First(default=None)), None)
+        self.assertEqual(await self.collect(range(3, 10), Consumer()), 3)
+
+        with self.assertRaises(ConsumerClosedError):
+            await self.collect((), First())
+
+    async def test_last(self):
+        self.assertEqual(await self.collect(range(3, 10), Last()), 9)
+
+        with self.assertRaises(ConsumerClosedError):
+            await self.collect((), Last())
+
+    async def test_count(self):
+        self.assertEqual(await self.collect(range(10), Count()), 10)
+        self.assertEqual(await self.collect([[1, 2], [3]], Count(batched=True)), 3)
+
+    async def test_to_list(self):
+        self.assertEqual(await self.collect(range(10), ToList()), list(range(10)))
+        self.assertEqual(await self.collect(range(10), ToList(size_hint=4)), list(range(10)))
+        self.assertEqual(await self.collect(range(3), ToList(size_hint=8)), list(range(3)))
+        self.assertEqual(
+            await self.collect([[1, 2], [3], [4, 5, 6]], ToList(size_hint=4, batched=True)),
+            [1, 2, 3, 4, 5, 6],
+        )
+
+    async def test_to_dict(self):
+        self.assertEqual(
+            await self.collect(range(4), ToDict(lambda x: x % 2, lambda x: x * 10)), {0: 20, 1: 30}
+        )
@@ -0,0 +1,145 @@
+# Internal
+import asyncio
+import unittest
+
+# External
+import asynctest
+
+from aRx.credits import Credits
+from aRx.streams import MultiStream
+from aRx.observers import Observer, IteratorObserver
+from aRx.operators import Map, Filter
+from aRx.observables import FromIterable
+
+
+# noinspection PyAttributeOutsideInit
+@asynctest.strict
+class TestCredits(asynctest.TestCase, unittest.TestCase):
+    async def setUp(self):
+        self.exception_ctx = None
+        self.loop.set_exception_handler(lambda l, c: setattr(self, "exception_ctx", c))
+
+    async def test_credits(self):
+        credits = Credits(1)
+
+        self.assertTrue(credits.try_acquire())
+        self.assertFalse(credits.try_acquire())
+
+        acquire = self.loop.create_task(credits.acquire())
+        await asyncio.sleep(0)
+        self.assertFalse(acquire.done())
+
+        credits.grant(2)
+        await acquire
+        self.assertEqual(credits.available, 1)
+
+        credits.close()
+        for _ in range(3):
+            await credits.acquire()
+
+        self.assertTrue(credits.closed)
+
+    async def test_prefetch(self):
+        produced = []
+
+        def source():
+            for x in range(20):
+                produced.append(x)
+                yield x
+
+        observer = IteratorObserver(prefetch=2)
+        results = []
+
+        async with FromIterable(source()) | Map(lambda x: x * 2) > observer:
+            async for value in observer:
+                results.append(value)
+                await asyncio.sleep(0.001)
+                # At most prefetch values ahead of iteration, plus the one waiting for a credit
+                self.assertLessEqual(len(produced), len(results) + 3)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, [x * 2 for x in range(20)])
+
+    async def test_prefetch_refund(self):
+        observer = IteratorObserver(prefetch=1)
+        results = []
+
+        async def iterate():
+            async with FromIterable(range(20)) | Filter(lambda x: x % 5 == 0) > observer:
+                async for value in observer:
+                    results.append(value)
+
+        # Values dropped by Filter must give back their credit, otherwise iteration stalls
+        await asyncio.wait_for(iterate(), 1)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, [0, 5, 10, 15])
+
+    async def test_error_refund(self):
+        class Collector(Observer):
+            __slots__ = ("credits", "results", "done")
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.credits = Credits(1)
+                self.results = []
+                self.done = asyncio.get_running_loop().create_future()
+
+            async def _asend(self, value, _):
+                self.results.append(value)
+                self.credits.grant()
+
+            async def _athrow(self, exc, _):
+                self.results.append(type(exc))
+                return False
+
+            async def _aclose(self):
+                self.done.set_result(None)
+
+        def mapper(x):
+            if x == 2:
+                raise ValueError(x)
+            return x
+
+        def predicate(x):
+            if x == 3:
+                raise ValueError(x)
+            return True
+
+        for operator in (Map(mapper), Filter(predicate)):
+            observer = Collector()
+
+            async with FromIterable(range(5)) | operator > observer:
+                # Values whose mapping failed must give back their credit, otherwise it stalls
+                await asyncio.wait_for(asyncio.shield(observer.done), 1)
+
+            self.assertIsNone(self.exception_ctx)
+            self.assertEqual(len(observer.results), 5)
+            self.assertIn(ValueError, observer.results)
+
+    async def test_multistream_demand(self):
+        observer = IteratorObserver(prefetch=1)
+        sent = 0
+
+        async with MultiStream() as stream, stream > observer:
+
+            async def send():
+                nonlocal sent
+                for x in range(5):
+                    await stream.asend(x)
+                    sent += 1
+
+            sender = self.loop.create_task(send())
+            await asyncio.sleep(0.01)
+            self.assertEqual(sent, 1)
+
+            self.assertEqual(await observer.__anext__(), 0)
+            await asyncio.sleep(0.01)
+            self.assertEqual(sent, 2)
+
+            for x in range(1, 5):
+                self.assertEqual(await observer.__anext__(), x)
+
+            await sender
+
+        self.assertIsNone(self.exception_ctx)
@@ -0,0 +1,80 @@
+# Internal
+import gc
+import inspect
+import unittest
+import tracemalloc
+from contextlib import AbstractAsyncContextManager
+
+# External
+import aRx.streams
+import aRx.observers
+import aRx.operators
+import aRx.observables
+from aRx.observers import AnonymousObserver
+from aRx.operators import Map, Filter
+from aRx.operations import pipe, observe
+from aRx.observables import FromIterable
+
+# Instances created for each measurement
+AMOUNT = 10000
+
+# Upper bounds, in bytes, of the memory footprint of each instance
+OBSERVER_FOOTPRINT = 256
+PIPELINE_STAGE_FOOTPRINT = 512
+
+
+def noop(_):
+    return _
+
+
+def footprint(factory):
+    """Measure the average amount of bytes allocated by each object created by factory."""
+    gc.collect()
+    instances = [None] * AMOUNT
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for index in range(AMOUNT):
+            instances[index] = factory()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return (after - before) / AMOUNT
+
+
+class TestMemory(unittest.TestCase):
+    def test_slots(self):
+        for module in (aRx.streams, aRx.observers, aRx.operators, aRx.observables):
+            for cls in vars(module).values():
+                if not (inspect.isclass(cls) and cls.__module__.startswith("aRx.")):
+                    continue
+
+                for base in cls.__mro__:
+                    if base.__module__.startswith("aRx."):
+                        with self.subTest(cls=cls.__qualname__, base=base.__qualname__):
+                            self.assertIn("__slots__", vars(base))
+
+    def test_async_context_managers(self):
+        # Not subclassed, as its ABC has no slots, but the protocol is still implemented
+        for cls in (AnonymousObserver, observe):
+            with self.subTest(cls=cls.__qualname__):
+                self.assertNotIn(AbstractAsyncContextManager, cls.__mro__)
+                self.assertTrue(issubclass(cls, AbstractAsyncContextManager))
+
+    def test_observer_footprint(self):
+        size = footprint(lambda: AnonymousObserver(asend=noop))
+        self.assertLess(size, OBSERVER_FOOTPRINT, f"{size:.0f} bytes per observer")
+
+    def test_pipeline_stage_footprint(self):
+        source = FromIterable(())
+        size = footprint(lambda: pipe(source, Map(noop)))
+        self.assertLess(size, PIPELINE_STAGE_FOOTPRINT, f"{size:.0f} bytes per pipeline stage")
+
+        size = footprint(lambda: pipe(source, Filter(noop)))
+        self.assertLess(size, PIPELINE_STAGE_FOOTPRINT, f"{size:.0f} bytes per pipeline stage")
+
+
+if __name__ == "__main__":
+    unittest.main()
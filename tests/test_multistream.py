@@ -1,4 +1,5 @@
 # Internal
+import gc
 import unittest
 
 # External
@@ -8,6 +9,7 @@ from async_tools import expires
 from aRx.streams import MultiStream
 from aRx.observers import AnonymousObserver
 from aRx.operators import Map, Filter
+from aRx.operations import observe
 
 
 def r(_):
@@ -39,3 +41,37 @@ class TestMultiStream(asynctest.TestCase, unittest.TestCase):
             await a.aclose()
 
         self.assertFalse(timeout.expired)
+
+    async def test_weak_observe(self):
+        received = []
+        stream = MultiStream()
+        observer = AnonymousObserver(asend=lambda value, _: received.append(value))
+
+        await observe(stream, observer, weak=True)
+
+        await stream.asend(1)
+        self.assertEqual(received, [1])
+
+        # Dropping the last reference to the observer is enough to stop observing it
+        del observer
+        gc.collect()
+
+        await stream.asend(2)
+        self.assertEqual(received, [1])
+        self.assertFalse(stream._weak_observers)
+
+        await stream.aclose()
+
+    async def test_weak_observe_dispose(self):
+        received = []
+        stream = MultiStream()
+        observer = AnonymousObserver(asend=lambda value, _: received.append(value))
+
+        async with observe(stream, observer, weak=True):
+            await stream.asend(1)
+
+        await stream.asend(2)
+        self.assertEqual(received, [1])
+        self.assertTrue(observer.closed)
+
+        await stream.aclose()
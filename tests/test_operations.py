@@ -0,0 +1,223 @@
+# Internal
+import asyncio
+import unittest
+
+# External
+import asynctest
+
+from aRx.observers import AnonymousObserver
+from aRx.operators import Map, Skip, Take, Filter
+from aRx.operations import join, merge, concat, pipeline, zip_with, merge_sorted, combine_latest
+from aRx.observables import FromIterable, FromAsyncIterable
+
+
+# noinspection PyAttributeOutsideInit
+@asynctest.strict
+class TestOperations(asynctest.TestCase, unittest.TestCase):
+    async def setUp(self):
+        self.exception_ctx = None
+        self.loop.set_exception_handler(lambda l, c: setattr(self, "exception_ctx", c))
+
+    async def collect(self, observable):
+        results = []
+        done = self.loop.create_future()
+
+        listener = AnonymousObserver(
+            asend=lambda d, _: results.append(d), aclose=lambda: done.set_result(None)
+        )
+
+        async with observable > listener:
+            await done
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(listener.closed)
+
+        return results
+
+    async def test_fused_pipeline(self):
+        def pipeline(fuse):
+            return (
+                FromIterable(range(100), fuse=fuse, batch_size=8)
+                | Map(lambda x: x * 2)
+                | Filter(lambda x: x % 3 == 0)
+                | Skip(2)
+                | Take(5)
+            )
+
+        expected = await self.collect(pipeline(False))
+
+        self.assertEqual(expected, [12, 18, 24, 30, 36])
+        self.assertEqual(await self.collect(pipeline(True)), expected)
+
+    async def test_fused_pipeline_error(self):
+        results = []
+        errors = []
+        done = self.loop.create_future()
+
+        def mapper(x):
+            if x == 3:
+                raise ValueError(x)
+            return x
+
+        listener = AnonymousObserver(
+            asend=lambda d, _: results.append(d),
+            athrow=lambda e, _: errors.append(e),
+            aclose=lambda: done.set_result(None),
+        )
+
+        async with FromIterable(range(6), fuse=True) | Map(mapper) > listener:
+            await done
+
+        self.assertEqual(results, [0, 1, 2, 4, 5])
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+
+    async def test_fused_source_error(self):
+        def source():
+            yield from range(3)
+            raise ValueError("source")
+
+        async def observe(fuse):
+            results = []
+            errors = []
+            failed = self.loop.create_future()
+
+            def athrow(exc, _):
+                errors.append(exc)
+                failed.set_result(None)
+
+            listener = AnonymousObserver(asend=lambda d, _: results.append(d), athrow=athrow)
+
+            async with FromIterable(source(), fuse=fuse) | Map(lambda x: x * 2) > listener:
+                await failed
+                await asyncio.sleep(0.01)
+
+                # Source errors are thrown, and don't close the observer, whether fused or not
+                self.assertFalse(listener.closed)
+
+            self.assertEqual(len(errors), 1)
+            self.assertIsInstance(errors[0], ValueError)
+
+            return results
+
+        self.assertEqual(await observe(False), [0, 2, 4])
+        self.assertEqual(await observe(True), [0, 2, 4])
+
+    async def test_pipeline(self):
+        template = pipeline(lambda: Map(lambda x: x * 2), lambda: Filter(lambda x: x % 3 == 0))
+
+        instances = template.many(FromIterable(range(x, x + 6)) for x in (0, 6))
+
+        self.assertEqual(await self.collect(instances[0]), [0, 6])
+        self.assertEqual(await self.collect(instances[1]), [12, 18])
+
+        results = []
+        done = self.loop.create_future()
+        listener = AnonymousObserver(
+            asend=lambda d, _: results.append(d), aclose=lambda: done.set_result(None)
+        )
+
+        async with template(FromIterable(range(3)), listener):
+            await done
+
+        self.assertEqual(results, [0])
+
+        with self.assertRaises(TypeError):
+            pipeline(object)(FromIterable(()))
+
+    async def test_source_exhaustion(self):
+        async def source():
+            for x in range(3):
+                yield x
+
+        for observable in (FromIterable(range(3)), FromAsyncIterable(source())):
+            # collect only returns once the listener is closed by the exhausted source
+            self.assertEqual(await self.collect(observable), [0, 1, 2])
+
+    async def test_source_exhaustion_keep_alive(self):
+        results = []
+
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d), keep_alive=True)
+
+        async with FromIterable(range(3)) > listener:
+            await asyncio.sleep(0.01)
+
+            self.assertEqual(results, [0, 1, 2])
+            self.assertFalse(listener.closed)
+
+        self.assertIsNone(self.exception_ctx)
+
+    async def test_concat(self):
+        observable = concat(
+            FromIterable(range(3)), FromIterable(range(3, 6)), FromIterable(range(6, 9))
+        )
+
+        self.assertEqual(await self.collect(observable), list(range(9)))
+
+    async def test_merge(self):
+        observable = merge(
+            FromIterable(range(3)), FromIterable(range(3, 6)), FromIterable(range(6, 9))
+        )
+
+        self.assertEqual(sorted(await self.collect(observable)), list(range(9)))
+
+    async def test_merge_max_concurrent(self):
+        observable = merge(
+            FromIterable(range(3)), FromIterable(range(3, 6)), max_concurrent=1, buffer_size=1
+        )
+
+        self.assertEqual(await self.collect(observable), list(range(6)))
+
+    async def test_merge_sorted(self):
+        observable = merge_sorted(
+            FromIterable(range(0, 30, 3)),
+            FromIterable(range(1, 30, 3)),
+            FromIterable(range(2, 30, 3)),
+            FromIterable([]),
+            buffer_size=1,
+        )
+
+        self.assertEqual(await self.collect(observable), list(range(30)))
+
+    async def test_join(self):
+        observable = join(
+            FromIterable([(1, "a"), (2, "b"), (3, "c")]),
+            FromIterable([(3, "C"), (1, "A"), (1, "Z")]),
+            lambda x: x[0],
+            lambda x: x[0],
+            window=1,
+            timestamp=lambda x: 0,
+        )
+
+        self.assertEqual(
+            sorted(await self.collect(observable)),
+            [((1, "a"), (1, "A")), ((1, "a"), (1, "Z")), ((3, "c"), (3, "C"))],
+        )
+
+        # Sources out of order relative to each other only match values within the window
+        observable = join(
+            FromIterable([{"id": 1, "t": 100.0}]),
+            FromIterable([{"id": 1, "t": 11.0}, {"id": 1, "t": 98.0}]),
+            lambda x: x["id"],
+            lambda x: x["id"],
+            window=5,
+            timestamp=lambda x: x["t"],
+        )
+
+        self.assertEqual(
+            await self.collect(observable), [({"id": 1, "t": 100.0}, {"id": 1, "t": 98.0})]
+        )
+
+    async def test_zip(self):
+        observable = zip_with(FromIterable(range(5)), FromIterable("abc"))
+
+        self.assertEqual(await self.collect(observable), [(0, "a"), (1, "b"), (2, "c")])
+
+    async def test_combine_latest(self):
+        observable = combine_latest(FromIterable([1]), FromIterable([2]))
+
+        self.assertEqual(await self.collect(observable), [(1, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 # Internal
+import asyncio
 import unittest
 
 # External
@@ -7,7 +8,44 @@ import asynctest
 from aRx.streams import MultiStream
 from aRx.namespace import Namespace
 from aRx.observers import AnonymousObserver
-from aRx.operators import Map, Assert, Filter
+from aRx.operators import (
+    Map,
+    Assert,
+    Filter,
+    Sample,
+    FlatMap,
+    GroupBy,
+    Reorder,
+    Conflate,
+    Debounce,
+    Distinct,
+    Throttle,
+    AuditTime,
+    ConcatMap,
+    Reservoir,
+    SwitchMap,
+    ParallelMap,
+    SampleByKey,
+    HeavyHitters,
+    ProcessStage,
+    CountMinSketch,
+    ApproxCountDistinct,
+    DistinctUntilChanged,
+    SlidingWindowAggregate,
+)
+from aRx.observables import FromIterable, FromAsyncIterable
+
+
+def parse(x):
+    if x == "13":
+        raise ValueError(x)
+
+    return int(x)
+
+
+def even_stage():
+    # Module level, so worker processes can be spawned with it
+    return Map(parse) | Filter(lambda x: x % 2 == 0)
 
 
 # noinspection PyAttributeOutsideInit
@@ -59,6 +97,114 @@ class TestOperators(asynctest.TestCase, unittest.TestCase):
         self.assertTrue(stream.closed)
         self.assertTrue(listener.closed)
 
+    async def test_stream_cached_map_observation(self):
+        calls = []
+        results = []
+
+        def mapper(x):
+            calls.append(x)
+            return str(x)
+
+        cached_map = Map(mapper, cache="lfu", cache_size=2)
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | cached_map > listener:
+            for x in (1, 1, 2, 1, 3, 1, 2):
+                await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, ["1", "1", "2", "1", "3", "1", "2"])
+        self.assertEqual(calls, [1, 2, 3, 2])
+        self.assertEqual(cached_map.cache_info[:2], (3, 4))
+
+    async def test_stream_cached_map_cancellation(self):
+        async def mapper(x):
+            await asyncio.sleep(1)
+            return x
+
+        cached_map = Map(mapper, cache="lru")
+
+        async with cached_map > AnonymousObserver():
+            owner = self.loop.create_task(cached_map.asend(1))
+            waiter = self.loop.create_task(cached_map.asend(1))
+            await asyncio.sleep(0.01)
+
+            owner.cancel()
+
+            # Calls sharing the cancelled computation must not hang
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncio.wait_for(waiter, 0.1)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(cached_map.cache_info[:2], (1, 1))
+
+    async def test_stream_parallel_map_observation(self):
+        results = []
+
+        async def mapper(x):
+            await asyncio.sleep(0.001 * (5 - x % 5))
+            return x
+
+        parallel_map = ParallelMap(mapper, key=lambda x: x % 3, workers=3)
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | parallel_map > listener:
+            for x in range(30):
+                await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(sorted(results), list(range(30)))
+        for key in range(3):
+            self.assertEqual([x for x in results if x % 3 == key], list(range(key, 30, 3)))
+
+    async def test_parallel_map_athrow_failure(self):
+        async def mapper(x):
+            await asyncio.sleep(0.01)
+            raise ValueError(x)
+
+        def athrow(exc, _):
+            raise RuntimeError(exc)
+
+        parallel_map = ParallelMap(mapper, workers=1, queue_size=1)
+
+        async with parallel_map > AnonymousObserver(athrow=athrow):
+            sends = [self.loop.create_task(parallel_map.asend(x)) for x in range(3)]
+
+            # A worker whose athrow failed must not leave its queue without a consumer
+            await asyncio.wait_for(asyncio.gather(*sends, return_exceptions=True), 1)
+
+        await asyncio.wait_for(parallel_map.aclose(), 1)
+
+        self.assertTrue(parallel_map.closed)
+        self.assertIsInstance(self.exception_ctx["exception"], RuntimeError)
+
+    async def test_stream_process_stage_observation(self):
+        errors = []
+        results = []
+
+        process_stage = ProcessStage(even_stage, key=lambda x: int(x) % 4, workers=2, capacity=256)
+        listener = AnonymousObserver(
+            asend=lambda d, _: results.append(d), athrow=lambda e, _: errors.append(e)
+        )
+
+        async with MultiStream() as stream, stream | process_stage > listener:
+            for x in range(30):
+                await stream.asend(str(x))
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(listener.closed)
+        self.assertEqual(sorted(results), list(range(0, 30, 2)))
+        for key in (0, 2):
+            # Values routed to the same worker keep their order
+            self.assertEqual([x for x in results if x % 4 == key], list(range(key, 30, 4)))
+
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+
     async def test_stream_assert_observation(self):
 
         exc = Exception("Test")
@@ -75,6 +221,376 @@ class TestOperators(asynctest.TestCase, unittest.TestCase):
         self.assertTrue(stream.closed)
         self.assertTrue(listener.closed)
 
+    async def test_stream_sliding_window_observation(self):
+        results = []
+
+        window = SlidingWindowAggregate(max, count=3)
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | window > listener:
+            for x in (1, 5, 2, 3, 1, 0):
+                await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [1, 5, 5, 5, 3, 3])
+
+    async def test_stream_sliding_window_duration_observation(self):
+        results = []
+
+        window = SlidingWindowAggregate(max, duration=0.05)
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | window > listener:
+            await stream.asend(3)
+            await stream.asend(5)
+            await asyncio.sleep(0.1)
+            await stream.asend(1)
+            await stream.asend(2)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [3, 5, 1, 2])
+
+    async def test_stream_reservoir_observation(self):
+        results = []
+
+        reservoir = Reservoir(5, seed=0)
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | reservoir > listener:
+            for x in range(1000):
+                await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(len(set(results[0])), 5)
+        self.assertTrue(all(0 <= x < 1000 for x in results[0]))
+
+    async def test_stream_sample_by_key_observation(self):
+        results = []
+
+        sample = SampleByKey(2, 3, lambda x: x % 4, seed=0)
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | sample > listener:
+            for x in range(100):
+                await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(set(results[0]), {0, 1, 2})
+        for key, values in results[0].items():
+            self.assertEqual(len(values), 2)
+            self.assertTrue(all(x % 4 == key for x in values))
+
+    async def test_stream_sketches_observation(self):
+        results = []
+
+        count = ApproxCountDistinct(10)
+        top = HeavyHitters(10)
+        frequency = CountMinSketch(256, 4)
+
+        for operator in (count, top, frequency):
+            listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+            async with MultiStream() as stream, stream | operator > listener:
+                for x in range(500):
+                    await stream.asend(x % 100 if x % 5 else 7)
+
+            self.assertIsNone(self.exception_ctx)
+            self.assertTrue(stream.closed)
+            self.assertTrue(listener.closed)
+
+        self.assertEqual(len(results), 3)
+
+        estimate, hitters, sketch = results
+        self.assertAlmostEqual(estimate, 80, delta=10)
+        self.assertEqual(hitters[0][0], 7)
+        self.assertGreaterEqual(hitters[0][1], 105)
+        self.assertGreaterEqual(sketch.estimate(7), 105)
+        self.assertEqual(sketch.total, 500)
+
+        other = ApproxCountDistinct(10)
+        other.merge(count)
+        self.assertEqual(other.sketch.estimate(), estimate)
+
+    async def test_stream_sketches_value_types(self):
+        count = ApproxCountDistinct(10)
+
+        async with MultiStream() as stream, stream | count > AnonymousObserver():
+            for x in (1, "1", b"1", 1.0):
+                await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(count.sketch.estimate(), 4)
+
+    async def test_stream_distinct_observation(self):
+        for backend in ("set", "lru", "bloom"):
+            results = []
+
+            distinct = Distinct(lambda x: x % 5, backend=backend, capacity=10)
+            listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+            async with MultiStream() as stream, stream | distinct > listener:
+                for x in range(20):
+                    await stream.asend(x)
+
+            self.assertIsNone(self.exception_ctx)
+            self.assertTrue(stream.closed)
+            self.assertTrue(listener.closed)
+            self.assertEqual(results, [0, 1, 2, 3, 4])
+
+    async def test_distinct_ttl_requires_lru(self):
+        for backend in ("set", "bloom"):
+            with self.assertRaises(ValueError):
+                Distinct(backend=backend, capacity=10, ttl=1)
+
+    async def test_distinct_capacity_required(self):
+        for backend in ("lru", "bloom"):
+            with self.assertRaises(ValueError):
+                Distinct(backend=backend)
+
+    async def test_stream_distinct_until_changed_observation(self):
+        results = []
+
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | DistinctUntilChanged() > listener:
+            for x in (1, 1, 2, 2, 2, 1, 3, 3):
+                await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [1, 2, 1, 3])
+
+    async def test_stream_group_by_observation(self):
+        results = {}
+
+        def on_group(group, _):
+            results[group.key] = []
+            return group > AnonymousObserver(asend=lambda d, __: results[group.key].append(d))
+
+        listener = AnonymousObserver(asend=on_group)
+
+        async with MultiStream() as stream, stream | GroupBy(lambda x: x % 2) > listener:
+            for x in range(6):
+                await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, {0: [0, 2, 4], 1: [1, 3, 5]})
+
+    async def test_stream_group_by_idle_eviction(self):
+        groups = []
+
+        async def on_group(group, _):
+            groups.append(group)
+            # Slow emission, so eviction happens while a group is still being emitted
+            await asyncio.sleep(0.05)
+
+        listener = AnonymousObserver(asend=on_group)
+        group_by = GroupBy(lambda x: x % 2, idle_timeout=0.02)
+
+        async with MultiStream() as stream, stream | group_by > listener:
+            await stream.asend(0)
+            await stream.asend(1)
+            await asyncio.sleep(0.1)
+
+            self.assertTrue(all(group.closed for group in groups))
+
+            await stream.asend(2)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual([group.key for group in groups], [0, 1, 0])
+
+    async def test_stream_debounce_observation(self):
+        results = []
+
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | Debounce(0.01) > listener:
+            for x in range(3):
+                await stream.asend(x)
+
+            await asyncio.sleep(0.05)
+            await stream.asend(3)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [2, 3])
+
+    async def test_unobserved_debounce_close(self):
+        debounce = Debounce(0.01)
+
+        await debounce.asend(0)
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(debounce.aclose(), 1)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(debounce.closed)
+
+    async def test_stream_sample_observation(self):
+        results = []
+
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | Sample(0.05) > listener:
+            for x in range(3):
+                await stream.asend(x)
+
+            await asyncio.sleep(0.07)
+            await stream.asend(3)
+            await stream.asend(4)
+            await asyncio.sleep(0.05)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [2, 4])
+
+    async def test_stream_audit_time_observation(self):
+        results = []
+
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | AuditTime(0.02) > listener:
+            for x in range(3):
+                await stream.asend(x)
+
+            await asyncio.sleep(0.05)
+            await stream.asend(3)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [2, 3])
+
+    async def test_stream_conflate_observation(self):
+        results = []
+
+        async def slow_append(data, _):
+            results.append(data)
+            await asyncio.sleep(0.01)
+
+        listener = AnonymousObserver(asend=slow_append)
+
+        async with MultiStream() as stream, stream | Conflate(lambda x: x[0]) > listener:
+            for x in (("a", 1), ("b", 1), ("a", 2), ("b", 2), ("a", 3)):
+                await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertLess(len(results), 5)
+        self.assertEqual(dict(results), {"a": 3, "b": 2})
+
+    async def test_unobserved_conflate_close(self):
+        conflate = Conflate()
+
+        await conflate.asend(1)
+        await asyncio.wait_for(conflate.aclose(), 1)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(conflate.closed)
+
+    async def test_stream_throttle_observation(self):
+        results = []
+
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | Throttle(1, trailing=True) > listener:
+            for x in range(5):
+                await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [0, 4])
+
+    async def test_stream_flat_map_observation(self):
+        for operator in (FlatMap, ConcatMap):
+            results = []
+
+            flat_map = operator(lambda x: FromIterable(range(x)))
+            listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+            async with MultiStream() as stream, stream | flat_map > listener:
+                for x in range(1, 4):
+                    await stream.asend(x)
+
+            self.assertIsNone(self.exception_ctx)
+            self.assertTrue(stream.closed)
+            self.assertTrue(listener.closed)
+            self.assertEqual(sorted(results), [0, 0, 0, 1, 1, 2])
+
+            if operator is ConcatMap:
+                self.assertEqual(results, [0, 0, 1, 0, 1, 2])
+
+    async def test_stream_switch_map_observation(self):
+        results = []
+        cancelled = []
+
+        async def source(x):
+            try:
+                for i in range(3):
+                    await asyncio.sleep(0.02)
+                    yield x * 10 + i
+            except asyncio.CancelledError:
+                cancelled.append(x)
+                raise
+
+        switch_map = SwitchMap(lambda x: FromAsyncIterable(source(x)))
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | switch_map > listener:
+            await stream.asend(1)
+            await asyncio.sleep(0.03)
+            await stream.asend(2)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(cancelled, [1])
+        self.assertEqual(results, [10, 20, 21, 22])
+
+    async def test_stream_reorder_observation(self):
+        results = []
+
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | Reorder(lambda x: x, 2) > listener:
+            for x in (1, 0, 3, 2, 5, 4, 1, 7, 6):
+                await stream.asend(x)
+
+            self.assertEqual(results, [0, 1, 2, 3, 4, 5])
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [0, 1, 2, 3, 4, 5, 6, 7])
+
+    async def test_unobserved_reorder_close(self):
+        reorder = Reorder(lambda x: x, 2)
+
+        await reorder.asend(1)
+        await reorder.asend(0)
+        await asyncio.wait_for(reorder.aclose(), 1)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(reorder.closed)
+
     async def test_stream_raise_observation(self):
         exc = Exception("Test")
 
@@ -0,0 +1,150 @@
+# Internal
+import asyncio
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+# External
+import asynctest
+
+from aRx.codecs import SEND, JSONCodec, PickleCodec, write_frame
+from aRx.errors import RemoteError
+from aRx.observers import RemoteObserver, AnonymousObserver
+from aRx.observables import RemoteObservable
+
+
+# noinspection PyAttributeOutsideInit
+@asynctest.strict
+class TestRemote(asynctest.TestCase, unittest.TestCase):
+    async def setUp(self):
+        self.exception_ctx = None
+        self.loop.set_exception_handler(lambda l, c: setattr(self, "exception_ctx", c))
+
+        self.tmp = TemporaryDirectory()
+        path = str(Path(self.tmp.name) / "socket")
+
+        accepted = self.loop.create_future()
+        self.server = await asyncio.start_unix_server(
+            lambda reader, writer: accepted.set_result((reader, writer)), path
+        )
+        self.local = await asyncio.open_unix_connection(path)
+        self.remote = await accepted
+
+    async def tearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.tmp.cleanup()
+
+    async def test_remote(self):
+        errors = []
+        results = []
+        closed = self.loop.create_future()
+
+        listener = AnonymousObserver(
+            asend=lambda x, _: results.append(x),
+            athrow=lambda e, _: errors.append(e),
+            aclose=lambda: closed.set_result(None),
+        )
+        observer = RemoteObserver(*self.local, codec=PickleCodec(), batch_size=16)
+
+        await (RemoteObservable(*self.remote, codec=PickleCodec()) > listener)
+
+        for x in range(1000):
+            await observer.asend({"value": x})
+
+        exc = KeyError("Test")
+        await observer.athrow(exc)
+        await observer.aclose()
+
+        await asyncio.wait_for(closed, 1)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, [{"value": x} for x in range(1000)])
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], KeyError)
+        self.assertEqual(errors[0].args, exc.args)
+
+    async def test_remote_flow_control(self):
+        sent = 0
+        errors = []
+        results = []
+        closed = self.loop.create_future()
+
+        async def slow_asend(value, _):
+            await asyncio.sleep(0.001)
+            # The remote observer can't get further ahead than the window
+            self.assertLessEqual(sent - len(results), 4)
+            results.append(value)
+
+        listener = AnonymousObserver(
+            asend=slow_asend,
+            athrow=lambda e, _: errors.append(e),
+            aclose=lambda: closed.set_result(None),
+        )
+        # Long flush interval, so only full batches, or waiting for credits, flush data
+        observer = RemoteObserver(*self.local, codec=JSONCodec(), batch_size=3, flush_interval=10)
+
+        await (RemoteObservable(*self.remote, codec=JSONCodec(), window=4) > listener)
+
+        for x in range(50):
+            await observer.asend(x)
+            sent += 1
+
+        await observer.athrow(ValueError("Test"))
+        await observer.aclose()
+
+        await asyncio.wait_for(closed, 1)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, list(range(50)))
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], RemoteError)
+        self.assertEqual(errors[0].type_name, "builtins.ValueError")
+        self.assertEqual(errors[0].message, "Test")
+
+    async def test_remote_half_close(self):
+        results = []
+        closed = self.loop.create_future()
+
+        listener = AnonymousObserver(
+            asend=lambda x, _: results.append(x), aclose=lambda: closed.set_result(None)
+        )
+        await (RemoteObservable(*self.remote, window=8) > listener)
+
+        # Peer that stops sending without closing, nor reading credits
+        codec = PickleCodec()
+        _, writer = self.local
+        for x in range(0, 100, 4):
+            write_frame(writer, codec, [[SEND, y] for y in range(x, x + 4)])
+        writer.write_eof()
+
+        await asyncio.wait_for(closed, 1)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, list(range(100)))
+
+    async def test_remote_disconnect(self):
+        closed = self.loop.create_future()
+        observer = RemoteObserver(*self.local)
+
+        listener = AnonymousObserver(aclose=lambda: closed.set_result(None))
+        await (RemoteObservable(*self.remote) > listener)
+
+        await observer.asend(1)
+
+        # Connection loss closes the observer of the remote observable, and the remote observer
+        self.remote[1].close()
+        await asyncio.wait_for(closed, 1)
+
+        for _ in range(100):
+            if observer.closed:
+                break
+
+            await asyncio.sleep(0.01)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(observer.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
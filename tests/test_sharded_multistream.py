@@ -0,0 +1,93 @@
+# Internal
+import unittest
+import threading
+
+# External
+import asynctest
+
+from aRx.streams import ShardedMultiStream
+from aRx.observers import AnonymousObserver
+from aRx.operations import observe
+
+
+# noinspection PyAttributeOutsideInit
+@asynctest.strict
+class TestShardedMultiStream(asynctest.TestCase, unittest.TestCase):
+    async def setUp(self):
+        self.exception_ctx = None
+        self.loop.set_exception_handler(lambda l, c: setattr(self, "exception_ctx", c))
+
+    async def test_shards(self):
+        errors = []
+        results = []
+        main_thread = threading.get_ident()
+        shard_results = [[] for _ in range(4)]
+
+        stream = ShardedMultiStream(4, key=lambda x: x % 8, maxsize=8)
+        listener = AnonymousObserver(
+            asend=lambda x, _: results.append((threading.get_ident(), x)),
+            athrow=lambda e, _: errors.append(e),
+        )
+
+        await (stream > listener)
+
+        shard_listeners = []
+        for index, shard_result in enumerate(shard_results):
+            shard_listener = AnonymousObserver(
+                asend=lambda x, _, r=shard_result: r.append((threading.get_ident(), x)),
+                athrow=lambda _, __: False,
+            )
+            shard_listeners.append(shard_listener)
+            await observe(stream.shard(index), shard_listener)
+
+        for x in range(1000):
+            await stream.asend(x)
+
+        await stream.athrow(ValueError("Test"))
+        await stream.aclose()
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(listener.closed)
+        self.assertTrue(all(shard_listener.closed for shard_listener in shard_listeners))
+
+        # Observers of all shards receive everything in the loop they were observed from
+        self.assertEqual(sorted(x for _, x in results), list(range(1000)))
+        self.assertEqual({thread for thread, _ in results}, {main_thread})
+        self.assertEqual(len(errors), 1)
+
+        shard_threads = set()
+        for shard_result in shard_results:
+            threads = {thread for thread, _ in shard_result}
+
+            # Each shard runs in its own thread, and receives every value of its keys, in order
+            self.assertEqual(len(threads), 1)
+            self.assertNotIn(main_thread, threads)
+            self.assertEqual(len({x % 8 for _, x in shard_result}), 2)
+            self.assertEqual([x for _, x in shard_result], sorted(x for _, x in shard_result))
+            shard_threads |= threads
+
+        self.assertEqual(len(shard_threads), 4)
+        self.assertEqual(sum(len(shard_result) for shard_result in shard_results), 1000)
+
+        # Closing the stream stops all shard threads
+        self.assertFalse(any(t.name.startswith("aRx-shard") for t in threading.enumerate()))
+
+    async def test_keep_alive(self):
+        results = []
+        stream = ShardedMultiStream(2)
+        listener = AnonymousObserver(asend=lambda x, _: results.append(x), keep_alive=True)
+
+        await (stream > listener)
+
+        for x in range(100):
+            await stream.asend(x)
+
+        await stream.aclose()
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertFalse(listener.closed)
+        self.assertEqual(sorted(results), list(range(100)))
+
+
+if __name__ == "__main__":
+    unittest.main()
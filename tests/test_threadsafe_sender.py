@@ -0,0 +1,93 @@
+# Internal
+import asyncio
+import unittest
+import threading
+
+# External
+import asynctest
+
+from aRx.errors import ObserverClosedError
+from aRx.streams import MultiStream, ThreadSafeSender
+from aRx.observers import AnonymousObserver
+
+
+# noinspection PyAttributeOutsideInit
+@asynctest.strict
+class TestThreadSafeSender(asynctest.TestCase, unittest.TestCase):
+    async def setUp(self):
+        self.exception_ctx = None
+        self.loop.set_exception_handler(lambda l, c: setattr(self, "exception_ctx", c))
+
+    async def test_send_from_threads(self):
+        results = []
+        stream = MultiStream()
+        listener = AnonymousObserver(asend=lambda x, _: results.append(x))
+
+        await (stream > listener)
+
+        sender = ThreadSafeSender(stream, maxsize=16)
+
+        def produce(start):
+            for x in range(start, start + 500):
+                sender.send(x)
+
+        threads = [threading.Thread(target=produce, args=(i * 500,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+
+        await self.loop.run_in_executor(None, lambda: [thread.join() for thread in threads])
+        await sender.aclose()
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(sorted(results), list(range(2000)))
+        for i in range(4):
+            # Values from the same thread keep their order
+            values = [x for x in results if i * 500 <= x < (i + 1) * 500]
+            self.assertEqual(values, list(range(i * 500, (i + 1) * 500)))
+
+        with self.assertRaises(ObserverClosedError):
+            sender.send(0)
+
+    async def test_send_drop(self):
+        results = []
+        sender = ThreadSafeSender(
+            AnonymousObserver(asend=lambda x, _: results.append(x)), maxsize=4, overflow="drop"
+        )
+
+        def produce():
+            for x in range(10):
+                sender.send(x)
+
+        # Loop doesn't run while the thread is joined, so only maxsize values fit
+        thread = threading.Thread(target=produce)
+        thread.start()
+        thread.join()
+
+        await sender.aclose()
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, [0, 1, 2, 3])
+        self.assertEqual(sender.dropped, 6)
+
+    async def test_send_block_timeout(self):
+        sender = ThreadSafeSender(AnonymousObserver(), maxsize=1)
+
+        def produce():
+            return sender.send(0), sender.send(1, timeout=0.01)
+
+        thread_results = []
+        thread = threading.Thread(target=lambda: thread_results.extend(produce()))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(thread_results, [True, False])
+
+        await sender.aclose()
+
+        self.assertIsNone(self.exception_ctx)
+
+
+if __name__ == "__main__":
+    unittest.main()